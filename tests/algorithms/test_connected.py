@@ -80,3 +80,19 @@ def test_largest_connected_hypergraph(edgelist1, edgelist2):
     xgi.largest_connected_hypergraph(H2, in_place=True)
     assert xgi.is_connected(H2)
     assert sorted(H2.nodes) == [3, 4, 5, 6]
+
+
+def test_connected_components_order():
+    H = xgi.Hypergraph()
+    H.add_nodes_from([9, 0, 5])
+    H.add_edges_from([[1, 2], [5, 1], [0, 7], []])
+
+    # components are listed in the order of their first node
+    assert list(xgi.connected_components(H)) == [{9}, {0, 7}, {5, 1, 2}]
+    assert xgi.number_connected_components(H) == 3
+    assert xgi.node_connected_component(H, 2) == {1, 2, 5}
+    assert xgi.number_connected_components(xgi.Hypergraph()) == 0
+
+    # compact hypergraphs
+    C = H.compact()
+    assert list(xgi.connected_components(C)) == [{9}, {0, 7}, {5, 1, 2}]
@@ -1,6 +1,8 @@
 import numpy as np
+import pytest
 
 import xgi
+from xgi.exception import IDNotFound, XGIError
 
 
 def test_single_source_shortest_path_length(edgelist1):
@@ -28,3 +30,58 @@ def test_shortest_path_length(edgelist1):
             assert dists[1] == np.inf
             assert dists[4] == 0
     return
+
+
+def test_shortest_path_length_bfs():
+    H = xgi.Hypergraph([[0, 1], [1, 2, 3], [3, 4], [5, 6], []])
+    H.add_node(7)
+
+    dists = xgi.single_source_shortest_path_length(H, 0)
+    assert dists == {0: 0, 1: 1, 2: 2, 3: 2, 4: 3, 5: np.inf, 6: np.inf, 7: np.inf}
+    assert list(dists) == list(H.nodes)
+
+    all_dists = dict(xgi.shortest_path_length(H))
+    assert list(all_dists) == list(H.nodes)
+    for source, d in all_dists.items():
+        assert d == xgi.single_source_shortest_path_length(H, source)
+        for target, dist in d.items():
+            assert all_dists[target][source] == dist
+
+    with pytest.raises(IDNotFound):
+        xgi.single_source_shortest_path_length(H, 10)
+
+
+def test_shortest_path_length_cutoff(edgelist1):
+    H = xgi.Hypergraph([[0, 1], [1, 2, 3], [3, 4]])
+    dists = xgi.single_source_shortest_path_length(H, 0, cutoff=2)
+    assert dists == {0: 0, 1: 1, 2: 2, 3: 2, 4: np.inf}
+    for source, d in xgi.shortest_path_length(H, cutoff=1):
+        assert d == xgi.single_source_shortest_path_length(H, source, cutoff=1)
+
+
+def test_shortest_path_length_parallel(edgelist1, edgelist8):
+    for H in [xgi.Hypergraph(edgelist1), xgi.Hypergraph(edgelist8)]:
+        expected = list(xgi.shortest_path_length(H))
+        assert list(xgi.shortest_path_length(H, n_jobs=2, batch_size=2)) == expected
+        assert list(xgi.shortest_path_length(H, n_jobs=2, cutoff=1)) == list(
+            xgi.shortest_path_length(H, cutoff=1)
+        )
+
+    with pytest.raises(XGIError):
+        list(xgi.shortest_path_length(H, n_jobs=0))
+
+
+def test_distance_matrix(edgelist1):
+    H = xgi.Hypergraph(edgelist1)
+    D, rowdict = xgi.distance_matrix(H, index=True)
+    assert D.dtype == np.int16
+    assert rowdict == dict(enumerate(H.nodes))
+    for i, (source, dists) in enumerate(xgi.shortest_path_length(H)):
+        assert rowdict[i] == source
+        expected = [-1 if d == np.inf else d for d in dists.values()]
+        assert D[i].tolist() == expected
+    assert np.array_equal(D, D.T)
+
+    assert np.array_equal(xgi.distance_matrix(H, n_jobs=2, batch_size=3), D)
+    assert np.array_equal(xgi.distance_matrix(H, cutoff=1), np.where(D > 1, -1, D))
+    assert xgi.distance_matrix(xgi.Hypergraph()).shape == (0, 0)
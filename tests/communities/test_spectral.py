@@ -46,6 +46,30 @@ class TestKMeans:
             set(c2) == {0, 1, 2, 3, 4} and set(c1) == {5, 6, 7, 8, 9}
         )
 
+    def test_restarts_and_minibatch(self):
+        rng = np.random.default_rng(0)
+        centers = np.array([[0, 0], [10, 0], [0, 10], [10, 10]])
+        X = np.repeat(centers, 50, axis=0) + rng.random((200, 2))
+        truth = np.repeat(np.arange(4), 50)
+
+        for kwargs in [{"n_init": 5}, {"batch_size": 32, "max_iter": 200}]:
+            clusters = xgi.communities.spectral._kmeans(X, 4, seed=1, **kwargs)
+            labels = np.array([clusters[i] for i in range(200)])
+            # the same partition, up to relabeling
+            assert len(set(zip(truth.tolist(), labels.tolist()))) == 4
+
+        # the same seed gives the same clusters
+        assert xgi.communities.spectral._kmeans(
+            X, 3, seed=2
+        ) == xgi.communities.spectral._kmeans(X, 3, seed=2)
+
+    def test_more_clusters_than_distinct_vectors(self):
+        X = np.zeros((6, 2))
+        X[3:] = 1
+        clusters = xgi.communities.spectral._kmeans(X, 3, seed=0)
+        assert set(clusters.values()) <= {0, 1, 2}
+        assert clusters[0] == clusters[1] == clusters[2]
+
 
 class TestSpectralClustering:
     def test_errors_num_clusters(self):
@@ -54,6 +78,34 @@ class TestSpectralClustering:
         with pytest.raises(XGIError):
             xgi.spectral_clustering(H, 6)
 
+    def test_errors_isolates(self):
+        H = xgi.Hypergraph([[1, 2], [2, 3]])
+        H.add_node(4)
+
+        with pytest.raises(XGIError):
+            xgi.spectral_clustering(H, 2)
+
+    def test_sparse_eigensolver(self):
+        # four groups of 250 nodes, joined by a few edges
+        edges = [
+            [i, i + 1, i + 2] for g in range(4) for i in range(g * 250, g * 250 + 248)
+        ]
+        edges += [
+            [i, i + 50, i + 100]
+            for g in range(4)
+            for i in range(g * 250, g * 250 + 150)
+        ]
+        edges += [[0, 250], [500, 750], [100, 600]]
+        H = xgi.Hypergraph(edges)
+
+        clusters = xgi.spectral_clustering(H, 4, seed=1)
+        assert clusters == xgi.spectral_clustering(H, 4, seed=1)
+        for g in range(4):
+            assert {clusters[i] for i in range(g * 250, (g + 1) * 250)} == {
+                clusters[g * 250]
+            }
+        assert len({clusters[g * 250] for g in range(4)}) == 4
+
     @pytest.mark.skip("Inconsistent seeding across macOS 3.11 - 3.13")
     def test_perfectly_separable_low_dimensions(self):
         H = xgi.Hypergraph(
@@ -6,6 +6,14 @@ import pytest
 import xgi
 
 
+@pytest.fixture(autouse=True)
+def dataset_cache(tmp_path, monkeypatch):
+    # the tests don't use the on-disk dataset cache of the user
+    cache = xgi.DatasetCache(tmp_path / "xgi-cache")
+    monkeypatch.setattr(xgi.utils.datacache, "_default_cache", cache)
+    return cache
+
+
 @pytest.fixture
 def edgelist1():
     return [{1, 2, 3}, {4}, {5, 6}, {6, 7, 8}]
@@ -73,3 +73,40 @@ def test_to_encapsulation_dag(edgelist1, edgelist8, hypergraph1, hypergraph2):
 
     assert L.number_of_nodes() == 0
     assert L.number_of_edges() == 0
+
+
+def test_empirical_visit_order():
+    # the filter visits the hyperedges in the order in which the unfiltered DAG
+    # discovers them, not in the order of the hypergraph
+    edges = [
+        [0, 2, 3, 5, 6],
+        [1, 2, 3, 4, 6],
+        [1, 5, 6],
+        [0, 1, 4, 5, 6],
+        [1, 2, 3, 4, 6],
+        [1, 4],
+        [3],
+        [1, 2, 4, 5],
+        [0, 1, 2, 3, 4, 5],
+    ]
+    H = xgi.Hypergraph(edges)
+    dag = xgi.to_encapsulation_dag(H, subset_types="empirical")
+    assert set(dag.edges) == {(0, 6), (3, 2), (4, 6), (7, 5), (8, 7)}
+
+
+def test_sparse_encapsulation_dag(edgelist8):
+    H = xgi.Hypergraph(edgelist8)
+    for subset_types in ["all", "immediate", "empirical"]:
+        L = xgi.to_encapsulation_dag(H, subset_types=subset_types)
+        A, coldict = xgi.to_encapsulation_dag(
+            H, subset_types=subset_types, sparse=True, index=True
+        )
+        assert coldict == dict(enumerate(H.edges))
+        assert {(coldict[i], coldict[j]) for i, j in zip(*A.nonzero())} == set(L.edges)
+
+    # the subsets of large hyperedges are found from the overlaps
+    H = xgi.Hypergraph([list(range(30)), [0, 1], [2, 3, 4], [2, 3, 4], [0, 30]])
+    L = xgi.to_encapsulation_dag(H)
+    assert set(L.edges) == {(0, 1), (0, 2), (0, 3)}
+    L = xgi.to_encapsulation_dag(H, subset_types="immediate")
+    assert len(L.edges) == 0
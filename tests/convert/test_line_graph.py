@@ -1,3 +1,4 @@
+import networkx as nx
 from networkx import Graph
 
 import xgi
@@ -138,3 +139,21 @@ def test_normed_weighted_line_graph(edgelist1, hypergraph1, edgelist2, hypergrap
     assert L.edges[("e2", "e3")]["weight"] == 1.0
     assert L.edges[("e1", "e3")]["weight"] == 1.0
     assert sum([dat["weight"] for _, _, dat in L.edges(data=True)]) == 2.5
+
+
+def test_sparse_line_graph(hypergraph2):
+    L = xgi.to_line_graph(hypergraph2, weights="absolute")
+    A, coldict = xgi.to_line_graph(
+        hypergraph2, weights="absolute", sparse=True, index=True
+    )
+    assert coldict == {0: "e1", 1: "e2", 2: "e3"}
+    assert A.toarray().tolist() == [[0, 1, 2], [1, 0, 2], [2, 2, 0]]
+    assert (A.toarray() == nx.to_numpy_array(L, nodelist=["e1", "e2", "e3"])).all()
+
+    A = xgi.to_line_graph(hypergraph2, s=2, sparse=True)
+    assert A.toarray().tolist() == [[0, 0, 1], [0, 0, 1], [1, 1, 0]]
+
+    # disjoint hyperedges are linked when s is 0
+    H = xgi.Hypergraph([[1, 2], [3, 4]])
+    L = xgi.to_line_graph(H, s=0, weights="absolute")
+    assert L.edges[(0, 1)]["weight"] == 0
@@ -290,6 +290,14 @@ def test_add_edges_from_iterable_of_members():
     H.add_edges_from(edges)
     assert H.edges.dimembers() == [(set(e[0]), set(e[1])) for e in edges]
 
+    # the automatic uid is taken by an edge added without updating the counter
+    H = xgi.DiHypergraph()
+    H.add_node_to_edge(0, "a", "in")
+    with pytest.warns(UserWarning, match="uid 0 already exists"):
+        H.add_edges_from([([1], [2]), ([3], [4])])
+    assert H.edges.dimembers(dtype=dict) == {0: ({"a"}, set()), 1: ({3}, {4})}
+    assert H.nodes.memberships() == {"a": {0}, 3: {1}, 4: {1}}
+
 
 def test_add_edges_from_format2():
     edges = [(({0, 1}, {2}), 0), (({1, 2}, {4}), 1), (({2, 3, 4}, {1}), 2)]
@@ -387,6 +395,34 @@ def test_add_edges_from_attr_precedence():
     assert H.edges["three"] == {"age": 40, "color": "blue"}
 
 
+def test_add_edge_dedupe(diedgelist1):
+    H = xgi.DiHypergraph(diedgelist1)
+    assert list(H.edges.lookup(([3, 2, 1], [4]))) == [0]
+    assert list(H.edges.lookup(([4], [1, 2, 3]))) == []
+
+    H.add_edge(([1, 2, 3], [4]), dedupe=True, color="red")
+    H.add_edge(([4], [1, 2, 3]), dedupe=True)
+    assert H.num_edges == 3
+    assert H.edges[0] == {"color": "red"}
+
+    with pytest.raises(XGIError):
+        H.add_edge(([6, 5], [8, 7, 6]), dedupe="raise")
+
+    H.add_edges_from([([1], [2]), ([1], [2]), ([2], [1])], dedupe=True)
+    assert H.num_edges == 5
+    assert list(H.edges.duplicates()) == []
+
+    # the index is maintained by the methods that modify the edges
+    index = H._edge_fingerprints()
+    H.add_edge(([1], [2]))
+    H.add_node_to_edge(1, 5, "in")
+    H.remove_node_from_edge(2, 4, "in")
+    assert H._edge_fingerprints() is index
+    assert list(H.edges.duplicates()) == [5]
+    assert list(H.edges.lookup(([5, 6], [6, 7, 8]))) == [1]
+    assert list(H.edges.lookup((set(), [1, 2, 3]))) == [2]
+
+
 def test_remove_edge(diedgelist1):
     H = xgi.DiHypergraph(diedgelist1)
     H.remove_edge(0)
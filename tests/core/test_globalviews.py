@@ -1,7 +1,7 @@
 import pytest
 
 import xgi
-from xgi.exception import XGIError
+from xgi.exception import IDNotFound, XGIError
 
 
 def test_subhypergraph(edgelist1):
@@ -75,3 +75,106 @@ def test_subhypergraph(edgelist1):
     assert set(new_H.nodes) == {5, 6}
     assert set(new_H.edges) == {2}
     assert set(new_H.nodes.isolates(ignore_singletons=False)) == set()
+
+
+def test_subhypergraph_view(edgelist1):
+    H = xgi.Hypergraph(edgelist1)
+    H.set_node_attributes({1: {"color": "red"}, 6: {"color": "blue"}})
+    H.set_edge_attributes({2: {"weight": 2}})
+    H["name"] = "test"
+
+    for view in [False, True]:
+        S = xgi.subhypergraph(H, nodes={8, 7, 6, 5, 4}, view=view)
+
+        # the IDs keep their order in H
+        assert list(S.nodes) == [4, 5, 6, 8, 7]
+        assert list(S.edges) == [1, 2, 3]
+        assert S.edges.members() == [{4}, {5, 6}, {6, 7, 8}]
+        assert S.nodes.memberships() == {4: {1}, 5: {2}, 6: {2, 3}, 8: {3}, 7: {3}}
+        assert S.nodes.degree.asdict() == {4: 1, 5: 1, 6: 2, 8: 1, 7: 1}
+        assert S.edges.attrs("weight").asdict() == {1: None, 2: 2, 3: None}
+        assert S.nodes[6] == {"color": "blue"}
+        assert S["name"] == "test"
+        assert 1 not in S
+        with pytest.raises(IDNotFound):
+            S.nodes.memberships(1)
+        with pytest.raises(IDNotFound):
+            S.edges.members(0)
+
+        # the memberships are restricted to the edges of the view
+        S = xgi.subhypergraph(H, nodes=[5, 6, 7], keep_isolates=False, view=view)
+        assert list(S.nodes) == [5, 6]
+        assert S.nodes.memberships(6) == {2}
+        assert S.nodes.neighbors(6) == {5}
+
+        # the view can be copied to a mutable hypergraph
+        C = S.copy()
+        assert not C.is_frozen
+        C.add_edge([5, 7])
+        C.nodes[5]["color"] = "green"
+        assert S.edges.members() == [{5, 6}]
+        assert "color" not in H.nodes[5]
+
+        # view of a view and of a compact hypergraph
+        S = xgi.subhypergraph(
+            xgi.subhypergraph(H, edges=[0, 2, 3], view=view), nodes=[1, 2, 3, 4]
+        )
+        assert S.edges.members(dtype=dict) == {0: {1, 2, 3}}
+        assert S.nodes.degree.asdict() == {1: 1, 2: 1, 3: 1, 4: 0}
+        S = xgi.subhypergraph(H.compact(), nodes=[5, 6], view=view)
+        assert S.edges.members(dtype=dict) == {2: {5, 6}}
+
+
+def test_subhypergraph_modified(edgelist1):
+    H = xgi.Hypergraph(edgelist1)
+    H.set_node_attributes({4: {"color": "red"}})
+    S = xgi.subhypergraph(H, nodes=[3, 4, 5, 6])
+    V = xgi.subhypergraph(H, nodes=[3, 4, 5, 6], view=True)
+    assert (
+        S.nodes.degree.asdict() == V.nodes.degree.asdict() == {3: 0, 4: 1, 5: 1, 6: 1}
+    )
+    assert (
+        xgi.adjacency_matrix(V).toarray() == xgi.adjacency_matrix(S).toarray()
+    ).all()
+
+    H.remove_node(4)
+    H.nodes[5]["color"] = "blue"
+
+    # the copy does not change with H
+    assert list(S.nodes) == [3, 4, 5, 6]
+    assert S.edges.members() == [{4}, {5, 6}]
+    assert S.nodes.degree.asdict() == {3: 0, 4: 1, 5: 1, 6: 1}
+    assert S.nodes[4] == {"color": "red"}
+    assert S.nodes[5] == {}
+
+    # the view raises an error instead of returning stale values
+    for access in [
+        lambda: list(V.nodes),
+        lambda: V.num_edges,
+        lambda: V.edges.members(),
+        lambda: V.nodes.degree.asdict(),
+        lambda: xgi.adjacency_matrix(V),
+        lambda: 3 in V,
+    ]:
+        with pytest.raises(XGIError):
+            access()
+
+    V = xgi.subhypergraph(H, nodes=[3, 4, 5, 6], view=True)
+    assert V.nodes.degree.asdict() == {3: 0, 5: 1, 6: 1}
+    assert V.nodes[5] == {"color": "blue"}
+
+
+def test_subhypergraph_stats(edgelist8):
+    H = xgi.Hypergraph(edgelist8)
+    nodes = H.nodes.neighbors(4) | {4}
+    S = xgi.subhypergraph(H, nodes=nodes)
+    T = S.copy()
+
+    assert S.nodes.degree.asdict() == T.nodes.degree.asdict()
+    assert S.edges.size.asdict() == T.edges.size.asdict()
+    assert S.nodes.clustering_coefficient.asdict() == (
+        T.nodes.clustering_coefficient.asdict()
+    )
+    assert (
+        xgi.adjacency_matrix(S).toarray() == xgi.adjacency_matrix(T).toarray()
+    ).all()
@@ -317,6 +317,14 @@ def test_add_edges_from_iterable_of_members():
     assert set(H.nodes) == {"a", "b", "c", "d", "e"}
     assert H.edges.members() == edges
 
+    # the automatic uid is taken by an edge added without updating the counter
+    H = xgi.Hypergraph()
+    H.add_node_to_edge(0, "a")
+    with pytest.warns(UserWarning, match="uid 0 already exists"):
+        H.add_edges_from([[1, 2], [3, 4]])
+    assert H.edges.members(dtype=dict) == {0: {"a"}, 1: {3, 4}}
+    assert H.nodes.memberships() == {"a": {0}, 3: {1}, 4: {1}}
+
 
 def test_add_edges_from_format2():
     edges = [({0, 1}, 0), ({1, 2}, 1), ({2, 3, 4}, 2)]
@@ -608,6 +616,65 @@ def test_duplicate_edges(edgelist1):
     assert set(H.edges.duplicates()) == {1}
 
 
+def test_edge_index(edgelist1):
+    H = xgi.Hypergraph(edgelist1)
+    assert list(H.edges.lookup([3, 2, 1])) == [0]
+    index = H._edge_fingerprints()
+
+    # the index is maintained by the methods that modify the edges
+    H.add_edge([1, 2, 3])
+    H.add_edges_from({10: [4], 11: [5, 6]})
+    H.add_node_to_edge(3, 5)
+    H.remove_node_from_edge(3, 8)
+    H.remove_edge(2)
+    H.remove_node(7)
+    H.set_edge_attributes(1, name="weight")
+    assert H._edge_fingerprints() is index
+    assert set(H.edges.duplicates()) == {4, 10, 11}
+    assert list(H.edges.lookup([1, 2, 3])) == [0, 4]
+    assert list(H.edges.lookup([5, 6])) == [3, 11]
+    assert list(H.edges.lookup([7, 8])) == []
+
+    H.merge_duplicate_edges()
+    assert H._edge_fingerprints() is index
+    assert list(H.edges.duplicates()) == []
+    assert list(H.edges.lookup([1, 2, 3])) == [0]
+
+    # other modifications rebuild the index
+    H.clear_edges()
+    assert list(H.edges.lookup([1, 2, 3])) == []
+
+
+def test_add_edge_dedupe(edgelist1):
+    H = xgi.Hypergraph(edgelist1)
+    H.add_edge([3, 2, 1], dedupe=True, color="red")
+    assert H.num_edges == 4
+    assert H.edges[0] == {"color": "red"}
+
+    H.add_edge([1, 2], dedupe="merge")
+    assert H.num_edges == 5
+
+    with pytest.raises(XGIError):
+        H.add_edge([2, 1], dedupe="raise")
+    assert H.num_edges == 5
+
+    with pytest.raises(XGIError):
+        H.add_edge([1, 2], dedupe="skip")
+
+    # duplicates within the added edges are detected too
+    H = xgi.Hypergraph()
+    H.add_edges_from([[0, 1], [1, 2], [1, 0], [2, 1]], dedupe=True, weight=1)
+    assert H.edges.members(dtype=dict) == {0: {0, 1}, 1: {1, 2}}
+    assert H.edges.attrs("weight").asdict() == {0: 1, 1: 1}
+
+    H.add_edges_from([([0, 1], {"weight": 2}), ([2, 3], {"weight": 3})], dedupe=True)
+    assert H.edges.members(dtype=dict) == {0: {0, 1}, 1: {1, 2}, 2: {2, 3}}
+    assert H.edges.attrs("weight").asdict() == {0: 2, 1: 1, 2: 3}
+
+    with pytest.raises(XGIError):
+        H.add_edges_from({"a": [3, 4], "b": [4, 3]}, dedupe="raise")
+
+
 def test_duplicate_nodes(edgelist1):
     H = xgi.Hypergraph(edgelist1)
     assert set(H.nodes.duplicates()) == {2, 3, 8}
@@ -970,3 +1037,70 @@ def test_cleanup():
     assert cleanH["name"] == "test"
 
     assert cleanH._edge == xgi.dual_dict(cleanH._node)
+
+
+def test_compact(edgelist1, hyperwithattrs):
+    H = xgi.Hypergraph(edgelist1)
+    H.add_node(10)
+    C = H.compact()
+
+    assert C.is_compact
+    assert not H.is_compact
+    assert C.is_frozen
+    assert list(C.nodes) == list(H.nodes)
+    assert list(C.edges) == list(H.edges)
+    assert C.edges.members() == H.edges.members()
+    assert C.nodes.memberships() == H.nodes.memberships()
+    assert C.nodes.degree.asdict() == H.nodes.degree.asdict()
+    assert C.edges.size.asdict() == H.edges.size.asdict()
+    assert C.nodes.neighbors(6) == {5, 7, 8}
+    assert C == H
+
+    with pytest.raises(IDNotFound):
+        C._edge["missing"]
+    with pytest.raises(XGIError):
+        C.add_edge([1, 2])
+    with pytest.raises(XGIError):
+        C._node[1] = set()
+
+    # attributes are copied
+    C = hyperwithattrs.compact()
+    assert (
+        C.nodes.attrs("color").asdict() == hyperwithattrs.nodes.attrs("color").asdict()
+    )
+    C.set_node_attributes({1: "green"}, name="color")
+    assert hyperwithattrs.nodes[1]["color"] != "green"
+
+    # copies are mutable and dict-backed
+    D = H.compact().copy()
+    assert not D.is_compact
+    D.add_edge([1, 10])
+    assert D.num_edges == H.num_edges + 1
+
+    # pickling
+    with tempfile.TemporaryFile() as file:
+        pickle.dump(H.compact(), file)
+        file.seek(0)
+        C = pickle.load(file)
+    assert C.edges.members() == H.edges.members()
+
+
+def test_from_incidence(edgelist1):
+    H = xgi.Hypergraph(edgelist1)
+    H.add_node(10)
+    incidence = xgi.csr_incidence(H)
+    node_attr = xgi.utils.IDDict((n, xgi.utils.IDDict()) for n in H.nodes)
+    edge_attr = xgi.utils.IDDict((e, xgi.utils.IDDict()) for e in H.edges)
+
+    D = xgi.Hypergraph._from_incidence(
+        incidence, node_attr, edge_attr, {}, H._edge_uid, compact=False
+    )
+    assert not D.is_compact
+    assert not D.is_frozen
+    assert D == H
+    assert list(D.nodes) == list(H.nodes)
+    assert D.nodes.memberships() == H.nodes.memberships()
+
+    D.add_node_to_edge(0, 10)
+    assert D.nodes.memberships(10) == {0}
+    assert H.nodes.memberships(10) == set()
@@ -1,3 +1,4 @@
+import pickle
 from warnings import warn
 
 import pytest
@@ -601,3 +602,60 @@ def test_issue_445(edgelist1):
     assert 1 not in S
     assert 0 not in S.edges
     assert S._edge == xgi.dual_dict(S._node)
+
+
+def test_simplex_index(edgelist6):
+    def check_index(S):
+        index = S._edge_fingerprints()
+        assert len(index) == S.num_edges
+        for idx, members in S._edge.items():
+            assert index.get(frozenset(members)) == [idx]
+
+    S = xgi.SimplicialComplex()
+    S.add_simplices_from(edgelist6)
+    S.add_simplex([5, 6, 7], idx="a")
+    S.add_simplices_from({"b": [7, 8]})
+    check_index(S)
+    assert S._edge_index_version == S._version
+    assert S.has_simplex([6, 7])
+    assert not S.has_simplex([5, 7, 8])
+
+    S.remove_simplex_id(S._edge_fingerprints().get(frozenset({2, 3}))[0])
+    S.remove_node(7)
+    check_index(S)
+    assert not S.has_simplex([2, 3])
+    assert not S.has_simplex([5, 6, 7])
+    assert S.has_simplex([5, 6])
+
+    # modifications of the nodes and attributes keep the index
+    index = S._edge_fingerprints()
+    S.add_node(10)
+    S.add_nodes_from([11, 12])
+    S.set_node_attributes({10: 1}, name="a")
+    S.set_edge_attributes({"a": 1}, name="a")
+    S.add_simplex([10, 11])
+    assert S._edge_fingerprints() is index
+    check_index(S)
+
+    # modifications not tracked by the index trigger a rebuild
+    S.clear_edges()
+    assert not S.has_simplex([5, 6])
+    S.add_simplex([1, 2])
+    check_index(S)
+
+    # compact and pickled complexes
+    C = S.compact()
+    assert C.has_simplex([1, 2])
+    assert not C.has_simplex([1, 3])
+    P = pickle.loads(pickle.dumps(S))
+    assert P.has_simplex([1, 2])
+
+
+def test_supfaces(edgelist6):
+    S = xgi.SimplicialComplex(edgelist6)
+    for simplex in list(S._edge.values()) + [frozenset(), frozenset({0, 9})]:
+        expected = {idx for idx, s in S._edge.items() if simplex < s}
+        assert set(S._supfaces_id(simplex)) == expected
+        # in the order of the simplices
+        assert S._supfaces_id(simplex) == [idx for idx in S._edge if idx in expected]
+        assert set(S._supfaces(simplex)) == {S._edge[idx] for idx in expected}
@@ -1,3 +1,5 @@
+import pickle
+
 import numpy as np
 import pytest
 
@@ -594,3 +596,76 @@ def test_custom_stat_still_works():
 
     H = xgi.Hypergraph([[1, 2]])
     assert H.nodes.my_custom_stat.asdict() == {1: 42, 2: 42}
+
+
+def test_query():
+    H = xgi.Hypergraph([[1, 2], [2, 3, 4], [1, 4], [3, 5], [1, 2, 5]])
+    H.set_edge_attributes({0: "a", 1: 0.3, 2: "b", 3: 0.9, 4: 0.7}, name="w")
+
+    q = H.edges.query()
+    assert q.view() is H.edges
+    assert q.mask().all()
+
+    # queries are immutable
+    q2 = q.filterby("order", 1)
+    assert q.mask().all()
+    assert q2.mask().tolist() == [True, False, True, True, False]
+    assert list(q2.view()) == [0, 2, 3]
+
+    # the attribute is only compared on the edges that passed the previous filters
+    q3 = H.edges.query().filterby("order", 2).filterby_attr("w", 0.5, "gt")
+    assert list(q3.view()) == [4]
+    eager = H.edges.filterby("order", 2).filterby_attr("w", 0.5, "gt")
+    assert list(q3.view()) == list(eager)
+
+    q4 = H.nodes.query().filterby("degree", (2, 3), "between")
+    q4 = q4.filterby("degree", 3, "neq")
+    assert list(q4.view()) == [3, 4, 5]
+    assert list(H.nodes.filterby("degree", 2, "geq")) == [1, 2, 3, 4, 5]
+
+    with pytest.raises(ValueError):
+        H.nodes.query().filterby("degree", 2, "wrong").mask()
+
+
+def test_from_view_order():
+    H = xgi.Hypergraph([[1, 2, 3], [3, 4], [4, 5, 6]])
+    view = H.nodes.from_view(H.nodes, bunch=[5, 1, 3, 1])
+    assert list(view) == [1, 3, 5]
+    assert list(view | H.nodes.from_view(H.nodes, [2])) == [1, 2, 3, 5]
+    assert list(view - H.nodes.from_view(H.nodes, [3])) == [1, 5]
+    assert list(view & H.nodes.from_view(H.nodes, [5, 3, 4])) == [3, 5]
+
+    with pytest.raises(IDNotFound):
+        H.nodes.from_view(H.nodes, bunch=[1, 7])
+
+    # the order follows the modifications of the hypergraph
+    H.remove_node(1)
+    H.add_node(1)
+    H.add_node(0)
+    assert list(H.nodes.from_view(H.nodes, bunch=[0, 1, 2])) == [2, 1, 0]
+
+    # the positions are not copied or pickled
+    assert H._id_ranks is not None
+    for other in [H.copy(), pickle.loads(pickle.dumps(H))]:
+        assert other._id_ranks is None
+        assert list(other.nodes.from_view(other.nodes, bunch=[0, 2])) == [2, 0]
+
+
+def test_s_neighbors(edgelist1):
+    H = xgi.Hypergraph(edgelist1)
+    H.add_edge([1, 2, 4])
+    for view in [H.nodes, H.edges]:
+        for s in [1, 2, 3]:
+            nbrs = view.s_neighbors(s)
+            assert list(nbrs) == list(view)
+            assert nbrs == {i: view.neighbors(i, s) for i in view}
+
+    sub = H.nodes.filterby("degree", 2)
+    assert sub.s_neighbors(2) == {1: {2}, 2: {1}, 4: set(), 6: set()}
+    A, ids = sub.s_neighbors(sparse=True)
+    assert A.shape == (4, H.num_nodes)
+    assert ids == list(H.nodes)
+
+    H = xgi.DiHypergraph([([1, 2], [3])])
+    with pytest.raises(XGIError):
+        H.nodes.s_neighbors()
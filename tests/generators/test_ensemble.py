@@ -0,0 +1,90 @@
+from functools import partial
+from operator import attrgetter
+
+import numpy as np
+import pytest
+
+import xgi
+from xgi.exception import XGIError
+
+
+def test_ensemble():
+    samples = list(xgi.ensemble(xgi.random_hypergraph, 5, 10, [0.2, 0.05], seed=1))
+    assert len(samples) == 5
+    assert all(isinstance(H, xgi.Hypergraph) for H in samples)
+    assert all(H.num_nodes == 10 for H in samples)
+
+    # reproducible
+    again = xgi.ensemble(xgi.random_hypergraph, 5, 10, [0.2, 0.05], seed=1)
+    assert [H.edges.members() for H in again] == [H.edges.members() for H in samples]
+
+    # independent samples
+    assert len({tuple(map(frozenset, H.edges.members())) for H in samples}) == 5
+    other = xgi.ensemble(xgi.random_hypergraph, 5, 10, [0.2, 0.05], seed=2)
+    assert [H.edges.members() for H in other] != [H.edges.members() for H in samples]
+
+    # other generators and keyword arguments
+    p = np.array([[0.5, 0.1], [0.1, 0.5]])
+    samples = xgi.ensemble(xgi.uniform_HSBM, 3, 6, 2, p, [3, 3])
+    assert [H.num_nodes for H in samples] == [6, 6, 6]
+    samples = xgi.ensemble(xgi.fast_random_hypergraph, 3, 8, 0.3, order=2, seed=0)
+    assert all(set(H.edges.size.aslist()) <= {3} for H in samples)
+    samples = xgi.ensemble(xgi.random_simplicial_complex, 2, 8, [0.3, 0.1], seed=0)
+    assert all(isinstance(S, xgi.SimplicialComplex) for S in samples)
+
+    assert list(xgi.ensemble(xgi.random_hypergraph, 0, 10, [0.1])) == []
+
+
+def _seed(seed=None):
+    return seed
+
+
+def test_ensemble_seeds():
+    # 128-bit seeds, so that large ensembles do not repeat samples
+    seeds = list(xgi.ensemble(_seed, 1000, seed=0))
+    assert len(set(seeds)) == 1000
+    assert max(seeds) >= 2**96
+    assert seeds[:10] == list(xgi.ensemble(_seed, 10, seed=0))
+
+    # 32-bit seeds for the generators that seed the global NumPy state
+    generator = partial(xgi.random_simplicial_complex, ps=[0.3, 0.1])
+    samples = list(xgi.ensemble(generator, 3, 8, seed=0))
+    assert all(isinstance(S, xgi.SimplicialComplex) for S in samples)
+    samples = xgi.ensemble(xgi.watts_strogatz_hypergraph, 2, 10, 3, 2, 2, 0.1, seed=0)
+    assert [H.num_nodes for H in samples] == [10, 10]
+
+
+def test_ensemble_stat():
+    stat = attrgetter("num_edges")
+    sizes = list(xgi.ensemble(xgi.random_hypergraph, 4, 10, [0.2], seed=3, stat=stat))
+    samples = xgi.ensemble(xgi.random_hypergraph, 4, 10, [0.2], seed=3)
+    assert sizes == [H.num_edges for H in samples]
+
+    # streamed
+    sizes = xgi.ensemble(xgi.random_hypergraph, 10**6, 10, [0.2], seed=3, stat=stat)
+    assert isinstance(next(sizes), int)
+
+
+def test_ensemble_parallel():
+    generator = partial(xgi.fast_random_hypergraph, order=2)
+    serial = list(xgi.ensemble(generator, 6, 12, 0.3, seed=4))
+    parallel = list(xgi.ensemble(generator, 6, 12, 0.3, seed=4, n_jobs=2))
+    assert [H.edges.members() for H in parallel] == [H.edges.members() for H in serial]
+
+    stat = attrgetter("num_edges")
+    sizes = xgi.ensemble(xgi.random_hypergraph, 6, 10, [0.2], seed=4, stat=stat)
+    assert list(
+        xgi.ensemble(xgi.random_hypergraph, 6, 10, [0.2], seed=4, stat=stat, n_jobs=2)
+    ) == list(sizes)
+
+    # stopped early
+    sizes = xgi.ensemble(
+        xgi.random_hypergraph, 100, 10, [0.2], seed=4, stat=stat, n_jobs=2
+    )
+    assert next(sizes) == next(
+        xgi.ensemble(xgi.random_hypergraph, 1, 10, [0.2], seed=4, stat=stat)
+    )
+    sizes.close()
+
+    with pytest.raises(XGIError):
+        list(xgi.ensemble(xgi.random_hypergraph, 2, 10, [0.2], n_jobs=0))
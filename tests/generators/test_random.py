@@ -23,6 +23,36 @@ def test_chung_lu_hypergraph():
     with pytest.warns(Warning):
         _ = xgi.chung_lu_hypergraph({1: 1, 2: 2}, {1: 2, 2: 2})
 
+    # no incidences
+    H = xgi.chung_lu_hypergraph({}, {})
+    assert (H.num_nodes, H.num_edges) == (0, 0)
+    with pytest.warns(Warning):
+        H = xgi.chung_lu_hypergraph({1: 0, 2: 0}, {1: 2})
+    assert list(H.nodes) == [1, 2]
+    assert H.num_edges == 0
+
+    # seeded with a generator
+    H4 = xgi.chung_lu_hypergraph(k1, k2, seed=np.random.default_rng(2))
+    assert H4._edge == H2._edge
+
+    # the expected number of incidences of each pair is min(k1 * k2 / S, 1)
+    n = 300
+    k1 = {i: 1 + i % 20 for i in range(n)}
+    k2 = {f"e{i}": 1 + (7 * i) % 20 for i in range(n)}
+    S = sum(k1.values())
+    expected = sum(min(d * s / S, 1) for d in k1.values() for s in k2.values())
+    total = 0
+    for seed in range(10):
+        H = xgi.chung_lu_hypergraph(k1, k2, seed=seed)
+        assert list(H.nodes) == sorted(k1, key=k1.get, reverse=True)
+        assert set(H.edges) <= set(k2)
+        total += H.nodes.degree.asnumpy().sum()
+    assert abs(total / 10 - expected) < 0.02 * expected
+
+    # the result is a regular, mutable hypergraph
+    H.add_edge([0, 1])
+    assert H.edges.members(next(iter(H.edges))) <= set(k1)
+
 
 def test_dcsbm_hypergraph():
     n = 50
@@ -43,6 +73,12 @@ def test_dcsbm_hypergraph():
     assert H1._edge != H2._edge
     assert H2._edge == H3._edge
 
+    # nodes only join the edges of the groups connected in omega
+    omega = np.array([[n // 2, 0], [0, n // 2]])
+    H = xgi.dcsbm_hypergraph(k1, k2, g1, g2, omega, seed=np.random.default_rng(3))
+    for e, members in H.edges.members(dtype=dict).items():
+        assert {g1[u] for u in members} == {g2[e]}
+
 
 def test_random_hypergraph():
     # seed
@@ -9,7 +9,8 @@ from xgi.exception import XGIError
 def test_uniform_configuration_model_hypergraph():
     m = 3
     k = {1: 1, 2: 2, 3: 3, 4: 3}
-    H = xgi.uniform_hypergraph_configuration_model(k, m, seed=3)
+    # a seed for which no hyperedge is loopy
+    H = xgi.uniform_hypergraph_configuration_model(k, m, seed=6)
     assert H.num_nodes == 4
     assert dict(H.degree()) == k
     assert H.num_edges == 3
@@ -19,6 +20,35 @@ def test_uniform_configuration_model_hypergraph():
         k = {1: 1, 2: 6}
         H = xgi.uniform_hypergraph_configuration_model(k, m)
     assert H.nodes.degree.asnumpy().sum() % m == 0
+    assert k == {1: 1, 2: 6}
+
+    # loopy hyperedges are removed
+    k = {i: 3 for i in range(100)}
+    H = xgi.uniform_hypergraph_configuration_model(k, 4, seed=1)
+    assert list(H.nodes) == list(k)
+    assert set(H.edges.size.asnumpy()) == {4}
+    assert all(H.nodes.degree.asdict()[i] <= 3 for i in k)
+    assert H.num_edges > 60
+
+    # seeded with a generator
+    H1 = xgi.uniform_hypergraph_configuration_model(k, 4, seed=np.random.default_rng(2))
+    H2 = xgi.uniform_hypergraph_configuration_model(k, 4, seed=2)
+    assert H1.edges.members() == H2.edges.members()
+
+    # several samples at once
+    Hs = xgi.uniform_hypergraph_configuration_model(k, 4, seed=3, num_samples=5)
+    assert len(Hs) == 5
+    assert len({tuple(map(frozenset, H.edges.members())) for H in Hs}) == 5
+    for H in Hs:
+        assert H.num_nodes == 100
+        assert set(H.edges.size.asnumpy()) == {4}
+
+    with pytest.warns(Warning):
+        Hs = xgi.uniform_hypergraph_configuration_model(
+            {1: 1, 2: 1, 3: 1, 4: 1}, 3, seed=3, num_samples=4
+        )
+    assert len(Hs) == 4
+    assert all(H.num_edges <= 2 for H in Hs)
 
 
 def test_uniform_HSBM():
@@ -617,6 +617,39 @@ def test_boundary_matrix(edgelist4):
     assert np.linalg.norm(B2 @ B3) == 0
 
 
+def test_boundary_matrix_sparse(edgelist4):
+    S1 = xgi.SimplicialComplex(edgelist4)
+    orientations = {idd: 0 for idd in S1.edges.filterby("order", 1, mode="geq")}
+    orientations[S1._edge_fingerprints().get(frozenset([3, 4, 5]))[0]] = 1
+
+    for order in range(5):
+        B, rowdict, coldict = xgi.boundary_matrix(
+            S1, order=order, orientations=orientations, index=True, sparse=True
+        )
+        Bd, rowdict_d, coldict_d = xgi.boundary_matrix(
+            S1, order=order, orientations=orientations, index=True
+        )
+        assert isinstance(B, csr_array)
+        assert isinstance(Bd, np.ndarray)
+        assert np.array_equal(B.toarray(), Bd)
+        assert rowdict == rowdict_d
+        assert coldict == coldict_d
+
+        L = xgi.hodge_laplacian(S1, order=order, orientations=orientations, sparse=True)
+        Ld = xgi.hodge_laplacian(S1, order=order, orientations=orientations)
+        assert isinstance(L, csr_array)
+        assert np.array_equal(L.toarray(), Ld)
+
+    B1 = xgi.boundary_matrix(S1, order=1, sparse=True)
+    B2 = xgi.boundary_matrix(S1, order=2, sparse=True)
+    assert (B1 @ B2).count_nonzero() == 0
+
+    # missing faces
+    H = xgi.Hypergraph([[1, 2, 3], [2, 3], [1, 3]])
+    with pytest.raises(XGIError):
+        xgi.boundary_matrix(H, order=2, sparse=True)
+
+
 def test_normalized_hypergraph_laplacian():
     el = [[1, 2, 3], [4], [5, 6], [6, 7, 8]]
     H = xgi.Hypergraph(el)
@@ -801,3 +834,79 @@ def test_adjacency_tensor(edgelist1):
     A13 = xgi.adjacency_tensor(H1, order=3)
     A13_norm = xgi.adjacency_tensor(H1, order=3)
     assert np.allclose(A13_norm, A13 / 6)
+
+
+def test_incidence_matrix_compact(edgelist4):
+    H = xgi.Hypergraph(edgelist4)
+    C = H.compact()
+
+    I, rowdict, coldict = xgi.incidence_matrix(C, index=True)
+    assert np.shares_memory(I.indices, C._edge.incidence.node_edges)
+    assert rowdict == {0: 1, 1: 2, 2: 3, 3: 4, 4: 5}
+    assert coldict == {0: 0, 1: 1, 2: 2}
+    assert np.all(I.toarray() == xgi.incidence_matrix(H, sparse=False))
+    assert np.all(
+        xgi.incidence_matrix(C, sparse=False) == xgi.incidence_matrix(H, sparse=False)
+    )
+    assert np.all(
+        xgi.incidence_matrix(C, order=2, sparse=False)
+        == xgi.incidence_matrix(H, order=2, sparse=False)
+    )
+    assert np.all(
+        xgi.adjacency_matrix(C, sparse=False) == xgi.adjacency_matrix(H, sparse=False)
+    )
+
+
+def test_incidence_matrix_weights(edgelist4):
+    H = xgi.Hypergraph(edgelist4)
+    H.set_edge_attributes({0: 2.5, 2: 0.5}, name="weight")
+    H.set_node_attributes({1: 3, 5: 2}, name="mass")
+
+    I = xgi.incidence_matrix(H, sparse=False)
+    edge_weights = np.array([2.5, 1, 0.5])
+    node_weights = np.array([3, 1, 1, 1, 2])
+
+    Iw = xgi.incidence_matrix(H, sparse=False, weight="weight")
+    assert np.allclose(Iw, I * edge_weights[None, :])
+    assert np.allclose(xgi.incidence_matrix(H, weight=edge_weights).toarray(), Iw)
+
+    In = xgi.incidence_matrix(H, sparse=False, node_weight="mass")
+    assert In.dtype == int
+    assert np.array_equal(In, I * node_weights[:, None])
+
+    Inw = xgi.incidence_matrix(
+        H, sparse=False, weight="weight", node_weight=node_weights
+    )
+    assert np.allclose(Inw, I * np.outer(node_weights, edge_weights))
+
+    # per-incidence functions are still supported
+    Ifn = xgi.incidence_matrix(H, sparse=False, weight=lambda n, e, H: n * (e + 1))
+    assert np.array_equal(Ifn, I * np.outer([1, 2, 3, 4, 5], [1, 2, 3]))
+
+    # a single order
+    I2, _, coldict = xgi.incidence_matrix(H, order=2, weight="weight", index=True)
+    assert coldict == {0: 0, 1: 2}
+    assert np.allclose(I2.toarray(), Iw[:, [0, 2]])
+
+    with pytest.raises(XGIError):
+        xgi.incidence_matrix(H, weight=[1, 2])
+    with pytest.raises(XGIError):
+        xgi.incidence_matrix(H, node_weight=np.ones(3))
+
+
+def test_incidence_matrix_shared_arrays(edgelist4):
+    H = xgi.Hypergraph(edgelist4)
+    inc = xgi.utils.csr_incidence(H)
+    I = xgi.incidence_matrix(H)
+
+    # the incidence arrays are reused until the hypergraph is modified
+    assert xgi.utils.csr_incidence(H) is inc
+    xgi.adjacency_matrix(H)
+    assert xgi.utils.csr_incidence(H) is inc
+    H.add_edge([1, 5])
+    assert xgi.utils.csr_incidence(H) is not inc
+    assert xgi.incidence_matrix(H).shape == (5, 4)
+
+    # the returned matrices own their arrays
+    I.indices[0] = I.indices[0]
+    I.eliminate_zeros()
@@ -0,0 +1,62 @@
+import tempfile
+
+import numpy as np
+import pytest
+
+import xgi
+from xgi.exception import XGIError
+
+
+def test_binary_roundtrip(edgelist1):
+    H = xgi.Hypergraph(edgelist1, name="test")
+    H.set_node_attributes({1: {"color": "red", "weight": 2.0}, 2: {"color": "blue"}})
+    H.set_edge_attributes({0: {"age": 3, "tags": ["a", "b"], "flag": True}})
+
+    path = tempfile.mkdtemp()
+    xgi.write_binary(H, path)
+    for mmap in [False, True]:
+        H2 = xgi.read_binary(path, mmap=mmap)
+        assert H2.is_compact and H2.is_frozen
+        assert list(H2.nodes) == list(H.nodes)
+        assert H2.edges.members(dtype=dict) == H.edges.members(dtype=dict)
+        assert H2["name"] == "test"
+        assert H2.nodes[1] == {"color": "red", "weight": 2.0}
+        assert H2.nodes[2] == {"color": "blue"}
+        assert H2.nodes[3] == {}
+        assert H2.edges[0] == {"age": 3, "tags": ["a", "b"], "flag": True}
+        assert H2.nodes.degree.asdict() == H.nodes.degree.asdict()
+
+    # the incidence arrays are mapped from the files
+    H2 = xgi.read_binary(path, mmap=True)
+    I = xgi.incidence_matrix(H2)
+    assert isinstance(H2._edge.incidence.node_edges.base, np.memmap)
+    assert (I.toarray() == xgi.incidence_matrix(H).toarray()).all()
+
+    # mutable copy
+    H3 = H2.copy()
+    H3.add_edge([1, 2])
+    assert H3.edges.members(H3.num_edges - 1) == {1, 2}
+    assert H3.num_edges == H.num_edges + 1
+
+
+def test_binary_ids():
+    H = xgi.Hypergraph({"a": ["x", "y"], "b": ["y", "z"]})
+    path = tempfile.mkdtemp()
+    xgi.write_binary(H, path)
+    H2 = xgi.read_binary(path)
+    assert H2.edges.members(dtype=dict) == {"a": {"x", "y"}, "b": {"y", "z"}}
+
+    H = xgi.Hypergraph()
+    xgi.write_binary(H, path)
+    H2 = xgi.read_binary(path)
+    assert H2.num_nodes == 0 and H2.num_edges == 0
+
+    H = xgi.Hypergraph([[1, "a"]])
+    with pytest.raises(XGIError):
+        xgi.write_binary(H, tempfile.mkdtemp())
+
+    with pytest.raises(XGIError):
+        xgi.read_binary(tempfile.mkdtemp())
+
+    with pytest.raises(XGIError):
+        xgi.write_binary(xgi.DiHypergraph([([1], [2])]), tempfile.mkdtemp())
@@ -125,3 +125,31 @@ def test_write_bipartite_edgelist(edgelist1):
     assert [H1.edges.members(e) for e in H1.edges] == [
         H2.edges.members(e) for e in H2.edges
     ]
+
+
+def test_read_bipartite_edgelist_batches():
+    _, filename = tempfile.mkstemp()
+    with open(filename, "w") as file:
+        file.write(bipartite_edgelist_spaces_string)
+
+    counts = []
+    H = xgi.read_bipartite_edgelist(
+        filename, nodetype=int, edgetype=int, batch_size=4, progress=counts.append
+    )
+    assert list(H.nodes) == [0, 1, 2, 3, 4, 5, 6, 7, 8]
+    assert H.edges.members(dtype=dict) == {
+        0: {0, 1, 2, 3},
+        1: {4},
+        2: {5, 6},
+        3: {6, 7, 8},
+    }
+    assert counts == [4, 8, 10]
+
+    H = xgi.read_bipartite_edgelist(filename, edgetype=int, max_edges=2)
+    assert H.edges.members(dtype=dict) == {0: {"0", "1", "2", "3"}, 1: {"4"}}
+
+    batches = list(
+        xgi.iter_bipartite_edgelist(filename, nodetype=int, dual=True, batch_size=6)
+    )
+    assert [len(pairs) for pairs in batches] == [6, 4]
+    assert batches[0][:2] == [(0, "0"), (0, "1")]
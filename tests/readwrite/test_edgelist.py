@@ -62,3 +62,22 @@ def test_write_edgelist(edgelist1):
     assert [H1.edges.members(e) for e in H1.edges] == [
         H2.edges.members(e) for e in H2.edges
     ]
+
+
+def test_read_edgelist_batches():
+    _, filename = tempfile.mkstemp()
+    with open(filename, "w") as file:
+        file.write(edgelist_spaces_string + "\n\n")
+
+    counts = []
+    H = xgi.read_edgelist(filename, nodetype=int, batch_size=3, progress=counts.append)
+    assert H.edges.members() == [{1, 2}, {2, 3, 4}, {1, 4, 7, 8}, {2, 3}]
+    assert counts == [3, 4]
+
+    H = xgi.read_edgelist(filename, nodetype=int, max_edges=2)
+    assert H.edges.members() == [{1, 2}, {2, 3, 4}]
+
+    batches = list(xgi.iter_edgelist(filename, nodetype=int, batch_size=3))
+    assert batches == [[[1, 2], [2, 3, 4], [1, 4, 7, 8]], [[2, 3]]]
+    batches = list(xgi.iter_edgelist(filename, max_edges=1))
+    assert batches == [[["1", "2"]]]
@@ -302,3 +302,70 @@ def test_read_hif_collection():
     assert len(collection) == 2
     assert isinstance(collection, dict)
     assert sorted(collection) == ["dataset1", "dataset2"]
+
+
+def test_hif_stream():
+    from io import StringIO
+
+    from xgi.readwrite.hif import _JSONStream
+
+    doc = '{"a": 12345, "b" : [ {"x": [1, 2.5e3]}, "s,]", true, null ], "c": []}'
+    # small chunks split the values
+    for chunk_size in [1, 3, 7, 1000]:
+        stream = _JSONStream(StringIO(doc), chunk_size=chunk_size)
+        data = {}
+        for key in stream.keys():
+            data[key] = list(stream.elements()) if key != "a" else stream.value()
+        assert data == {
+            "a": 12345,
+            "b": [{"x": [1, 2500.0]}, "s,]", True, None],
+            "c": [],
+        }
+
+    # a large value is decoded with a logarithmic number of refills
+    doc = '{"a": ' + json.dumps([{"x": i} for i in range(1000)]) + "}"
+    stream = _JSONStream(StringIO(doc), chunk_size=10)
+    fills = []
+    fill = stream._fill
+    stream._fill = lambda *args: fills.append(args) or fill(*args)
+    for key in stream.keys():
+        assert stream.value() == [{"x": i} for i in range(1000)]
+    assert len(fills) < 20
+
+    with pytest.raises(xgi.exception.XGIError):
+        stream = _JSONStream(StringIO('{"a": [1, 2'), chunk_size=3)
+        for key in stream.keys():
+            list(stream.elements())
+
+
+def test_hif_roundtrip_order():
+    H = xgi.Hypergraph([[3, 1], [2, 5, 4], []], name="test")
+    H.add_node(0, color="red")
+    H.set_edge_attributes({1: {"weight": float("nan")}})
+    _, filename = tempfile.mkstemp()
+    xgi.write_hif(H, filename)
+
+    H2 = xgi.read_hif(filename)
+    assert list(H2.edges) == list(H.edges)
+    assert H2.edges.members() == H.edges.members()
+    assert set(H2.nodes) == set(H.nodes)
+    assert H2.nodes[0] == {"color": "red"}
+    assert H2.edges[1] == {"weight": None}
+    assert H2["name"] == "test"
+
+    # the node and edge records may come after the incidences
+    with open(filename, "w") as file:
+        json.dump(
+            {
+                "network-type": "undirected",
+                "incidences": [{"edge": 0, "node": 1}, {"edge": 0, "node": 2}],
+                "nodes": [{"node": 3}, {"node": 1, "attrs": {"color": "red"}}],
+                "edges": [{"edge": 1, "attrs": {"weight": 2}}],
+            },
+            file,
+        )
+    H3 = xgi.read_hif(filename)
+    assert list(H3.nodes) == [1, 2, 3]
+    assert H3.nodes[1] == {"color": "red"}
+    assert H3.edges.members() == [{1, 2}, set()]
+    assert H3.edges[1] == {"weight": 2}
@@ -1069,3 +1069,150 @@ def test_aggregate_stats_types(edgelist1):
     assert isinstance(H.nodes.degree.std(), float)
     assert isinstance(H.nodes.degree.var(), float)
     assert isinstance(H.nodes.degree.moment(), float)
+
+
+def test_stat_cache(edgelist1):
+    H = xgi.Hypergraph(edgelist1)
+    calls = []
+    degree = xgi.stats.nodestats.degree
+
+    def counted(net, bunch, *args, **kwargs):
+        calls.append(1)
+        return degree(net, bunch, *args, **kwargs)
+
+    counted.__module__ = degree.__module__
+    counted.__name__ = degree.__name__
+    stat = xgi.stats.NodeStat(H, H.nodes, counted)
+
+    # computed only once for several summaries
+    assert stat.mean() == 9 / 8
+    assert stat.max() == 2
+    assert stat.argsort()[-1] == 6
+    assert len(calls) == 1
+
+    # different arguments or views are cached separately
+    stat(order=2).asdict()
+    xgi.stats.NodeStat(H, H.nodes([1, 2]), counted).asdict()
+    assert len(calls) == 3
+    stat(order=2).asdict()
+    assert len(calls) == 3
+
+    # mutations invalidate the cache
+    H.add_edge([1, 4])
+    assert stat.asdict()[1] == 2
+    assert len(calls) == 4
+    H.remove_node(4)
+    assert 4 not in stat.asdict()
+    assert len(calls) == 5
+
+    # reading attributes does not invalidate the cache
+    H.nodes[1]
+    H.edges[0]
+    stat.asdict()
+    assert len(calls) == 5
+
+    # stats reading attributes are not memoized, since they can be edited in place
+    H.edges[0]["weight"] = 3
+    assert H.nodes.degree(weight="weight").asdict()[1] == 4
+    H.edges[0]["weight"] = 5
+    assert H.nodes.degree(weight="weight").asdict()[1] == 6
+    H.set_edge_attributes({0: 1}, name="weight")
+    assert H.nodes.degree(weight="weight").asdict()[1] == 2
+    H.edges.attrs.asdict()[0]["weight"] = 7
+    assert H.nodes.degree(weight="weight").asdict()[1] == 8
+    assert H.nodes.degree(None, "weight").asdict()[1] == 8
+    H.edges.attrs.asdict()[0]["weight"] = 9
+    assert H.nodes.degree(None, "weight").asdict()[1] == 10
+    assert H.nodes.degree(weight="weight").asnumpy()[0] == 10
+
+    H = xgi.Hypergraph([[1, 2], [2, 3]])
+    H.set_edge_attributes({0: 1.0, 1: 1.0}, name="w")
+    assert H.nodes.degree(weight="w").asdict()[2] == 2.0
+    H.edges.attrs.asdict()[0]["w"] = 10.0
+    assert H.nodes.degree(weight="w").asdict()[2] == 11.0
+
+    D = xgi.DiHypergraph([([1], [2]), ([2], [3])])
+    D.set_edge_attributes({0: 1.0, 1: 1.0}, name="w")
+    assert D.nodes.in_degree(weight="w").asdict()[2] == 1.0
+    D.edges.attrs.asdict()[0]["w"] = 10.0
+    assert D.nodes.in_degree(weight="w").asdict()[2] == 10.0
+
+
+def test_stat_cache_lru():
+    cache = xgi.stats.StatCache(maxsize=2)
+    cache.put("a", 0, 1)
+    cache.put("b", 0, 2)
+    assert cache.get("a", 0) == 1
+    cache.put("c", 0, 3)
+    assert "b" not in cache
+    assert len(cache) == 2
+
+    # a newer version empties the cache
+    assert cache.get("a", 1) is None
+    assert len(cache) == 0
+
+
+def test_stat_cache_user_stats(edgelist1):
+    H = xgi.Hypergraph(edgelist1)
+    values = {"x": 1}
+
+    @xgi.nodestat_func
+    def external(net, bunch):
+        return {n: values["x"] for n in bunch}
+
+    assert H.nodes.external.max() == 1
+    values["x"] = 2
+    assert H.nodes.external.max() == 2
+    assert H.nodes.attrs("color").asdict()[1] is None
+    H.nodes[1]["color"] = "red"
+    assert H.nodes.attrs("color").asdict()[1] == "red"
+
+
+def test_stat_arrays(edgelist1, edgelist8):
+    H = xgi.Hypergraph(edgelist8)
+    H.add_node("isolated")
+    H.set_edge_attributes({e: e + 0.5 for e in H.edges}, name="weight")
+    networks = [H, H.compact(), xgi.Hypergraph(edgelist1)]
+
+    nodestats = [
+        ("degree", (), {}),
+        ("degree", (), {"order": 2}),
+        ("degree", (), {"weight": "weight"}),
+        ("degree", (), {"order": 1, "weight": "weight"}),
+        ("average_neighbor_degree", (), {}),
+    ]
+    edgestats = [
+        ("size", (), {}),
+        ("size", (), {"degree": 2}),
+        ("order", (), {}),
+        ("order", (), {"degree": 1}),
+    ]
+    for net in networks:
+        for views, module, stats in [
+            (net.nodes, xgi.stats.nodestats, nodestats),
+            (net.edges, xgi.stats.edgestats, edgestats),
+        ]:
+            for sub in [views, views.from_view(views, bunch=list(views)[1:4])]:
+                for name, args, kwargs in stats:
+                    stat = getattr(sub, name)(*args, **kwargs)
+                    expected = getattr(module, name)(net, sub, *args, **kwargs)
+                    assert stat._array() is not None
+                    assert stat.asdict() == expected
+                    assert stat.aslist() == [expected[i] for i in sub]
+                    assert np.allclose(
+                        stat.asnumpy(), [expected[i] for i in sub], atol=0
+                    )
+                    assert stat.aspandas().to_dict() == expected
+
+    # the memoized array is read-only, but the outputs are not
+    arr = H.nodes.degree.asnumpy()
+    arr[0] = -1
+    assert H.nodes.degree.asnumpy()[0] != -1
+    series = H.nodes.degree.aspandas()
+    series.iloc[0] = -1
+    assert H.nodes.degree.asnumpy()[0] != -1
+
+    # the arrays follow the modifications of the network
+    H.add_edge([1, 2, 3])
+    assert H.nodes.degree.asdict() == xgi.stats.nodestats.degree(H, H.nodes)
+    assert H.edges.size.aslist()[-1] == 3
@@ -0,0 +1,100 @@
+import numpy as np
+
+import xgi
+from xgi.utils import CSRIncidence, CSRMembers
+
+
+def test_from_network(edgelist1):
+    H = xgi.Hypergraph(edgelist1)
+    H.add_node(0)
+    inc = CSRIncidence.from_network(H)
+
+    assert inc.num_nodes == 9
+    assert inc.num_edges == 4
+    assert inc.nnz == 9
+    assert inc.node_ids == [1, 2, 3, 4, 5, 6, 8, 7, 0]
+    assert inc.edge_ids == [0, 1, 2, 3]
+    assert inc.edge_ptr.dtype == np.int32
+    assert inc.node_edges.dtype == np.int32
+    assert inc.edge_sizes().tolist() == [3, 1, 2, 3]
+    assert inc.node_degrees().tolist() == [1, 1, 1, 1, 1, 2, 1, 1, 0]
+    assert inc.edge_of_incidence().tolist() == [0, 0, 0, 1, 2, 2, 3, 3, 3]
+
+    # members are sorted by index within each edge
+    assert inc.edge_nodes.tolist() == [0, 1, 2, 3, 4, 5, 5, 6, 7]
+    assert inc.node_edges.tolist() == [0, 0, 0, 1, 2, 2, 3, 3, 3]
+
+
+def test_induced_edges(edgelist1):
+    H = xgi.Hypergraph(edgelist1)
+    H.add_node(0)
+    inc = CSRIncidence.from_network(H)
+
+    # nodes 1, 2, 3, 4, 5, 6 are at indices 0 to 5
+    assert inc.induced_edges(np.arange(6)).tolist() == [0, 1, 2]
+    assert inc.induced_edges(np.array([3, 5, 8])).tolist() == [1]
+    assert inc.induced_edges(np.array([], dtype=int)).tolist() == []
+
+    assert inc.incident_nodes(np.array([2, 0])).tolist() == [0, 1, 2, 4, 5]
+    assert inc.incident_nodes(np.array([], dtype=int)).tolist() == []
+
+
+def test_tocsr(edgelist3):
+    H = xgi.Hypergraph(edgelist3)
+    inc = CSRIncidence.from_network(H)
+    I = inc.tocsr()
+
+    assert np.shares_memory(I.indices, inc.node_edges)
+    assert np.shares_memory(I.indptr, inc.node_ptr)
+    assert np.all(I.toarray() == xgi.incidence_matrix(H, sparse=False))
+
+
+def test_csr_members(edgelist1):
+    H = xgi.Hypergraph(edgelist1)
+    inc = CSRIncidence.from_network(H)
+    nodes = CSRMembers(inc, "node")
+    edges = CSRMembers(inc, "edge")
+
+    assert dict(nodes) == dict(H._node)
+    assert dict(edges) == dict(H._edge)
+    assert 6 in nodes
+    assert 10 not in nodes
+    assert len(edges) == 4
+
+
+def test_bfs():
+    H = xgi.Hypergraph([[0, 1], [1, 2, 3], [3, 4], [5, 6], []])
+    H.add_node(7)
+    inc = CSRIncidence.from_network(H)
+
+    assert inc.bfs(0).tolist() == [0, 1, 2, 2, 3, -1, -1, -1]
+    assert inc.bfs(0, cutoff=2).tolist() == [0, 1, 2, 2, -1, -1, -1, -1]
+    assert inc.bfs([0, 5]).tolist() == [0, 1, 2, 2, 3, 0, 1, -1]
+    assert inc.bfs(7).tolist() == [-1] * 7 + [0]
+
+
+def test_overlaps():
+    H = xgi.Hypergraph([[0, 1, 2], [1, 2, 3], [2, 3], [4]])
+    inc = CSRIncidence.from_network(H)
+
+    A = inc.overlaps("node")
+    assert A.toarray().tolist() == [
+        [0, 1, 1, 0, 0],
+        [1, 0, 2, 1, 0],
+        [1, 2, 0, 2, 0],
+        [0, 1, 2, 0, 0],
+        [0, 0, 0, 0, 0],
+    ]
+    assert np.all(A.data > 0)
+
+    assert inc.overlaps("node", s=2).nonzero()[0].tolist() == [1, 2, 2, 3]
+    assert inc.overlaps("edge", s=2).toarray().tolist() == [
+        [0, 2, 0, 0],
+        [2, 0, 2, 0],
+        [0, 2, 0, 0],
+        [0, 0, 0, 0],
+    ]
+
+    # only the edges of size 2
+    A = inc.overlaps("node", edges=[2])
+    assert A.nonzero()[0].tolist() == [2, 3]
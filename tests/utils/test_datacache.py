@@ -0,0 +1,207 @@
+import hashlib
+import json
+import os
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+
+import xgi
+from xgi.exception import XGIError
+from xgi.readwrite.xgi_data import _request_from_xgi_data
+from xgi.utils import DatasetCache
+
+
+class _Handler(BaseHTTPRequestHandler):
+    """Serves the files of the server, with ETags, and counts the requests."""
+
+    def do_GET(self):
+        files = self.server.files
+        self.server.requests.append(self.path)
+        if self.path not in files:
+            self.send_response(404)
+            self.end_headers()
+            return
+        content = files[self.path]
+        etag = '"' + hashlib.md5(content).hexdigest() + '"'
+        if self.server.etags and self.headers.get("If-None-Match") == etag:
+            self.send_response(304)
+            self.end_headers()
+            return
+        self.send_response(200)
+        if self.server.etags:
+            self.send_header("ETag", etag)
+        self.send_header("Content-Length", str(len(content)))
+        self.end_headers()
+        self.wfile.write(content)
+
+    def log_message(self, *args):
+        pass
+
+
+@pytest.fixture
+def server():
+    httpd = ThreadingHTTPServer(("127.0.0.1", 0), _Handler)
+    httpd.files = {}
+    httpd.requests = []
+    httpd.etags = True
+    httpd.url = f"http://127.0.0.1:{httpd.server_address[1]}"
+    thread = threading.Thread(target=httpd.serve_forever, args=(0.01,), daemon=True)
+    thread.start()
+    yield httpd
+    httpd.shutdown()
+    httpd.server_close()
+
+
+def test_request_json(server, tmp_path):
+    server.files["/a.json"] = json.dumps({"a": 1}).encode()
+    cache = DatasetCache(tmp_path)
+
+    assert cache.request_json(server.url + "/a.json") == {"a": 1}
+    assert cache.request_json(server.url + "/a.json") == {"a": 1}
+    assert len(server.requests) == 2
+
+    # the content is stored once, by its hash
+    assert len(os.listdir(tmp_path / "data")) == 1
+
+    # changed on the server
+    server.files["/a.json"] = json.dumps({"a": 2}).encode()
+    assert cache.request_json(server.url + "/a.json") == {"a": 2}
+
+    with pytest.raises(XGIError):
+        cache.request_json(server.url + "/missing.json")
+
+
+def test_etag_validation(server, tmp_path):
+    server.files["/a.json"] = json.dumps({"a": 1}).encode()
+    cache = DatasetCache(tmp_path)
+    url = server.url + "/a.json"
+
+    digest = cache.fetch(url)
+    data_path = tmp_path / "data" / f"{digest}.json"
+    mtime = os.stat(data_path).st_mtime_ns
+    os.utime(data_path, ns=(mtime - 10**9, mtime - 10**9))
+
+    # not modified: the cached copy is used and marked as used
+    assert cache.fetch(url) == digest
+    assert os.stat(data_path).st_mtime_ns >= mtime
+
+    # without ETags, the content is downloaded and hashed again
+    server.etags = False
+    assert cache.fetch(url) == digest
+
+
+def test_offline(server, tmp_path):
+    server.files["/a.json"] = json.dumps({"a": 1}).encode()
+    cache = DatasetCache(tmp_path)
+    url = server.url + "/a.json"
+    assert cache.request_json(url) == {"a": 1}
+
+    server.shutdown()
+    server.server_close()
+    assert cache.request_json(url) == {"a": 1}
+
+    with pytest.raises(XGIError):
+        cache.request_json(server.url + "/b.json")
+
+
+def test_corrupted(server, tmp_path):
+    server.files["/a.json"] = json.dumps({"a": 1}).encode()
+    cache = DatasetCache(tmp_path)
+    digest = cache.fetch(server.url + "/a.json")
+
+    with open(tmp_path / "data" / f"{digest}.json", "w") as file:
+        file.write('{"a": 3}')
+    with pytest.raises(XGIError):
+        cache.read_json(digest)
+
+    # downloaded again
+    assert cache.request_json(server.url + "/a.json") == {"a": 1}
+
+    cache.store(digest, "key", [1, 2])
+    assert cache.load(digest, "key") == [1, 2]
+    assert cache.load(digest, "other") is None
+    with open(cache._parsed_path(digest, "key"), "wb") as file:
+        file.write(b"not a pickle")
+    assert cache.load(digest, "key") is None
+
+
+def test_eviction(server, tmp_path):
+    for i in range(4):
+        server.files[f"/{i}.json"] = json.dumps({"data": [i] * 100}).encode()
+    size = len(server.files["/0.json"])
+    cache = DatasetCache(tmp_path, max_size=3 * size)
+
+    digests = []
+    for i in range(3):
+        digests.append(cache.fetch(f"{server.url}/{i}.json"))
+        data_path = tmp_path / "data" / f"{digests[-1]}.json"
+        os.utime(data_path, (i, i))
+    assert cache.size() == 3 * size
+
+    # 0 is used again, so that 1 is the least recently used
+    cache.read_json(digests[0])
+    digests.append(cache.fetch(f"{server.url}/3.json"))
+    assert cache.size() == 3 * size
+    names = set(os.listdir(tmp_path / "data"))
+    assert names == {f"{digests[i]}.json" for i in [0, 2, 3]}
+
+    # evicted content is downloaded again
+    assert cache.request_json(f"{server.url}/1.json") == {"data": [1] * 100}
+
+    cache.clear()
+    assert cache.size() == 0
+
+
+def test_larger_than_cache(server, tmp_path):
+    server.files["/big.json"] = json.dumps({"data": list(range(100))}).encode()
+    server.files["/small.json"] = b"[]"
+    cache = DatasetCache(tmp_path, max_size=len(server.files["/big.json"]) - 1)
+
+    # the file just downloaded is kept, even if it does not fit
+    assert cache.request_json(server.url + "/big.json") == {"data": list(range(100))}
+    digest = cache.fetch(server.url + "/big.json")
+    cache.store(digest, "key", list(range(1000)))
+    assert cache.load(digest, "key") == list(range(1000))
+
+    # and removed by the next addition
+    assert cache.request_json(server.url + "/small.json") == []
+    assert cache.size() <= cache.max_size
+
+
+def test_request_from_xgi_data(server, dataset_cache):
+    assert xgi.get_dataset_cache() is dataset_cache
+    H = xgi.Hypergraph([[1, 2, 3], [3, 4]])
+    H["name"] = "test"
+    server.files["/h.json"] = json.dumps(xgi.to_hif_dict(H)).encode()
+    server.files["/c.json"] = json.dumps(
+        {
+            "type": "collection",
+            "datasets": {
+                "one": {"relative-path": "h.json"},
+                "two": {"relative-path": "h.json"},
+            },
+        }
+    ).encode()
+
+    H1 = _request_from_xgi_data(server.url + "/h.json", cache=True)
+    assert H1.edges.members() == H.edges.members()
+    assert len(os.listdir(dataset_cache.directory / "parsed")) == 1
+
+    # the parsed hypergraph is loaded from the cache
+    H2 = _request_from_xgi_data(server.url + "/h.json", cache=True)
+    assert H2.edges.members() == H.edges.members()
+    assert H2["name"] == "test"
+    assert len(os.listdir(dataset_cache.directory / "parsed")) == 1
+
+    # parsed with other options
+    H3 = _request_from_xgi_data(server.url + "/h.json", max_order=1, cache=True)
+    assert H3.edges.members() == [{3, 4}]
+    assert len(os.listdir(dataset_cache.directory / "parsed")) == 2
+
+    collection = _request_from_xgi_data(server.url + "/c.json", cache=True)
+    assert set(collection) == {"one", "two"}
+    assert collection["two"].edges.members() == H.edges.members()
+
+    H4 = _request_from_xgi_data(server.url + "/h.json", cache=False)
+    assert H4.edges.members() == H.edges.members()
@@ -0,0 +1,35 @@
+from xgi.utils import FingerprintIndex
+from xgi.utils.fingerprint import directed_fingerprint, fingerprint
+
+
+def test_fingerprints():
+    assert fingerprint([2, 1, 2]) == frozenset({1, 2})
+    assert directed_fingerprint(([1, 2], [3])) == (frozenset({1, 2}), frozenset({3}))
+    assert directed_fingerprint({"in": {1, 2}, "out": {3}}) == directed_fingerprint(
+        ([2, 1], [3])
+    )
+    assert directed_fingerprint(([1], [2])) != directed_fingerprint(([2], [1]))
+
+
+def test_fingerprint_index():
+    members = {"a": {1, 2}, "b": {3}, "c": {2, 1}, "d": {3}, "e": {1, 2}}
+    index = FingerprintIndex((idx, fingerprint(m)) for idx, m in members.items())
+    assert len(index) == 2
+    assert fingerprint({1, 2}) in index
+    assert index.get(fingerprint({1, 2})) == ["a", "c", "e"]
+    assert index.get(fingerprint({4})) == []
+    assert index.groups() == [["a", "c", "e"], ["b", "d"]]
+    assert sorted(index.duplicates()) == ["c", "d", "e"]
+
+    index.discard("a")
+    index.discard("z")
+    assert index.groups() == [["b", "d"], ["c", "e"]]
+
+    # moving an ID keeps its position
+    index.move("b", fingerprint({1, 2}))
+    assert index.get(fingerprint({1, 2})) == ["b", "c", "e"]
+    assert index.groups() == [["b", "c", "e"]]
+
+    index.discard("d")
+    assert fingerprint({3}) not in index
+    assert sorted(index.duplicates()) == ["c", "e"]
@@ -0,0 +1,48 @@
+from itertools import product
+
+import numpy as np
+
+import xgi
+from xgi.utils import pairwise_incidence, ttsv1, ttsv2
+from xgi.utils.tensor import banerjee_coeff
+
+
+def _adjacency_tensor(edge_dict, n, r):
+    """Dense adjacency tensor of a non-uniform hypergraph, from its edge blowups."""
+    T = np.zeros((n,) * r)
+    for edge in edge_dict.values():
+        l = len(edge)
+        for index in product(sorted(edge), repeat=r):
+            if set(index) == set(edge):
+                T[index] = l / banerjee_coeff(l, r)
+    return T
+
+
+def test_ttsv():
+    edge_dict = {0: {0, 1}, 1: {1, 2, 3}, 2: {3}, 3: {0, 2, 3, 4}, 4: {2, 4}}
+    node_dict = {n: {e for e, edge in edge_dict.items() if n in edge} for n in range(5)}
+    r = 4
+    a = np.random.default_rng(0).uniform(size=5)
+    T = _adjacency_tensor(edge_dict, 5, r)
+
+    s = ttsv1(node_dict, edge_dict, r, a)
+    assert np.allclose(s, np.einsum("ijkl,j,k,l->i", T, a, a, a))
+
+    Y = ttsv2(pairwise_incidence(edge_dict, r), edge_dict, r, a, 5)
+    assert Y.shape == (5, 5)
+    assert np.allclose(Y.toarray(), np.einsum("ijkl,k,l->ij", T, a, a))
+
+
+def test_ttsv_uniform():
+    H = xgi.random_hypergraph(8, [0, 0.3], seed=1)
+    edge_dict = H.edges.members(dtype=dict)
+    node_dict = H.nodes.memberships()
+    a = np.random.default_rng(1).uniform(size=8)
+    T = _adjacency_tensor(edge_dict, 8, 3)
+
+    assert np.allclose(
+        ttsv1(node_dict, edge_dict, 3, a), np.einsum("ijk,j,k->i", T, a, a)
+    )
+    Y = ttsv2(None, edge_dict, 3, a, 8).toarray()
+    assert np.allclose(Y, np.einsum("ijk,k->ij", T, a))
+    assert np.allclose(np.diag(Y), 0)
@@ -5,12 +5,14 @@ from warnings import warn
 import networkx as nx
 import numpy as np
 from numpy.linalg import norm
-from scipy.sparse.linalg import eigsh
+from scipy.sparse import eye_array
+from scipy.sparse.linalg import cg, eigsh
 
 from ..convert import to_line_graph
 from ..exception import XGIError
 from ..linalg import clique_motif_matrix, incidence_matrix
-from ..utils import convert_labels_to_integers, pairwise_incidence, ttsv1, ttsv2
+from ..utils import convert_labels_to_integers, csr_incidence
+from ..utils.tensor import _edges_by_size, _ttsv1, _ttsv2
 from .connected import is_connected
 from .properties import is_uniform
 
@@ -213,7 +215,7 @@ def line_vector_centrality(H):
     return vc
 
 
-def katz_centrality(H, cutoff=100):
+def katz_centrality(H, cutoff=100, tol=1e-12, method="series", initial=None):
     r"""Returns the Katz-centrality vector of a non-empty hypergraph H.
 
     The Katz-centrality measures the relative importance of a node by counting
@@ -229,7 +231,19 @@ def katz_centrality(H, cutoff=100):
         Hypergraph on which to compute the Katz-centralities.
     cutoff : int
         Power at which to stop the series :math:`A + \alpha A^2 + \alpha^2 A^3 + \dots`
-        Default value is 100.
+        Default value is 100.  With the "solve" method, the maximum number of
+        iterations of the solver.
+    tol : float, optional
+        The iterations stop when the 1-norm of the update of the (unnormalized)
+        centralities is below `tol` times their 1-norm.  By default, 1e-12.
+    method : {"series", "solve"}, optional
+        If "series" (default), sum the series with sparse matrix-vector products.  If
+        "solve", solve the linear system :math:`(I - \alpha A) c = A{\bf 1}/n` with the
+        conjugate gradient method.
+    initial : dict, optional
+        Centralities from which to start the iterations, such as the output of a
+        previous call on a slightly different hypergraph.  Missing nodes start at 0.
+        By default, the iterations start from the first term of the series.
 
     Returns
     -------
@@ -240,7 +254,7 @@ def katz_centrality(H, cutoff=100):
     Raises
     ------
     XGIError
-        If the hypergraph is empty.
+        If the hypergraph is empty or if the method is not recognized.
 
     Notes
     -----
@@ -266,6 +280,10 @@ def katz_centrality(H, cutoff=100):
 
     And :math:`(I - \alpha A^{t})^{-1} = I + A + \alpha A^2 + \alpha^2 A^3 + \dots`
     Thus we can use the power series to compute the Katz-centrality.
+    The vector :math:`c = (A + \alpha A^2 + \dots){\bf 1}/n` is the fixed point of
+    :math:`c \leftarrow A{\bf 1}/n + \alpha A c`, so it is computed with one sparse
+    matrix-vector product per term, or equivalently by solving
+    :math:`(I - \alpha A) c = A{\bf 1}/n`. The matrix powers are never formed.
     [2] The Katz-centrality of isolated nodes (no hyperedges contains them) is
     zero. The Katz-centrality of an empty hypergraph is not defined.
 
@@ -274,6 +292,9 @@ def katz_centrality(H, cutoff=100):
     See https://en.wikipedia.org/wiki/Katz_centrality#Alpha_centrality (visited
     May 20 2023) for a clear definition of Katz centrality.
     """
+    if method not in {"series", "solve"}:
+        raise XGIError(f"Unrecognized method {method}")
+
     n = H.num_nodes
     m = H.num_edges
 
@@ -282,13 +303,29 @@ def katz_centrality(H, cutoff=100):
     elif m == 0:
         c = np.zeros(n)
     else:  # there is at least one edge, both N and M are non-zero
-        A = clique_motif_matrix(H)
+        A, nodedict = clique_motif_matrix(H, index=True)
         alpha = 1 / 2**n
-        mat = A
-        for power in range(1, cutoff):
-            mat = alpha * mat.dot(A) + A
-        u = 1 / n * np.ones(n)
-        c = mat.dot(u)
+        b = A.dot(1 / n * np.ones(n))
+
+        c = b
+        if initial is not None:
+            c = np.array([initial.get(nodedict[i], 0) for i in range(n)], dtype=float)
+            # the previous centralities are normalized, rescale them to the size
+            # of the fixed point of c = b + alpha A c
+            scale = 1 - alpha * norm(A.dot(c), 1)
+            c *= norm(b, 1) / scale if scale > 0 else norm(b, 1)
+
+        if method == "series":
+            for _ in range(cutoff - 1):
+                c_new = b + alpha * A.dot(c)
+                converged = norm(c_new - c, 1) <= tol * norm(c_new, 1)
+                c = c_new
+                if converged:
+                    break
+        else:
+            M = eye_array(n, format="csr") - alpha * A
+            c, _ = cg(M, b, x0=c, rtol=tol, atol=0, maxiter=cutoff)
+
         c *= 1 / norm(c, 1)
     nodedict = dict(zip(range(n), H.nodes))
     return {nodedict[idx]: c[idx] for idx in nodedict}
@@ -349,31 +386,28 @@ def h_eigenvector_centrality(H, max_iter=100, tol=1e-6):
     if not is_connected(H):
         return {n: np.nan for n in H.nodes}
 
-    new_H = convert_labels_to_integers(H, "old-label")
-    edge_dict = new_H.edges.members(dtype=dict)
-    node_dict = new_H.nodes.memberships()
-    r = new_H.edges.size.max()
+    inc = csr_incidence(H)
+    groups = _edges_by_size(inc.edge_ptr, inc.edge_nodes)
+    n = inc.num_nodes
+    r = max(groups)
 
-    x = np.random.uniform(size=(new_H.num_nodes))
+    x = np.random.uniform(size=n)
     x = x / norm(x, 1)
-    y = np.abs(np.array(ttsv1(node_dict, edge_dict, r, x)))
+    y = np.abs(_ttsv1(groups, n, r, x))
 
     converged = False
     it = 0
     while it < max_iter and not converged:
-        y_scaled = [_y ** (1 / (r - 1)) for _y in y]
+        y_scaled = y ** (1 / (r - 1))
         x = y_scaled / norm(y_scaled, 1)
-        y = np.abs(np.array(ttsv1(node_dict, edge_dict, r, x)))
-        s = [a / (b ** (r - 1)) for a, b in zip(y, x)]
+        y = np.abs(_ttsv1(groups, n, r, x))
+        s = y / x ** (r - 1)
         if (np.max(s) - np.min(s)) / np.min(s) < tol:
             break
         it += 1
     else:
         warn("Iteration did not converge!")
-    return {
-        new_H.nodes[n]["old-label"]: c.item()
-        for n, c in zip(new_H.nodes, x / norm(x, 1))
-    }
+    return dict(zip(inc.node_ids, (x / norm(x, 1)).tolist()))
 
 
 def z_eigenvector_centrality(H, max_iter=100, tol=1e-6):
@@ -432,23 +466,20 @@ def z_eigenvector_centrality(H, max_iter=100, tol=1e-6):
     # this metric doesn't make sense and should return nan.
     if not is_connected(H):
         return {n: np.nan for n in H.nodes}
-    new_H = convert_labels_to_integers(H, "old-label")
-    max_size = new_H.edges.size.max()
-    edge_dict = new_H.edges.members(dtype=dict)
-    pairs_dict = pairwise_incidence(edge_dict, max_size)
-
-    r = H.edges.size.max()
+    inc = csr_incidence(H)
+    groups = _edges_by_size(inc.edge_ptr, inc.edge_nodes)
+    r = max(groups)
 
     def LR_evec(A):
         """Compute the largest real eigenvalue of the matrix A"""
         _, v = eigsh(A, k=1, which="LM", tol=1e-5, maxiter=200)
-        evec = np.array([_v for _v in v[:, 0]])
+        evec = v[:, 0]
         if evec[0] < 0:
             evec = -evec
         return evec / norm(evec, 1)
 
     def f(u):
-        return LR_evec(ttsv2(pairs_dict, edge_dict, r, u, n)) - u
+        return LR_evec(_ttsv2(groups, n, r, u)) - u
 
     x = np.ones(n) / n
 
@@ -457,17 +488,14 @@ def z_eigenvector_centrality(H, max_iter=100, tol=1e-6):
     it = 0
     while it < max_iter and not converged:
         x_new = x + h * f(x)
-        s = np.array([a / b for a, b in zip(x_new, x)])
+        s = x_new / x
         if (np.max(s) - np.min(s)) / np.min(s) < tol:
             break
         x = x_new
         it += 1
     else:
         warn("Iteration did not converge!")
-    return {
-        new_H.nodes[n]["old-label"]: c.item()
-        for n, c in zip(new_H.nodes, x / norm(x, 1))
-    }
+    return dict(zip(inc.node_ids, (x / norm(x, 1)).tolist()))
 
 
 def uniform_h_eigenvector_centrality(H, max_iter=100, tol=1e-6):
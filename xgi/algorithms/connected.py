@@ -1,7 +1,12 @@
 """Algorithms related to connected components of a hypergraph."""
 
+import numpy as np
+from scipy.sparse import bmat
+from scipy.sparse.csgraph import connected_components as _csgraph_components
+
 from ..core.globalviews import subhypergraph
 from ..exception import XGIError
+from ..utils import csr_incidence
 
 __all__ = [
     "is_connected",
@@ -74,12 +79,9 @@ def connected_components(H):
     [50]
 
     """
-    seen = set()
-    for v in H:
-        if v not in seen:
-            c = _plain_bfs(H, v)
-            seen.update(c)
-            yield c
+    node_ids = csr_incidence(H).node_ids
+    for members in _components(H):
+        yield {node_ids[i] for i in members.tolist()}
 
 
 def number_connected_components(H):
@@ -111,14 +113,7 @@ def number_connected_components(H):
     1
 
     """
-    num_cc = 0
-    seen = set()
-    for v in H:
-        if v not in seen:
-            c = _plain_bfs(H, v)
-            seen.update(c)
-            num_cc += 1
-    return num_cc
+    return len(_components(H))
 
 
 def largest_connected_component(H):
@@ -231,18 +226,44 @@ def largest_connected_hypergraph(H, in_place=False):
 
 
 def _plain_bfs(H, source):
-    """A fast BFS node generator
+    """The set of nodes reachable from `source`.
+
+    Runs a level-synchronous BFS over the incidence arrays of `H`, see
+    :meth:`~xgi.utils.incidence.CSRIncidence.bfs`.
+
+    """
+    inc = csr_incidence(H)
+    dist = inc.bfs(inc.node_index[source])
+    node_ids = inc.node_ids
+    return {node_ids[i] for i in np.flatnonzero(dist >= 0).tolist()}
+
+
+def _components(H):
+    """The node indices of each connected component of `H`.
+
+    The components are labelled in one pass over the bipartite node-edge graph, and
+    are listed in the order of their first node in `H.nodes`.
+
+    Returns
+    -------
+    list of numpy.ndarray
 
-    Source:
-    https://networkx.org/documentation/stable/_modules/networkx/algorithms/components/connected.html
     """
-    seen = set()
-    nextlevel = {source}
-    while nextlevel:
-        thislevel = nextlevel
-        nextlevel = set()
-        for v in thislevel:
-            if v not in seen:
-                seen.add(v)
-                nextlevel.update(H.nodes.neighbors(v))
-    return seen
+    inc = csr_incidence(H)
+    n = inc.num_nodes
+    if n == 0:
+        return []
+
+    I = inc.tocsr(dtype=bool)
+    _, labels = _csgraph_components(bmat([[None, I], [I.T, None]]), directed=False)
+    labels = labels[:n]
+
+    # relabel the components in order of appearance, nodes being first in the graph
+    _, first, labels = np.unique(labels, return_index=True, return_inverse=True)
+    rank = np.empty(len(first), dtype=np.int64)
+    rank[np.argsort(first)] = np.arange(len(first))
+    labels = rank[labels]
+
+    order = np.argsort(labels, kind="stable")
+    bounds = np.cumsum(np.bincount(labels))[:-1]
+    return np.split(order, bounds)
@@ -1,85 +1,87 @@
-"""Algorithms for computing shortest paths in a hypergraph."""
+"""Algorithms for computing shortest paths in a hypergraph.
+
+The distances are computed with level-synchronous breadth-first searches over the
+incidence arrays of the hypergraph.  The all-pairs functions can distribute the
+sources over a pool of processes with the `n_jobs` argument.  In that case, the
+incidence arrays are placed in shared memory once and attached by each worker, instead
+of being pickled with every task.
+
+"""
+
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing.shared_memory import SharedMemory
 
 import numpy as np
 
-from ..utils import utilities
+from ..exception import IDNotFound
+from ..utils import csr_incidence
+from ..utils.incidence import _bfs
+from ..utils.utilities import _num_workers
+
+__all__ = [
+    "single_source_shortest_path_length",
+    "shortest_path_length",
+    "distance_matrix",
+]
 
-__all__ = ["single_source_shortest_path_length", "shortest_path_length"]
 
+def _distances_dict(inc, dist):
+    """Convert an array of BFS distances to a dict, unreachable nodes being at inf."""
+    return {
+        node: d if d >= 0 else np.inf for node, d in zip(inc.node_ids, dist.tolist())
+    }
 
-def single_source_shortest_path_length(H, source):
+
+def single_source_shortest_path_length(H, source, cutoff=None):
     """
     Returns the distances from source to every other node in hypergraph H.
 
     Parameters
     ----------
     H : xgi.Hypergraph
-        Hypergraph on which to compute the distances. Node indexes must be integers.
-    source : int
-        Index of the node from which to compute the distance to every other node.
+        Hypergraph on which to compute the distances.
+    source : hashable
+        Node from which to compute the distance to every other node.
+    cutoff : int, optional
+        Only compute the distances up to `cutoff`.  If None (default), there is no
+        limit.
 
     Returns
     -------
     dists : dict
         Dictionary where keys are node indexes and values are the distances from source.
-    """
+        Nodes that cannot be reached from source (within `cutoff` steps) are at
+        distance `np.inf`.
 
-    # 1. Mark all nodes unvisited.
-    is_unseen = dict()
-    for node in H.nodes:
-        is_unseen[node] = True
-    n_unseen = len(H.nodes)
-
-    # 2. Assign to every node a tentative distance value.
-    dists = dict()
-    for node in H.nodes:
-        dists[node] = np.inf
-    dists[source] = 0
-    is_unseen[source] = False
-    n_unseen -= 1
-    current = source
-
-    # 3. Consider all of unvisited neighbors of current node and calculate their tentative distances to the current node.
-    stop_condition = False
-    while not stop_condition:
-        for ngb in H.nodes.neighbors(current):
-            if is_unseen[ngb]:
-                increment = 1  # increment = weight(ngb, current) if weighted
-                new_dist = dists[current] + increment
-                if new_dist < dists[ngb]:
-                    dists[ngb] = new_dist
-                else:
-                    pass
-            else:
-                pass
+    Raises
+    ------
+    IDNotFound
+        If source is not in the hypergraph.
 
-        # 4. Mark the current node as visited and remove it from the unvisited set.
-        is_unseen[current] = False
-        n_unseen -= 1
-
-        # 5. Check for stop condition.
-        stop_condition = (n_unseen == 0) or (
-            utilities.min_where(dists, is_unseen) == np.inf
-        )
-
-        # 6. Otherwise, select the unvisited node that is marked with the smallest tentative distance, set it as the new current node, and go back to step 3.
-        min_val = np.inf
-        argmin = current
-        for node in dists.keys():
-            if is_unseen[node]:
-                if dists[node] < min_val:
-                    min_val = dists[node]
-                    argmin = node
-                else:
-                    pass
-            else:
-                pass
-        current = argmin
+    Notes
+    -----
+    The distances are computed with a level-synchronous breadth-first search over
+    the incidence arrays of the hypergraph, which takes O(n + m + nnz) time.
+
+    Examples
+    --------
+    >>> import xgi
+    >>> H = xgi.Hypergraph([[1, 2], [2, 3, 4], [5, 6]])
+    >>> xgi.single_source_shortest_path_length(H, 1)
+    {1: 0, 2: 1, 3: 2, 4: 2, 5: inf, 6: inf}
+    >>> xgi.single_source_shortest_path_length(H, 1, cutoff=1)
+    {1: 0, 2: 1, 3: inf, 4: inf, 5: inf, 6: inf}
 
-    return dists
+    """
+    inc = csr_incidence(H)
+    try:
+        index = inc.node_index[source]
+    except KeyError as e:
+        raise IDNotFound(f"Node {source} not in the hypergraph") from e
+    return _distances_dict(inc, inc.bfs(index, cutoff=cutoff))
 
 
-def shortest_path_length(H):
+def shortest_path_length(H, cutoff=None, n_jobs=None, batch_size=None):
     """
     Returns a generator of tuples (source, dists) where dists is a dictonary
     containing the distances from source to every other node in hypergraph H,
@@ -88,14 +90,207 @@ def shortest_path_length(H):
     Parameters
     ----------
     H : xgi.Hypergraph
-        Hypergraph on which to compute the distances. Node indexes must be integers.
+        Hypergraph on which to compute the distances.
+    cutoff : int, optional
+        Only compute the distances up to `cutoff`.  If None (default), there is no
+        limit.
+    n_jobs : int, optional
+        Number of processes computing the distances.  If None (default) or 1, they are
+        computed in the current process.  If -1, all the CPUs are used.
+    batch_size : int, optional
+        Number of sources handled by each task when `n_jobs` is not None.  By default,
+        the sources are split in about four batches per process.
 
     Returns
     -------
     paths : generator of tuples
-        Every tuple is of the form (source, dict_of_lengths), for every possible source.
+        Every tuple is of the form (source, dict_of_lengths), for every possible source,
+        in the order of `H.nodes`.  The results are streamed as the batches of sources
+        are completed.
+
+    See Also
+    --------
+    single_source_shortest_path_length
+    distance_matrix
+
+    """
+    inc = csr_incidence(H)
+    for start, rows in _distance_rows(inc, cutoff, n_jobs, batch_size):
+        for i, dist in enumerate(rows, start):
+            yield (inc.node_ids[i], _distances_dict(inc, dist))
+
+
+def distance_matrix(H, cutoff=None, n_jobs=None, batch_size=None, index=False):
+    """The matrix of the distances between all the pairs of nodes.
+
+    Parameters
+    ----------
+    H : xgi.Hypergraph
+        Hypergraph on which to compute the distances.
+    cutoff : int, optional
+        Only compute the distances up to `cutoff`.  If None (default), there is no
+        limit.
+    n_jobs : int, optional
+        Number of processes computing the distances.  If None (default) or 1, they are
+        computed in the current process.  If -1, all the CPUs are used.
+    batch_size : int, optional
+        Number of sources handled by each task when `n_jobs` is not None.  By default,
+        the sources are split in about four batches per process.
+    index : bool, default: False
+        Specifies whether to output a dictionary mapping indices to node IDs.
+
+    Returns
+    -------
+    D : numpy.ndarray
+        Array of dimension (n_nodes, n_nodes) such that `D[i, j]` is the distance from
+        node i to node j, or -1 if j cannot be reached from i (within `cutoff` steps).
+        The type of the entries is int16 unless the distances may exceed its range,
+        in which case it is int32.
+    rowdict : dict
+        The dictionary mapping indices to node IDs, if index is True.
+
+    See Also
+    --------
+    shortest_path_length
+
+    Notes
+    -----
+    When `n_jobs` is set, the workers write the rows of the matrix directly in a
+    shared memory block, so the distances are never pickled.
+
+    Examples
+    --------
+    The average shortest path length and the eccentricity of the nodes can be read
+    from the distance matrix.
+
+    >>> import xgi
+    >>> H = xgi.Hypergraph([[1, 2], [2, 3, 4], [4, 5]])
+    >>> D = xgi.distance_matrix(H)
+    >>> D
+    array([[0, 1, 2, 2, 3],
+           [1, 0, 1, 1, 2],
+           [2, 1, 0, 1, 2],
+           [2, 1, 1, 0, 1],
+           [3, 2, 2, 1, 0]], dtype=int16)
+    >>> D.max(axis=1)
+    array([3, 2, 2, 2, 3], dtype=int16)
+    >>> float(D.sum() / (len(D) * (len(D) - 1)))
+    1.6
+
     """
+    inc = csr_incidence(H)
+    n = inc.num_nodes
+    longest = n if cutoff is None else min(n, cutoff)
+    dtype = np.int16 if longest < np.iinfo(np.int16).max else np.int32
+
+    if _num_workers(n_jobs) == 1:
+        D = np.empty((n, n), dtype=dtype)
+        for start, rows in _distance_rows(inc, cutoff, None, batch_size):
+            D[start : start + len(rows)] = rows
+    else:
+        out = SharedMemory(create=True, size=max(n * n * np.dtype(dtype).itemsize, 1))
+        try:
+            shared = np.ndarray((n, n), dtype=dtype, buffer=out.buf)
+            for _ in _distance_rows(inc, cutoff, n_jobs, batch_size, out, dtype):
+                pass
+            D = shared.copy()
+            del shared
+        finally:
+            out.close()
+            out.unlink()
+
+    rowdict = dict(enumerate(inc.node_ids))
+    return (D, rowdict) if index else D
+
+
+def _distance_rows(inc, cutoff, n_jobs, batch_size, out=None, dtype=None):
+    """Generator of the BFS distances from each node, by batches of sources.
+
+    Yields tuples (start, rows), where `rows` are the distances from the sources with
+    indices `start, start + 1, ...`, in order.  If `out` is a shared memory block, the
+    workers write the rows in it and `rows` is empty.
+
+    """
+    n = inc.num_nodes
+    arrays = (inc.node_ptr, inc.node_edges, inc.edge_ptr, inc.edge_nodes)
+    workers = _num_workers(n_jobs)
+
+    if batch_size is None:
+        batch_size = max(1, -(-n // (4 * workers)))
+    starts = range(0, n, batch_size)
+
+    if workers == 1:
+        for start in starts:
+            stop = min(start + batch_size, n)
+            yield start, [_bfs(*arrays, i, cutoff) for i in range(start, stop)]
+        return
+
+    shm, layout = _share(arrays)
+    out_spec = None if out is None else (out.name, (n, n), np.dtype(dtype).str)
+    try:
+        with ProcessPoolExecutor(
+            max_workers=workers,
+            initializer=_init_worker,
+            initargs=(shm.name, layout, cutoff, out_spec),
+        ) as executor:
+            batches = ((start, min(start + batch_size, n)) for start in starts)
+            for start, rows in zip(starts, executor.map(_bfs_batch, batches)):
+                yield start, rows
+    finally:
+        shm.close()
+        shm.unlink()
+
+
+def _share(arrays):
+    """Copy arrays into a new shared memory block.
+
+    Returns
+    -------
+    shm : multiprocessing.shared_memory.SharedMemory
+        The block, which must be closed and unlinked by the caller.
+    layout : list of tuples
+        The (offset, shape, dtype) of each array in the block.
+
+    """
+    size = sum(arr.nbytes for arr in arrays)
+    shm = SharedMemory(create=True, size=max(size, 1))
+    layout = []
+    offset = 0
+    for arr in arrays:
+        view = np.ndarray(arr.shape, dtype=arr.dtype, buffer=shm.buf, offset=offset)
+        view[...] = arr
+        del view
+        layout.append((offset, arr.shape, arr.dtype.str))
+        offset += arr.nbytes
+    return shm, layout
+
+
+_worker = {}
+
+
+def _init_worker(name, layout, cutoff, out_spec):
+    """Attach a worker process to the shared incidence arrays."""
+    shm = SharedMemory(name=name)
+    _worker["shm"] = shm
+    _worker["arrays"] = [
+        np.ndarray(shape, dtype=dtype, buffer=shm.buf, offset=offset)
+        for offset, shape, dtype in layout
+    ]
+    _worker["cutoff"] = cutoff
+    if out_spec is not None:
+        out_name, shape, dtype = out_spec
+        out = SharedMemory(name=out_name)
+        _worker["out_shm"] = out
+        _worker["out"] = np.ndarray(shape, dtype=dtype, buffer=out.buf)
+
 
-    for source in H.nodes:
-        dists = single_source_shortest_path_length(H, source)
-        yield (source, dists)
+def _bfs_batch(bounds):
+    """Distances from the sources with indices in [start, stop), in a worker."""
+    start, stop = bounds
+    arrays, cutoff = _worker["arrays"], _worker["cutoff"]
+    out = _worker.get("out")
+    if out is None:
+        return [_bfs(*arrays, i, cutoff) for i in range(start, stop)]
+    for i in range(start, stop):
+        out[i] = _bfs(*arrays, i, cutoff)
+    return []
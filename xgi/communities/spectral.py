@@ -1,18 +1,21 @@
 """Community detection via clustering of Laplacian eigenvectors."""
 
 import numpy as np
-from scipy.sparse.linalg import eigsh
+from scipy.sparse.linalg import LinearOperator, eigsh
 
 from ..exception import XGIError
-from ..linalg.laplacian_matrix import normalized_hypergraph_laplacian
+from ..linalg.hypergraph_matrix import incidence_matrix
 
 __all__ = [
     "spectral_clustering",
 ]
 
+# below this number of nodes, the eigenvectors are computed with a dense solver
+_DENSE_MAX_NODES = 500
 
-def spectral_clustering(H, k=2, max_iter=1_000, seed=None):
-    """Computes a spectral clustering in :math:`k` partitions of the input
+
+def spectral_clustering(H, k=2, max_iter=1_000, seed=None, n_init=4, batch_size=None):
+    r"""Computes a spectral clustering in :math:`k` partitions of the input
     hypergraph according to the heuristic presented in [1].
 
     This is done by computing the normalized Laplacian of the input hypergraph
@@ -31,6 +34,13 @@ def spectral_clustering(H, k=2, max_iter=1_000, seed=None):
         Maximum number of cluster updates to compute, default 1,000.
     seed : int, optional
         Seed used to initialize clusters, optional.
+    n_init : int, optional
+        Number of runs of :math:`k`-means with different initial centroids, of
+        which the one with the lowest inertia is kept, default 4.
+    batch_size : int, optional
+        If given, :math:`k`-means updates the centroids from random batches of this
+        number of nodes instead of all the nodes, which is faster but less accurate
+        for large hypergraphs.  By default, None.
 
     Returns
     -------
@@ -40,8 +50,17 @@ def spectral_clustering(H, k=2, max_iter=1_000, seed=None):
     Raises
     ------
     XGIError
-        If more groups are specified than nodes in the hypergraph.
+        If more groups are specified than nodes in the hypergraph, or if there are
+        isolated nodes.
 
+    Notes
+    -----
+    The normalized Laplacian is :math:`L = I - \Theta`, where
+    :math:`\Theta = D_v^{-1/2} I D_e^{-1} I^T D_v^{-1/2}`.  The eigenvectors of the
+    :math:`k` smallest eigenvalues of :math:`L` are those of the :math:`k` largest
+    eigenvalues of :math:`\Theta`, which are computed with a sparse eigensolver
+    that only multiplies vectors by the incidence matrix, so that neither
+    :math:`L` nor :math:`\Theta` is formed.
 
     References
     ----------
@@ -55,37 +74,104 @@ def spectral_clustering(H, k=2, max_iter=1_000, seed=None):
             "The number of desired clusters cannot exceed the number of nodes!"
         )
 
-    # Compute normalize Laplacian and its spectra
-    L, rowdict = normalized_hypergraph_laplacian(H, index=True)
-    evals, eigs = eigsh(L, k=k, which="SA")
+    I, rowdict, _ = incidence_matrix(H, sparse=True, index=True)
+    if not np.diff(I.indptr).all():
+        raise XGIError(
+            "Every node must be a member of an edge to avoid divide by zero error!"
+        )
+
+    rng = np.random.default_rng(seed=seed)
 
     # Form metric space representation
-    X = np.array(eigs)
+    X = _top_eigenvectors(_theta(I), k, rng)
 
     # Apply k-means clustering
-    _clusters = _kmeans(X, k, max_iter, seed)
+    labels = _kmeans(X, k, max_iter, rng, n_init=n_init, batch_size=batch_size)
 
     # Remap to node ids
-    clusters = {rowdict[id]: cluster for id, cluster in _clusters.items()}
+    return {rowdict[i]: cluster for i, cluster in labels.items()}
 
-    return clusters
 
+def _theta(I):
+    r"""The operator :math:`D_v^{-1/2} I D_e^{-1} I^T D_v^{-1/2}` of an incidence matrix.
 
-def _kmeans(X, k, max_iter=1_000, seed=None):
-    """Simple k-means clustering of vectors X.
+    Parameters
+    ----------
+    I : scipy.sparse.csr_array
+        The incidence matrix, with nodes as rows and edges as columns.
 
-    Uses Forgy method for selecting initial centroids.
+    Returns
+    -------
+    scipy.sparse.linalg.LinearOperator
+
+    """
+    I = I.astype(float)
+    dv = 1 / np.sqrt(I.sum(axis=1))
+    de = 1 / I.sum(axis=0)
+    IT = I.T.tocsr()
+    n = I.shape[0]
+
+    def matmat(x):
+        x = x.reshape(n, -1)
+        y = dv[:, None] * x
+        y = I @ (de[:, None] * (IT @ y))
+        return dv[:, None] * y
+
+    return LinearOperator(
+        (n, n),
+        matvec=lambda x: matmat(x).ravel(),
+        matmat=matmat,
+        rmatvec=lambda x: matmat(x).ravel(),
+        dtype=float,
+    )
+
+
+def _top_eigenvectors(A, k, rng):
+    """The eigenvectors of the `k` largest eigenvalues of a symmetric operator.
 
     Parameters
     ----------
-    X : (n, k) array
+    A : scipy.sparse.linalg.LinearOperator
+        The operator.
+    k : int
+        Number of eigenvectors.
+    rng : numpy.random.Generator
+        The starting vector of the eigensolver is drawn from it.
+
+    Returns
+    -------
+    (n, k) array
+
+    """
+    n = A.shape[0]
+    if n <= _DENSE_MAX_NODES or k >= n - 1:
+        _, vecs = np.linalg.eigh(A @ np.eye(n))
+        return vecs[:, n - k :]
+    _, vecs = eigsh(A, k=k, which="LA", v0=rng.random(n))
+    return vecs
+
+
+def _kmeans(X, k, max_iter=1_000, seed=None, n_init=1, batch_size=None):
+    """Vectorized k-means clustering of vectors X.
+
+    Uses k-means++ for selecting initial centroids.
+
+    Parameters
+    ----------
+    X : (n, d) array
         Vectors to cluster.
     k : int
         Number of clusters to find.
     max_iter : int, optional.
-        Maximum number of cluster updates to compute, default 10,000.
-    seed : int, optional
+        Maximum number of cluster updates to compute, default 1,000.
+    seed : int or numpy.random.Generator, optional
         Seed used to initialize clusters, optional.
+    n_init : int, optional
+        Number of runs with different initial centroids, of which the one with the
+        lowest inertia is kept, default 1.
+    batch_size : int, optional
+        If given, each update uses a random batch of this number of vectors
+        (mini-batch k-means).  By default, None.
 
     Returns
     -------
@@ -93,43 +179,99 @@ def _kmeans(X, k, max_iter=1_000, seed=None):
         A dictionary mapping node ids to their clusters. Clusters begin at 0.
     """
     rng = np.random.default_rng(seed=seed)
+    X = np.asarray(X, dtype=float)
+    n = X.shape[0]
 
     # Handle edge cases
     if k == 1:
-        return {node_idx: 1 for node_idx in range(X.shape[0])}
-
-    # Initialize stopping criterion
-    num_cluster_changes = np.inf
-    num_iterations = 0
-
-    # Instantiate random centers
-    centroids = rng.choice(X, size=k, replace=False)
-
-    # Instantiate random clusters
-    previous_clusters = {node: rng.integers(0, k) for node in range(X.shape[0])}
-
-    # Iterate main kmeans computation
-    while (num_cluster_changes > 0) and (num_iterations < max_iter):
-        # Find nearest centroid to each point
-        clusters = dict()
-        vectors = {cluster: [] for cluster in range(k)}
-        for node, vector in enumerate(X):
-            distances = [np.linalg.norm(vector - centroid) for centroid in centroids]
-            closest_centroid = np.argmin(distances)
-            clusters[node] = closest_centroid
-            vectors[closest_centroid].append(vector)
-
-        # Update centroids
-        centroids = [np.mean(vectors[cluster_id]) for cluster_id in vectors]
-
-        # Update convergence condition
-        cluster_changes = {
-            node: clusters[node] != previous_clusters[node]
-            for node in range(X.shape[0])
-        }
-        num_cluster_changes = len(
-            list(filter(lambda diff: diff, cluster_changes.values()))
+        return dict.fromkeys(range(n), 0)
+
+    X_sq = np.einsum("ij,ij->i", X, X)
+    best_labels, best_inertia = None, np.inf
+    for _ in range(n_init):
+        centroids = _kmeans_plus_plus(X, X_sq, k, rng)
+        if batch_size is None:
+            labels, dist = _lloyd(X, X_sq, centroids, max_iter)
+        else:
+            centroids = _minibatch(X, X_sq, centroids, max_iter, batch_size, rng)
+            labels, dist = _closest(X, X_sq, centroids)
+        inertia = dist.sum()
+        if inertia < best_inertia:
+            best_labels, best_inertia = labels, inertia
+
+    return dict(enumerate(best_labels.tolist()))
+
+
+def _closest(X, X_sq, centroids):
+    """The closest centroid to each vector and the squared distance to it."""
+    dist = X_sq[:, None] - 2 * (X @ centroids.T) + (centroids**2).sum(axis=1)
+    labels = np.argmin(dist, axis=1)
+    return labels, np.maximum(dist[np.arange(len(X)), labels], 0)
+
+
+def _kmeans_plus_plus(X, X_sq, k, rng):
+    """Initial centroids drawn with probability proportional to squared distance."""
+    n = X.shape[0]
+    centroids = np.empty((k, X.shape[1]))
+    centroids[0] = X[rng.integers(n)]
+    dist = np.maximum(X_sq - 2 * (X @ centroids[0]) + centroids[0] @ centroids[0], 0)
+    for j in range(1, k):
+        cumulative = np.cumsum(dist)
+        if cumulative[-1] > 0:
+            i = np.searchsorted(cumulative, rng.random() * cumulative[-1], side="right")
+            i = min(i, n - 1)
+        else:
+            i = rng.integers(n)
+        centroids[j] = X[i]
+        new = np.maximum(X_sq - 2 * (X @ centroids[j]) + centroids[j] @ centroids[j], 0)
+        np.minimum(dist, new, out=dist)
+    return centroids
+
+
+def _lloyd(X, X_sq, centroids, max_iter):
+    """Lloyd iterations until no vector changes cluster."""
+    k = len(centroids)
+    labels = None
+    for _ in range(max_iter):
+        new_labels, dist = _closest(X, X_sq, centroids)
+        if labels is not None and np.array_equal(new_labels, labels):
+            break
+        labels = new_labels
+        counts = np.bincount(labels, minlength=k)
+        sums = np.stack(
+            [np.bincount(labels, weights=col, minlength=k) for col in X.T], axis=1
         )
-        num_iterations += 1
+        nonempty = counts > 0
+        centroids[nonempty] = sums[nonempty] / counts[nonempty, None]
+
+        # an empty cluster restarts from the vector farthest from its centroid
+        for j in np.flatnonzero(~nonempty):
+            i = np.argmax(dist)
+            centroids[j] = X[i]
+            dist[i] = 0
+    return labels, dist
+
 
-    return clusters
+def _minibatch(X, X_sq, centroids, max_iter, batch_size, rng):
+    """Mini-batch updates of the centroids, as in Sculley (2010)."""
+    k = len(centroids)
+    n = X.shape[0]
+    counts = np.zeros(k)
+    for _ in range(max_iter):
+        batch = rng.integers(n, size=min(batch_size, n))
+        labels, _ = _closest(X[batch], X_sq[batch], centroids)
+        batch_counts = np.bincount(labels, minlength=k)
+        sums = np.stack(
+            [np.bincount(labels, weights=col, minlength=k) for col in X[batch].T],
+            axis=1,
+        )
+        counts += batch_counts
+        updated = batch_counts > 0
+        # moving average of the vectors assigned to each centroid so far
+        step = (sums[updated] - batch_counts[updated, None] * centroids[updated]) / (
+            counts[updated, None]
+        )
+        centroids[updated] += step
+        if np.abs(step).max(initial=0) < 1e-10:
+            break
+    return centroids
@@ -2,6 +2,7 @@
 
 from ..core import DiHypergraph, Hypergraph
 from ..exception import XGIError
+from ..utils import update_uid_counter
 
 __all__ = ["from_bipartite_edgelist", "to_bipartite_edgelist"]
 
@@ -32,8 +33,7 @@ def from_bipartite_edgelist(edges):
         return H
     elif len(edges[0]) == 2:  # undirected
         H = Hypergraph()
-        for n, e in edges:
-            H.add_node_to_edge(e, n)
+        _add_bipartite_edges(H, edges)
         return H
     else:
         raise XGIError(
@@ -71,3 +71,45 @@ def to_bipartite_edgelist(H):
         return edgelist
 
     return [(n, e) for e, edge in H.edges.members(dtype=dict).items() for n in edge]
+
+
+def _add_bipartite_edges(H, pairs):
+    """Add (node, edge) pairs to a hypergraph, as `add_node_to_edge` would.
+
+    The pairs are added in a single pass over the storage of the hypergraph, and
+    the nodes and the new edges are added in order of appearance.
+
+    Parameters
+    ----------
+    H : Hypergraph
+        The hypergraph to add the pairs to.
+    pairs : list of tuples
+        The (node, edge) pairs.
+
+    """
+    index = H._modify_edges()
+    node_dict, node_attr = H._node, H._node_attr
+    edge_dict, edge_attr = H._edge, H._edge_attr
+    new_edges = []
+    for n, e in pairs:
+        memberships = node_dict.get(n)
+        if memberships is None:
+            memberships = node_dict[n] = set()
+            node_attr[n] = H._node_attr_dict_factory()
+        members = edge_dict.get(e)
+        if members is None:
+            members = edge_dict[e] = set()
+            edge_attr[e] = H._edge_attr_dict_factory()
+            new_edges.append(e)
+        members.add(n)
+        memberships.add(e)
+
+    for e in new_edges:
+        update_uid_counter(H, e)
+    if index is not None:
+        new_edges = set(new_edges)
+        for e in dict.fromkeys(e for _, e in pairs):
+            if e in new_edges:
+                index.add(e, frozenset(edge_dict[e]))
+            else:
+                index.move(e, frozenset(edge_dict[e]))
@@ -1,11 +1,17 @@
+from itertools import combinations
+from math import comb
+
 import networkx as nx
+import numpy as np
+from scipy.sparse import csr_array
 
 from ..exception import XGIError
+from ..utils import csr_incidence
 
 __all__ = ["to_encapsulation_dag", "empirical_subsets_filter"]
 
 
-def to_encapsulation_dag(H, subset_types="all"):
+def to_encapsulation_dag(H, subset_types="all", sparse=False, index=False):
     """The encapsulation DAG (Directed Acyclic Graph) of
     the hypergraph H.
 
@@ -32,11 +38,29 @@ def to_encapsulation_dag(H, subset_types="all"):
           encapsulate hyperedegs of size 3, which will be included if
           using this setting (whereas relationships with subsets of size 2
           would not be included).
+    sparse : bool, default: False
+        If True, returns the adjacency matrix of the DAG as a scipy sparse array
+        instead of a NetworkX graph.  Its rows and columns follow the order of
+        `H.edges`, and entry (i, j) is 1 if hyperedge i encapsulates hyperedge j.
+    index : bool, default: False
+        Specifies whether to output a dictionary mapping indices to edge IDs, if
+        `sparse` is True.
 
     Returns
     -------
-    LG : networkx.DiGraph
+    LG : networkx.DiGraph or scipy.sparse.csr_array
          The line graph associated to the Hypergraph
+    coldict : dict
+        The dictionary mapping indices to edge IDs, if `sparse` and `index` are True.
+
+    Notes
+    -----
+    The subsets of each hyperedge are found with one of two strategies, depending
+    on its size.  For small hyperedges, the subsets of the sizes present in `H` are
+    enumerated and looked up in the index of the hyperedges by their members.  For
+    large ones, the overlaps with all the other hyperedges are counted with a sparse
+    product of the incidence matrix, and a hyperedge is a subset if all its members
+    are shared.  Each hyperedge uses the strategy with the fewest steps.
 
     Examples
     --------
@@ -45,13 +69,15 @@ def to_encapsulation_dag(H, subset_types="all"):
     >>> H = xgi.Hypergraph([["a","b","c"], ["b","c","f"], ["a","b"], ["c", "e"], ["a"], ["f"]])
     >>> dag = to_encapsulation_dag(H)
     >>> dag.edges()
-    OutEdgeView([(0, 2), (0, 4), (2, 4), (1, 5)])
+    OutEdgeView([(0, 2), (0, 4), (1, 5), (2, 4)])
     >>> dag = to_encapsulation_dag(H, subset_types="immediate")
     >>> dag.edges()
     OutEdgeView([(0, 2), (2, 4)])
     >>> dag = to_encapsulation_dag(H, subset_types="empirical")
     >>> dag.edges()
-    OutEdgeView([(0, 2), (2, 4), (1, 5)])
+    OutEdgeView([(0, 2), (1, 5), (2, 4)])
+    >>> to_encapsulation_dag(H, sparse=True).nnz
+    4
 
     References
     ----------
@@ -65,112 +91,216 @@ def to_encapsulation_dag(H, subset_types="all"):
             "'all', 'immediate', and 'empirical'."
         )
 
-    # Construct the dag
-    dag = nx.DiGraph()
-    # Loop over hyperedges
-    for he_idx in H.edges:
-        # Add the hyperedge as a node
-        dag.add_node(he_idx)
-        # Get the hyperedge as a set
-        he = H.edges.members(he_idx)
-        # Get candidate encapsulation hyperedges
-        candidates = _get_candidates(subset_types, H, he)
-        # for each candidate
-        candidates_checked = set()
-        for cand_idx in candidates:
-            if cand_idx in candidates_checked:
-                continue
-            cand = H.edges.members(cand_idx)
-            if len(he) > len(cand):
-                if _encapsulated(he, cand):
-                    dag.add_edge(he_idx, cand_idx)
-            elif len(cand) > len(he):
-                if _encapsulated(cand, he):
-                    dag.add_edge(cand_idx, he_idx)
+    inc = csr_incidence(H)
+    m = inc.num_edges
+    sizes = inc.edge_sizes()
+
+    # the sizes of the subsets to look for, for each size of hyperedge
+    present = [k for k in np.unique(sizes).tolist() if k > 0]
+    if subset_types == "immediate":
+        targets = {k: [k - 1] if k - 1 in present else [] for k in present}
+    else:
+        targets = {k: [j for j in present if j < k] for k in present}
+
+    # enumerating the subsets costs one hash lookup per subset, while the sparse
+    # product visits all the memberships of the members, about ten times faster each
+    enum_cost = np.zeros(m, dtype=float)
+    for k, js in targets.items():
+        enum_cost[sizes == k] = sum(comb(k, j) for j in js)
+    degrees = inc.node_degrees()
+    product_cost = np.bincount(
+        inc.edge_of_incidence(), weights=degrees[inc.edge_nodes], minlength=m
+    )
+    has_targets = np.isin(sizes, [k for k, js in targets.items() if js])
+    enumerate_subsets = has_targets & (10 * enum_cost <= product_cost)
+
+    sup, sub = _enumerated_subsets(H, inc, targets, np.flatnonzero(enumerate_subsets))
+    sup2, sub2 = _shared_subsets(
+        inc,
+        subset_types,
+        np.flatnonzero(has_targets & ~enumerate_subsets),
+        product_cost,
+    )
+    sup = np.concatenate([sup, sup2]).astype(np.int64)
+    sub = np.concatenate([sub, sub2]).astype(np.int64)
+    order = np.lexsort((sub, sup))
+    sup, sub = sup[order], sub[order]
 
     # If empirically closest subsets, filter out all edges except those
     # between k and maximum existing k'<k
     if subset_types == "empirical":
-        empirical_subsets_filter(H, dag)
+        keep = _empirical_mask(sup, sub, sizes, m)
+        sup, sub = sup[keep], sub[keep]
+
+    if sparse:
+        A = csr_array((np.ones(len(sup), dtype=int), (sup, sub)), shape=(m, m))
+        return (A, dict(enumerate(inc.edge_ids))) if index else A
 
+    ids = inc.edge_ids
+    dag = nx.DiGraph()
+    dag.add_nodes_from(ids)
+    dag.add_edges_from((ids[i], ids[j]) for i, j in zip(sup.tolist(), sub.tolist()))
     return dag
 
 
-def _encapsulated(larger, smaller):
-    """Test if a larger hyperedge encapsulates a smaller hyperedge.
+def _enumerated_subsets(H, inc, targets, rows):
+    """The encapsulation relations of the hyperedges `rows`, by enumerating subsets.
 
     Parameters
     ----------
-    larger : Set
-        larger hyperedge
-    smaller : Set
-        smaller hyperedge
+    H : Hypergraph
+        The hypergraph
+    inc : CSRIncidence
+        The incidence arrays of `H`
+    targets : dict
+        The sizes of the subsets to look for, keyed by the size of the hyperedge.
+    rows : numpy.ndarray
+        The indices of the hyperedges whose subsets are enumerated.
+
     Returns
     -------
-    _ : Bool
-        True if the size of the intersection between larger and smaller is
-            the same as the size of smaller.
+    sup, sub : numpy.ndarray
+        The indices of the larger and the smaller hyperedge of each relation.
 
     """
-    return len(set(larger).intersection(set(smaller))) == len(smaller)
-
-
-def _get_candidates(subset_types, H, he):
-    """Get the candidate hyperedges for encapsulation by he based on the subset type.
+    sup, sub = [], []
+    if len(rows) == 0:
+        return np.array(sup, dtype=int), np.array(sub, dtype=int)
+
+    fingerprints = H._edge_fingerprints()
+    node_ids, edge_index = inc.node_ids, inc.edge_index
+    ptr, edge_nodes = inc.edge_ptr.tolist(), inc.edge_nodes
+    for i in rows.tolist():
+        members = [node_ids[v] for v in edge_nodes[ptr[i] : ptr[i + 1]].tolist()]
+        for j in targets[len(members)]:
+            for subset in combinations(members, j):
+                key = frozenset(subset)
+                if key in fingerprints:
+                    for idx in fingerprints.get(key):
+                        sup.append(i)
+                        sub.append(edge_index[idx])
+    return np.array(sup, dtype=int), np.array(sub, dtype=int)
+
+
+def _shared_subsets(inc, subset_types, rows, cost, chunk_size=2**22):
+    """The encapsulation relations of the hyperedges `rows`, from overlap counts.
+
+    A hyperedge is a subset of another if they share all its members.  The overlaps
+    are counted by a sparse product, in chunks of rows whose total `cost` is about
+    `chunk_size`.
 
     Parameters
     ----------
+    inc : CSRIncidence
+        The incidence arrays of the hypergraph
     subset_types : str
         Type of subset relationships
-    H : Hypergraph
-        The hypergraph
-    he : Set
-        The hyperedge
+    rows : numpy.ndarray
+        The indices of the hyperedges whose subsets are looked for.
+    cost : numpy.ndarray
+        The number of memberships of the members of each hyperedge, which bounds
+        the number of its overlaps.
+    chunk_size : int, optional
+        The number of overlaps to count at once, by default 2**22.
 
     Returns
     -------
-    candidates : Set
-        A set of hyperedge IDs to check for encapsulation by hyperedge he
+    sup, sub : numpy.ndarray
+        The indices of the larger and the smaller hyperedge of each relation.
 
     """
-    candidates = set()
-    for node in he:
-        for cand_idx in H.nodes.memberships(node):
-            if cand_idx not in candidates:
-                cand = H.edges.members(cand_idx)
-                if _check_candidate(subset_types, he, cand):
-                    candidates.add(cand_idx)
-
-    return candidates
-
-
-def _check_candidate(subset_types, he, cand):
-    """Check whether a hyperedge cand is a candidate to be encapsulated by
-    hyperedge he based on subset_types.
+    sup, sub = [np.array([], dtype=int)], [np.array([], dtype=int)]
+    if len(rows) == 0:
+        return sup[0], sub[0]
+
+    sizes = inc.edge_sizes()
+    E = inc.tocsr().T.tocsr()
+    cumcost = np.cumsum(cost[rows])
+    start = 0
+    while start < len(rows):
+        base = cumcost[start - 1] if start else 0
+        stop = max(np.searchsorted(cumcost, base + chunk_size, "right"), start + 1)
+        chunk = rows[start:stop]
+        C = (E[chunk] @ E.T).tocsr()
+        r = chunk[np.repeat(np.arange(len(chunk)), np.diff(C.indptr))]
+        c = C.indices
+        if subset_types == "immediate":
+            smaller = sizes[r] == sizes[c] + 1
+        else:
+            smaller = sizes[r] > sizes[c]
+        valid = (C.data == sizes[c]) & smaller
+        sup.append(r[valid])
+        sub.append(c[valid])
+        start = stop
+    return np.concatenate(sup), np.concatenate(sub)
+
+
+def _empirical_mask(sup, sub, sizes, m):
+    """The relations kept by :func:`empirical_subsets_filter`.
+
+    The hyperedges are visited in the order in which they are added to the DAG
+    by :func:`to_encapsulation_dag` without the filter: each hyperedge, in the
+    order of the hypergraph, followed by the hyperedges that it encapsulates or
+    that encapsulate it and that are not yet in the DAG.  The relations removed
+    while visiting a hyperedge are not considered afterwards.
 
     Parameters
     ----------
-    subset_types : str
-        Type of subset relationships
-    he : Set
-        The hyperedge
-    cand : Set
-        The candidate
+    sup, sub : numpy.ndarray
+        The indices of the larger and the smaller hyperedge of each relation.
+    sizes : numpy.ndarray
+        The size of each hyperedge.
+    m : int
+        The number of hyperedges.
 
     Returns
     -------
-    is_candidate : bool
-        True if cand is a valid candidate to be encapsulated by he, False
-        otherwise.
+    numpy.ndarray
+        Boolean mask of the relations to keep.
+
     """
-    is_candidate = False
-    if subset_types in ["all", "empirical"]:
-        if len(he) != len(cand):
-            is_candidate = True
-    elif subset_types == "immediate":
-        if len(he) == len(cand) - 1 or len(he) - 1 == len(cand):
-            is_candidate = True
-    return is_candidate
+    keep = [True] * len(sup)
+    sup_list, sub_list = sup.tolist(), sub.tolist()
+    sup_sizes, sub_sizes = sizes[sup].tolist(), sizes[sub].tolist()
+    preds, succs = _group(sub, m), _group(sup, m)
+
+    visited = [False] * m
+    order = []
+    for e in range(m):
+        if not visited[e]:
+            visited[e] = True
+            order.append(e)
+        partners = [sup_list[r] for r in preds[e]] + [sub_list[r] for r in succs[e]]
+        for f in sorted(partners):
+            if not visited[f]:
+                visited[f] = True
+                order.append(f)
+
+    for e in order:
+        # Keep only the superfaces with the minimum size
+        rels = [r for r in preds[e] if keep[r]]
+        if rels:
+            min_sup_size = min(sup_sizes[r] for r in rels)
+            for r in rels:
+                if sup_sizes[r] != min_sup_size:
+                    keep[r] = False
+
+        # Repeat for subsets
+        rels = [r for r in succs[e] if keep[r]]
+        if rels:
+            max_sub_size = max(sub_sizes[r] for r in rels)
+            for r in rels:
+                if sub_sizes[r] != max_sub_size:
+                    keep[r] = False
+    return np.array(keep, dtype=bool)
+
+
+def _group(keys, m):
+    """The positions of each value from 0 to `m - 1` in `keys`, as lists."""
+    order = np.argsort(keys, kind="stable")
+    ptr = np.concatenate([[0], np.cumsum(np.bincount(keys, minlength=m))]).tolist()
+    order = order.tolist()
+    return [order[ptr[i] : ptr[i + 1]] for i in range(m)]
 
 
 def empirical_subsets_filter(H, dag):
@@ -2,10 +2,11 @@
 
 import math
 from collections import defaultdict
+from itertools import islice
 
 from ..core import DiHypergraph, Hypergraph, SimplicialComplex
-from ..utils import IDDict
-from .bipartite_edges import to_bipartite_edgelist
+from ..exception import XGIError
+from .bipartite_edges import _add_bipartite_edges
 
 __all__ = ["to_hif_dict", "from_hif_dict"]
 
@@ -27,71 +28,17 @@ def to_hif_dict(H, convert_nans=False):
     defaultdict
         A dict according to the HIF standard.
     """
-
-    def _replace_nan_with_none(d):
-        new_dict = {}
-        for key, value in d.items():
-            if isinstance(value, float) and math.isnan(value):
-                new_dict[key] = None
-            elif isinstance(value, dict):
-                # Recursively handle nested dictionaries
-                new_dict[key] = _replace_nan_with_none(value)
-            else:
-                new_dict[key] = value
-        return new_dict
-
     data = defaultdict(list)
 
     data["metadata"] = {}
     data["metadata"].update(H._net_attr)
+    data["network-type"] = _hif_network_type(H)
 
-    if isinstance(H, SimplicialComplex):
-        data["network-type"] = "asc"
-    elif isinstance(H, Hypergraph):
-        data["network-type"] = "undirected"
-    elif isinstance(H, DiHypergraph):
-        data["network-type"] = "directed"
-
-    # get node data
-    isolates = set(H.nodes.isolates())
-    nodes_with_attrs = set(n for n in H.nodes if H.nodes[n])
-    for n in isolates.union(nodes_with_attrs):
-        attr = (
-            {
-                "attrs": (
-                    _replace_nan_with_none(H.nodes[n]) if convert_nans else H.nodes[n]
-                )
-            }
-            if H.nodes[n]
-            else {}
-        )
-        data["nodes"].append(IDDict({"node": n}) + attr)
-
-    empty = set(H.edges.empty())
-    edges_with_attrs = set(e for e in H.edges if H.edges[e])
-    for e in empty.union(edges_with_attrs):
-        attr = (
-            {
-                "attrs": (
-                    _replace_nan_with_none(H.edges[e]) if convert_nans else H.edges[e]
-                )
-            }
-            if H.edges[e]
-            else {}
-        )
-        data["edges"].append(IDDict({"edge": e}) + attr)
-
-    # hyperedge dict
-    if data["network-type"] == "directed":
-        _convert_d = lambda d: "tail" if d == "in" else "head"
-        data["incidences"] = [
-            IDDict({"edge": e, "node": n, "direction": _convert_d(d)})
-            for n, e, d in to_bipartite_edgelist(H)
-        ]
-    elif data["network-type"] in {"undirected", "asc"}:
-        data["incidences"] = [
-            IDDict({"edge": e, "node": n}) for n, e in to_bipartite_edgelist(H)
-        ]
+    for key, records in _hif_records(H, convert_nans):
+        records = list(records)
+        # the incidences are always listed
+        if records or key == "incidences":
+            data[key] = records
     return data
 
 
@@ -115,76 +62,221 @@ def from_hif_dict(data, nodetype=None, edgetype=None):
     A Hypergraph, SimplicialComplex, or DiHypergraph object
         The loaded network
     """
+    network_type = data.get("network-type", "undirected")
+    H = _hif_network(network_type)
+    _add_hif_incidences(H, data["incidences"], nodetype, edgetype)
+    return _add_hif_data(H, network_type, data, nodetype, edgetype)
+
 
-    def _empty_edge(network_type):
-        if network_type in {"asc", "undirected"}:
-            return set()
+def _replace_nan_with_none(d):
+    """A copy of the dict `d` with the NaN values, also nested, replaced by None."""
+    new_dict = {}
+    for key, value in d.items():
+        if isinstance(value, float) and math.isnan(value):
+            new_dict[key] = None
+        elif isinstance(value, dict):
+            # Recursively handle nested dictionaries
+            new_dict[key] = _replace_nan_with_none(value)
         else:
-            return (set(), set())
-
-    def _convert_id(i, idtype):
-        if idtype:
-            try:
-                return idtype(i)
-            except ValueError as e:
-                raise TypeError(f"Failed to convert ID {i} to type {idtype}.") from e
+            new_dict[key] = value
+    return new_dict
+
+
+def _hif_network_type(H):
+    """The HIF network type of a higher-order network."""
+    if isinstance(H, SimplicialComplex):
+        return "asc"
+    elif isinstance(H, Hypergraph):
+        return "undirected"
+    elif isinstance(H, DiHypergraph):
+        return "directed"
+
+
+def _hif_records(H, convert_nans=False):
+    """The HIF records of a higher-order network, generated lazily.
+
+    Parameters
+    ----------
+    H: Hypergraph, DiHypergraph, or SimplicialComplex object
+        The specified higher-order network
+    convert_nans: Bool
+        Whether or not to convert attrs with value NaN to None
+
+    Returns
+    -------
+    list of tuples
+        The pairs (key, records) for the keys "nodes", "edges", and "incidences",
+        where `records` is a generator of dicts.  Only the isolated nodes, the empty
+        edges, and the ones with attributes have a record.
+
+    """
+
+    def _attr_records(kind, ids, attrs, listed):
+        for i in ids:
+            attr = attrs[i]
+            if attr:
+                attr = _replace_nan_with_none(attr) if convert_nans else attr
+                yield {kind: i, "attrs": attr}
+            elif i in listed:
+                yield {kind: i}
+
+    def _incidences():
+        if isinstance(H, DiHypergraph):
+            for e, edge in H._edge.items():
+                for n in edge["in"]:
+                    yield {"edge": e, "node": n, "direction": "tail"}
+                for n in edge["out"]:
+                    yield {"edge": e, "node": n, "direction": "head"}
         else:
-            return i
+            for e, edge in H._edge.items():
+                for n in edge:
+                    yield {"edge": e, "node": n}
 
-    _convert_d = lambda d: "in" if d == "tail" else "out"
+    isolates = set(H.nodes.isolates())
+    empty = set(H.edges.empty())
+    return [
+        ("nodes", _attr_records("node", H._node, H._node_attr, isolates)),
+        ("edges", _attr_records("edge", H._edge, H._edge_attr, empty)),
+        ("incidences", _incidences()),
+    ]
 
-    if "network-type" in data:
-        network_type = data["network-type"]
-    else:
-        network_type = "undirected"
 
+def _hif_network(network_type):
+    """An empty network of the given HIF network type."""
     if network_type in {"asc", "undirected"}:
-        H = Hypergraph()
+        return Hypergraph()
     elif network_type == "directed":
-        H = DiHypergraph()
+        return DiHypergraph()
+    raise XGIError(f"Unknown network type {network_type}.")
 
-    # Import network metadata
-    if "metadata" in data:
-        H._net_attr.update(data["metadata"])
 
-    for record in data["incidences"]:
-        n = _convert_id(record["node"], nodetype)
-        e = _convert_id(record["edge"], edgetype)
+def _convert_id(i, idtype):
+    """Cast an ID to `idtype`, if it is not None."""
+    if idtype:
+        try:
+            return idtype(i)
+        except ValueError as e:
+            raise TypeError(f"Failed to convert ID {i} to type {idtype}.") from e
+    else:
+        return i
 
-        if network_type == "directed":
-            d = record["direction"]
-            d = _convert_d(d)  # convert from head/tail to in/out
-            H.add_node_to_edge(e, n, d)
-        else:
-            H.add_node_to_edge(e, n)
 
-    # import node attributes if they exist
-    if "nodes" in data:
-        for record in data["nodes"]:
+def _add_hif_incidences(H, records, nodetype=None, edgetype=None, batch_size=100000):
+    """Add the memberships listed in HIF incidence records to a network.
+
+    Parameters
+    ----------
+    H : Hypergraph or DiHypergraph
+        The network to add the memberships to.
+    records : iterable of dicts
+        The incidence records, which are consumed lazily.
+    nodetype, edgetype : type, optional
+        Types that the node and edge IDs will be cast to.
+    batch_size : int, optional
+        The number of undirected incidences added at once, by default 100000.
+
+    """
+    records = iter(records)
+    if isinstance(H, DiHypergraph):
+        # convert from head/tail to in/out
+        _convert_d = lambda d: "in" if d == "tail" else "out"
+        for record in records:
             n = _convert_id(record["node"], nodetype)
-            if "attrs" in record:
-                attr = record["attrs"]
-            else:
-                attr = {}
-
-            if n not in H._node:
-                H.add_node(n, **attr)
-            else:
-                H.set_node_attributes({n: attr})
-
-    # import edge attributes if they exist
-    if "edges" in data:
-        for record in data["edges"]:
             e = _convert_id(record["edge"], edgetype)
-            if "attrs" in record:
-                attr = record["attrs"]
-            else:
-                attr = {}
-            if e not in H._edge:
-                H.add_edge(_empty_edge(network_type), e, **attr)
-            else:
-                H.set_edge_attributes({e: attr})
+            H.add_node_to_edge(e, n, _convert_d(record["direction"]))
+        return
+
+    while True:
+        batch = list(islice(records, batch_size))
+        if not batch:
+            return
+        _add_bipartite_edges(
+            H,
+            [
+                (
+                    _convert_id(record["node"], nodetype),
+                    _convert_id(record["edge"], edgetype),
+                )
+                for record in batch
+            ],
+        )
+
+
+def _add_hif_data(H, network_type, data, nodetype=None, edgetype=None):
+    """Add the metadata and the node and edge records of HIF data to a network.
+
+    Parameters
+    ----------
+    H : Hypergraph or DiHypergraph
+        The network, with its incidences.
+    network_type : str
+        The HIF network type.
+    data : dict
+        The HIF data, without the incidences.
+    nodetype, edgetype : type, optional
+        Types that the node and edge IDs will be cast to.
+
+    Returns
+    -------
+    A Hypergraph, SimplicialComplex, or DiHypergraph object
+        The loaded network
+
+    """
+    # Import network metadata
+    if "metadata" in data:
+        H._net_attr.update(data["metadata"])
+
+    # import node and edge attributes if they exist
+    _add_hif_nodes(H, data.get("nodes", []), nodetype)
+    _add_hif_edges(H, network_type, data.get("edges", []), edgetype)
 
     if network_type == "asc":
         H = SimplicialComplex(H)
     return H
+
+
+def _add_hif_nodes(H, records, nodetype=None):
+    """Add the nodes and node attributes listed in HIF node records to a network.
+
+    Parameters
+    ----------
+    H : Hypergraph or DiHypergraph
+        The network to add the nodes to.
+    records : iterable of dicts
+        The node records, which are consumed lazily.
+    nodetype : type, optional
+        Type that the node IDs will be cast to.
+
+    """
+    for record in records:
+        n = _convert_id(record["node"], nodetype)
+        attr = record.get("attrs", {})
+        if n not in H._node:
+            H.add_node(n, **attr)
+        else:
+            H.set_node_attributes({n: attr})
+
+
+def _add_hif_edges(H, network_type, records, edgetype=None):
+    """Add the edges and edge attributes listed in HIF edge records to a network.
+
+    Parameters
+    ----------
+    H : Hypergraph or DiHypergraph
+        The network to add the edges to.
+    network_type : str
+        The HIF network type.
+    records : iterable of dicts
+        The edge records, which are consumed lazily.
+    edgetype : type, optional
+        Type that the edge IDs will be cast to.
+
+    """
+    for record in records:
+        e = _convert_id(record["edge"], edgetype)
+        attr = record.get("attrs", {})
+        if e not in H._edge:
+            empty_edge = (set(), set()) if network_type == "directed" else set()
+            H.add_edge(empty_edge, e, **attr)
+        else:
+            H.set_edge_attributes({e: attr})
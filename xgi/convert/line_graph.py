@@ -1,15 +1,16 @@
 """Method for converting to a line graph."""
 
-from itertools import combinations
-
 import networkx as nx
+import numpy as np
+from scipy.sparse import csr_array, triu
 
 from ..exception import XGIError
+from ..utils import csr_incidence
 
 __all__ = ["to_line_graph"]
 
 
-def to_line_graph(H, s=1, weights=None):
+def to_line_graph(H, s=1, weights=None, sparse=False, index=False):
     """The s-line graph of the hypergraph.
 
     The s-line graph of the hypergraph `H` is the graph whose
@@ -33,11 +34,27 @@ def to_line_graph(H, s=1, weights=None):
         edge weights corresponding to the size of intersection
         between hyperedges. If 'normalized', includes edge weights
         normalized by the size of the smaller hyperedge.
+    sparse : bool, default: False
+        If True, returns the adjacency matrix of the line graph as a scipy sparse
+        array instead of a NetworkX graph.  Its rows and columns follow the order of
+        `H.edges`, and its entries are the weights (1 if the line graph is
+        unweighted).
+    index : bool, default: False
+        Specifies whether to output a dictionary mapping indices to edge IDs, if
+        `sparse` is True.
 
     Returns
     -------
-    LG : networkx.Graph
+    LG : networkx.Graph or scipy.sparse.csr_array
          The line graph associated to the Hypergraph
+    coldict : dict
+        The dictionary mapping indices to edge IDs, if `sparse` and `index` are True.
+
+    Notes
+    -----
+    Only the pairs of hyperedges sharing at least one node are considered: their
+    intersection sizes are computed at once from the product of the transposed
+    incidence matrix with itself, rather than by intersecting all the pairs.
 
     References
     ----------
@@ -51,27 +68,40 @@ def to_line_graph(H, s=1, weights=None):
             f"{weights} not a valid weights option. Choices are "
             "None, 'absolute', and 'normalized'."
         )
-    LG = nx.Graph()
+    inc = csr_incidence(H)
+    m = inc.num_edges
+    if s >= 1:
+        U = triu(inc.overlaps("edge", s), k=1, format="csr")
+        U.sort_indices()
+        rows = np.repeat(np.arange(m), np.diff(U.indptr))
+        cols, overlaps = U.indices, U.data
+    else:
+        # every pair of hyperedges is linked, even if they are disjoint
+        I = inc.tocsr()
+        rows, cols = np.triu_indices(m, k=1)
+        overlaps = (I.T @ I).toarray()[rows, cols]
 
+    if weights == "normalized":
+        sizes = inc.edge_sizes()
+        data = overlaps / np.minimum(sizes[rows], sizes[cols])
+    elif weights == "absolute":
+        data = overlaps
+    else:
+        data = np.ones(len(rows), dtype=int)
+
+    if sparse:
+        A = csr_array((data, (rows, cols)), shape=(m, m))
+        A = A + A.T
+        return (A, dict(enumerate(inc.edge_ids))) if index else A
+
+    LG = nx.Graph()
     LG.add_nodes_from([(k, {"original_hyperedge": v}) for k, v in H._edge.items()])
 
-    for e1, e2 in combinations(H._edge, 2):
-        # Check that the intersection size is larger than s
-        intersection_size = len(H._edge[e1].intersection(H._edge[e2]))
-        if intersection_size >= s:
-            if not weights:
-                # Add unweighted edge
-                LG.add_edge(e1, e2)
-            else:
-                # Compute the (normalized) weight
-                weight = intersection_size
-                if weights == "normalized":
-                    weight /= min([len(H._edge[e1]), len(H._edge[e2])])
-                # Add edge with weight
-                LG.add_edge(
-                    e1,
-                    e2,
-                    weight=weight,
-                )
+    ids = inc.edge_ids
+    pairs = zip(rows.tolist(), cols.tolist(), data.tolist())
+    if not weights:
+        LG.add_edges_from((ids[i], ids[j]) for i, j, _ in pairs)
+    else:
+        LG.add_edges_from((ids[i], ids[j], {"weight": w}) for i, j, w in pairs)
 
     return LG
@@ -11,7 +11,9 @@ from itertools import count
 from warnings import warn
 
 from ..exception import IDNotFound, XGIError, frozen
-from ..utils import IDDict, update_uid_counter
+from ..stats import StatCache
+from ..utils import FingerprintIndex, IDDict, update_uid_counter
+from ..utils.fingerprint import directed_fingerprint
 from .views import DiEdgeView, DiNodeView
 
 __all__ = ["DiHypergraph"]
@@ -135,6 +137,11 @@ class DiHypergraph:
         self._node_attr = state["_node_attr"]
         self._edge = state["_edge"]
         self._edge_attr = state["_edge_attr"]
+        self._version = 0
+        self._stat_cache = StatCache()
+        self._edge_index = None
+        self._edge_index_version = None
+        self._id_ranks = None
         self._nodeview = DiNodeView(self)
         self._edgeview = DiEdgeView(self)
 
@@ -147,6 +154,11 @@ class DiHypergraph:
 
         self._edge = self._edge_dict_factory()
         self._edge_attr = self._edge_attr_dict_factory()
+        self._version = 0
+        self._stat_cache = StatCache()
+        self._edge_index = None
+        self._edge_index_version = None
+        self._id_ranks = None
 
         self._nodeview = DiNodeView(self)
         """A :class:`~xgi.core.views.DiNodeView` of the directed hypergraph."""
@@ -162,6 +174,65 @@ class DiHypergraph:
             to_dihypergraph(incoming_data, create_using=self)
         self._net_attr.update(attr)  # must be after convert
 
+    def _edge_fingerprints(self):
+        """Index of the edges by their tail and head.
+
+        The index is built on the first call, and then maintained by the methods that
+        add or remove edges or members.  It is rebuilt from scratch after any other
+        modification of the edges.
+
+        Returns
+        -------
+        FingerprintIndex
+            The edge IDs indexed by the pairs of frozensets (tail, head).
+
+        """
+        if self._edge_index_version != self._version:
+            self._edge_index = FingerprintIndex(
+                (idx, directed_fingerprint(members))
+                for idx, members in self._edge.items()
+            )
+            self._edge_index_version = self._version
+        return self._edge_index
+
+    def _modify_edges(self):
+        """Bump the version of the dihypergraph, keeping the edge index if it is built.
+
+        Must be called before modifying the dihypergraph, and the caller is
+        responsible for updating the returned index according to the changes of the
+        edges.
+
+        Returns
+        -------
+        FingerprintIndex or None
+            The index of :meth:`_edge_fingerprints` if it is up to date, else None.
+
+        """
+        index = self._edge_index if self._edge_index_version == self._version else None
+        self._version += 1
+        if index is not None:
+            self._edge_index_version = self._version
+        return index
+
+    def _duplicate_of(self, index, members, dedupe):
+        """The ID of an edge of `index` with the given (tail, head), or None.
+
+        Raises
+        ------
+        XGIError
+            If there is such an edge and `dedupe` is "raise".
+
+        """
+        try:
+            ids = index.get(directed_fingerprint(members))
+        except (TypeError, ValueError) as e:
+            raise XGIError("Invalid ebunch format") from e
+        if not ids:
+            return None
+        if dedupe == "raise":
+            raise XGIError(f"Edge {ids[0]} already has members {members}")
+        return ids[0]
+
     def __str__(self):
         """Returns a short summary of the directed hypergraph.
 
@@ -333,6 +404,7 @@ class DiHypergraph:
         If node is already in the dihypergraph, its attributes are still updated.
 
         """
+        self._modify_edges()
         if node not in self._node:
             self._node[node] = {"in": set(), "out": set()}
             self._node_attr[node] = self._node_attr_dict_factory()
@@ -358,6 +430,7 @@ class DiHypergraph:
         add_node
 
         """
+        self._modify_edges()
         for n in nodes_for_adding:
             try:
                 newnode = n not in self._node
@@ -400,6 +473,7 @@ class DiHypergraph:
         remove_nodes_from
 
         """
+        index = self._modify_edges()
         edge_neighbors = self._node[n]
         del self._node[n]
         del self._node_attr[n]
@@ -408,6 +482,8 @@ class DiHypergraph:
             for edge in edge_neighbors["in"].union(edge_neighbors["out"]):
                 del self._edge[edge]
                 del self._edge_attr[edge]
+                if index is not None:
+                    index.discard(edge)
         else:  # weak removal
             for edge in edge_neighbors["in"]:
                 self._edge[edge]["out"].remove(n)
@@ -424,6 +500,10 @@ class DiHypergraph:
                 ):
                     del self._edge[edge]
                     del self._edge_attr[edge]
+                    if index is not None:
+                        index.discard(edge)
+                elif index is not None:
+                    index.move(edge, directed_fingerprint(self._edge[edge]))
 
     def remove_nodes_from(self, nodes, strong=False, remove_empty=True):
         """Remove multiple nodes.
@@ -491,6 +571,7 @@ class DiHypergraph:
         values are silently ignored.
 
         """
+        self._modify_edges()
         # Set node attributes based on type of `values`
         if name is not None:  # `values` must not be a dict of dict
             if isinstance(values, dict):  # `values` is a dict
@@ -512,7 +593,7 @@ class DiHypergraph:
             except (TypeError, ValueError, AttributeError):
                 raise XGIError("Must pass a dictionary of dictionaries")
 
-    def add_edge(self, members, idx=None, **attr):
+    def add_edge(self, members, idx=None, dedupe=False, **attr):
         """Add one edge with optional attributes.
 
         Parameters
@@ -523,9 +604,20 @@ class DiHypergraph:
             of the head.
         idx : hashable, default None
             Id of the new edge. If None, a unique numeric ID will be created.
+        dedupe : bool or str, optional
+            What to do if an edge with the same tail and head already exists.  If False
+            (default), a multiedge is created.  If True or "merge", no edge is added and
+            the attributes of the existing edge are updated with `attr`.  If "raise",
+            an XGIError is raised.
         **attr : dict, optional
             Attributes of the new edge.
 
+        Raises
+        ------
+        XGIError
+            If `dedupe` is "raise" and an edge with the same tail and head already
+            exists.
+
         See Also
         --------
         add_edges_from : Add a collection of edges.
@@ -540,12 +632,24 @@ class DiHypergraph:
         >>> DH.add_edge(([1, 2, 3], [2, 3, 4]))
         >>> DH.add_edge(([3, 4], set()), idx='myedge')
         """
+        if dedupe not in {False, True, "merge", "raise"}:
+            raise XGIError(f"Invalid dedupe option {dedupe}")
+        if dedupe:
+            # build the index, which is then maintained with the edges
+            self._edge_fingerprints()
+        index = self._modify_edges()
         if isinstance(members, (tuple, list)):
             tail = members[0]
             head = members[1]
         else:
             raise XGIError("Directed edge must be a list or tuple!")
 
+        if dedupe and idx not in self._edge.keys():
+            dup = self._duplicate_of(index, members, dedupe)
+            if dup is not None:
+                self._edge_attr[dup].update(attr)
+                return
+
         uid = next(self._edge_uid) if idx is None else idx
 
         if idx in self._edge.keys():  # check that uid is not present yet
@@ -570,11 +674,13 @@ class DiHypergraph:
 
         self._edge_attr[uid] = self._edge_attr_dict_factory()
         self._edge_attr[uid].update(attr)
+        if index is not None:
+            index.add(uid, directed_fingerprint(self._edge[uid]))
 
         if idx:  # set self._edge_uid correctly
             update_uid_counter(self, idx)
 
-    def add_edges_from(self, ebunch_to_add, **attr):
+    def add_edges_from(self, ebunch_to_add, dedupe=False, **attr):
         """Add multiple directed edges with optional attributes.
 
         Parameters
@@ -604,18 +710,30 @@ class DiHypergraph:
             i.e. you cannot mix different formats.  The iterables containing edge
             members cannot be strings.
 
+        dedupe : bool or str, optional
+            What to do with an edge whose tail and head are those of an existing edge,
+            including the edges added before it in `ebunch_to_add`.  If False
+            (default), a multiedge is created.  If True or "merge", the edge is not
+            added and the attributes of the existing edge are updated.  If "raise",
+            an XGIError is raised.
         **attr : kwargs, optional
             Additional attributes to be assigned to all edges. Attribues specified via
             `ebunch_to_add` take precedence over `attr`.
 
+        Raises
+        ------
+        XGIError
+            If `dedupe` is "raise" and an edge has the tail and head of an existing
+            edge.
+
         See Also
         --------
         add_edge : Add a single edge.
 
         Notes
         -----
-        Adding the same edge twice will create a multi-edge. Currently
-        cannot add empty edges; the method skips over them.
+        Adding the same edge twice will create a multi-edge, unless `dedupe` is set.
+        Currently cannot add empty edges; the method skips over them.
 
         Examples
         --------
@@ -674,6 +792,12 @@ class DiHypergraph:
         {'one': {'color': 'red'}, 'two': {'color': 'blue', 'age': 40}}
 
         """
+        if dedupe not in {False, True, "merge", "raise"}:
+            raise XGIError(f"Invalid dedupe option {dedupe}")
+        if dedupe:
+            # build the index, which is then maintained with the edges
+            self._edge_fingerprints()
+        index = self._modify_edges()
         # format 5 is the easiest one
         if isinstance(ebunch_to_add, dict):
             for idx, members in ebunch_to_add.items():
@@ -687,6 +811,12 @@ class DiHypergraph:
                 else:
                     raise XGIError("Directed edge must be a list or tuple!")
 
+                if dedupe:
+                    dup = self._duplicate_of(index, members, dedupe)
+                    if dup is not None:
+                        self._edge_attr[dup].update(attr)
+                        continue
+
                 try:
                     self._edge[idx] = {"in": set(tail), "out": set(head)}
                 except TypeError as e:
@@ -704,6 +834,8 @@ class DiHypergraph:
                         self._node[n] = {"in": set(), "out": set()}
                         self._node_attr[n] = self._node_attr_dict_factory()
                     self._node[n]["in"].add(idx)
+                if index is not None:
+                    index.add(idx, directed_fingerprint(self._edge[idx]))
 
                 update_uid_counter(self, idx)
 
@@ -737,18 +869,31 @@ class DiHypergraph:
         # now we may iterate over the rest
         e = first_edge
         while True:
+            # automatic IDs are only drawn for the edges that are added
             if format1:
-                members, idx, eattr = e, next(self._edge_uid), {}
+                members, idx, eattr = e, None, {}
             elif format2:
                 members, idx, eattr = e[0], e[1], {}
             elif format3:
-                members, idx, eattr = e[0], next(self._edge_uid), e[1]
+                members, idx, eattr = e[0], None, e[1]
             elif format4:
                 members, idx, eattr = e[0], e[1], e[2]
 
+            dup = None
             if idx in self._edge.keys():  # check that uid is not present yet
                 warn(f"uid {idx} already exists, cannot add edge {members}.")
-            else:
+            elif dedupe:
+                dup = self._duplicate_of(index, members, dedupe)
+
+            if dup is None and idx is None:
+                idx = next(self._edge_uid)
+                if idx in self._edge.keys():  # the drawn uid may be taken too
+                    warn(f"uid {idx} already exists, cannot add edge {members}.")
+
+            if dup is not None:
+                self._edge_attr[dup].update(attr)
+                self._edge_attr[dup].update(eattr)
+            elif idx not in self._edge.keys():
                 try:
                     tail = members[0]
                     head = members[1]
@@ -773,6 +918,8 @@ class DiHypergraph:
                 self._edge_attr[idx] = self._edge_attr_dict_factory()
                 self._edge_attr[idx].update(attr)
                 self._edge_attr[idx].update(eattr)
+                if index is not None:
+                    index.add(idx, directed_fingerprint(self._edge[idx]))
 
             try:
                 e = next(new_edges)
@@ -802,6 +949,7 @@ class DiHypergraph:
         add_edge
         remove_node_from_edge
         """
+        index = self._modify_edges()
         if direction == "in":
             ed = "in"
             nd = "out"
@@ -820,6 +968,8 @@ class DiHypergraph:
 
         self._edge[edge][ed].add(node)
         self._node[node][nd].add(edge)
+        if index is not None:
+            index.move(edge, directed_fingerprint(self._edge[edge]))
 
     def remove_edge(self, idx):
         """Remove one edge.
@@ -839,6 +989,7 @@ class DiHypergraph:
         remove_edges_from : Remove multiple edges.
 
         """
+        index = self._modify_edges()
         edge = self._edge[idx].copy()
 
         for node in edge["in"]:
@@ -848,6 +999,8 @@ class DiHypergraph:
 
         del self._edge[idx]
         del self._edge_attr[idx]
+        if index is not None:
+            index.discard(idx)
 
     def remove_edges_from(self, ebunch):
         """Remove multiple edges.
@@ -867,6 +1020,7 @@ class DiHypergraph:
         remove_edge : remove a single edge.
 
         """
+        index = self._modify_edges()
         for idx in ebunch:
             edge = self._edge[idx].copy()
 
@@ -877,6 +1031,8 @@ class DiHypergraph:
 
             del self._edge[idx]
             del self._edge_attr[idx]
+            if index is not None:
+                index.discard(idx)
 
     def remove_node_from_edge(self, edge, node, direction, remove_empty=True):
         """Remove a node from an existing edge.
@@ -908,6 +1064,7 @@ class DiHypergraph:
         removed.
 
         """
+        index = self._modify_edges()
         if direction == "in":
             ed = "in"
             nd = "out"
@@ -931,6 +1088,10 @@ class DiHypergraph:
         if not self._edge[edge]["in"] and not self._edge[edge]["out"] and remove_empty:
             del self._edge[edge]
             del self._edge_attr[edge]
+            if index is not None:
+                index.discard(edge)
+        elif index is not None:
+            index.move(edge, directed_fingerprint(self._edge[edge]))
 
     def set_edge_attributes(self, values, name=None):
         """Set the edge attributes from a value or a dictionary of values.
@@ -962,6 +1123,7 @@ class DiHypergraph:
         silently ignored.
 
         """
+        self._modify_edges()
         if name is not None:
             # `values` does not contain attribute names
             try:
@@ -999,6 +1161,7 @@ class DiHypergraph:
             By default, True.
 
         """
+        self._version += 1
         self._node.clear()
         self._node_attr.clear()
         self._edge.clear()
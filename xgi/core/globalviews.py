@@ -13,10 +13,19 @@ about 15 nested views. Often it is easiest to use .copy() to avoid chains.
 
 """
 
+from copy import copy
+
+import numpy as np
+
+from ..stats import StatCache
+from ..utils import csr_incidence
+from ..utils.incidence import _SubsetView
+from .views import EdgeView, NodeView
+
 __all__ = ["subhypergraph"]
 
 
-def subhypergraph(H, nodes=None, edges=None, keep_isolates=True):
+def subhypergraph(H, nodes=None, edges=None, keep_isolates=True, view=False):
     """View of `H` applying a filter on nodes and edges.
 
     `subhypergraph_view` provides a read-only view of the induced subhypergraph that
@@ -47,28 +56,95 @@ def subhypergraph(H, nodes=None, edges=None, keep_isolates=True):
     keep_isolates : bool, optional
         Whether to keep isolated nodes in the subhypergraph.
         By default, True.
+    view : bool, optional
+        If True, the memberships and attributes are read from `H` instead of being
+        copied, and the subhypergraph raises an XGIError once `H` is modified.
+        By default, False.
 
     Returns
     -------
     Hypergraph object
         A read-only hypergraph view of the input hypergraph.
 
-    """
-    new = H.__class__()
-
-    new._net_attr = H._net_attr.copy()
-    nodes = set(H.nodes) if nodes is None else (set(nodes) & set(H.nodes))
-    edges = set(H.edges) if edges is None else (set(edges) & set(H.edges))
-
-    new.add_nodes_from((uid, attr) for uid, attr in H.nodes.items() if uid in nodes)
-    new.add_edges_from(
-        (H.edges.members(uid), uid, attr)
-        for uid, attr in H.edges.items()
-        if uid in edges and set(H.edges.members(uid)).issubset(nodes)
-    )
+    Notes
+    -----
+    The nodes and edges of the subhypergraph keep the order they have in `H`.  They
+    are found from the memberships of the given nodes with the incidence arrays of
+    `H`, so that the cost of a small subhypergraph does not depend on the size of `H`
+    once these arrays are built.
+
+    By default, the memberships and attributes of the selected nodes and edges are
+    copied, so that the subhypergraph does not change with `H`.  With `view=True`,
+    only the IDs are stored, which is faster for large subhypergraphs, but the
+    subhypergraph shares the attributes of `H` and must not be used after `H` is
+    modified.  Use :meth:`~xgi.core.hypergraph.Hypergraph.copy` to get a mutable
+    hypergraph.
+
+    Examples
+    --------
+    >>> import xgi
+    >>> H = xgi.Hypergraph([[1, 2, 3], [3, 4], [4, 5]])
+    >>> S = xgi.subhypergraph(H, nodes=[3, 4, 5])
+    >>> S.edges.members()
+    [{3, 4}, {4, 5}]
+    >>> S.nodes.degree.asdict()
+    {3: 1, 4: 2, 5: 1}
 
+    """
+    incidence = csr_incidence(H)
+    if nodes is None:
+        node_pos = np.arange(incidence.num_nodes)
+        if edges is None:
+            edge_pos = np.arange(incidence.num_edges)
+        else:
+            edge_pos = _positions(incidence.edge_index, edges)
+    else:
+        node_pos = _positions(incidence.node_index, nodes)
+        edge_pos = incidence.induced_edges(node_pos)
+        if edges is not None:
+            edge_pos = np.intersect1d(
+                edge_pos, _positions(incidence.edge_index, edges), assume_unique=True
+            )
     if not keep_isolates:
-        new.remove_nodes_from(new.nodes.isolates())
+        node_pos = incidence.incident_nodes(edge_pos)
 
+    node_ids = incidence.node_ids
+    edge_ids = incidence.edge_ids
+    node_dict = dict.fromkeys([node_ids[i] for i in node_pos.tolist()])
+    edge_dict = dict.fromkeys([edge_ids[i] for i in edge_pos.tolist()])
+    # the members of the edges are all kept, unlike the memberships of the nodes
+    all_edges = len(edge_dict) == incidence.num_edges
+
+    new = H.__class__()
+    if view:
+        other = None if all_edges else edge_dict
+        new._node = _SubsetView(H._node, node_dict, H, other)
+        new._edge = _SubsetView(H._edge, edge_dict, H)
+        new._node_attr = _SubsetView(H._node_attr, node_dict, H)
+        new._edge_attr = _SubsetView(H._edge_attr, edge_dict, H)
+        # the memoized values would not follow the modifications of H
+        new._stat_cache = StatCache(maxsize=0)
+        new._nodeview = NodeView(new)
+        new._edgeview = EdgeView(new)
+    else:
+        for n in node_dict:
+            memberships = H._node[n]
+            if all_edges:
+                new._node[n] = memberships.copy()
+            else:
+                new._node[n] = {e for e in memberships if e in edge_dict}
+            new._node_attr[n] = new._node_attr_dict_factory()
+            new._node_attr[n].update(H._node_attr[n])
+        for e in edge_dict:
+            new._edge[e] = H._edge[e].copy()
+            new._edge_attr[e] = new._edge_attr_dict_factory()
+            new._edge_attr[e].update(H._edge_attr[e])
+    new._net_attr = H._net_attr.copy()
+    new._edge_uid = copy(H._edge_uid)
     new.freeze()
     return new
+
+
+def _positions(index, ids):
+    """The sorted indices of the IDs that are in `index`."""
+    return np.unique(np.fromiter((index[i] for i in ids if i in index), dtype=np.int64))
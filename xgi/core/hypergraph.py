@@ -1,14 +1,20 @@
 """Base class for undirected hypergraphs."""
 
 import random
-from collections import defaultdict
 from collections.abc import Hashable, Iterable
 from copy import copy, deepcopy
 from itertools import count
 from warnings import warn
 
 from ..exception import IDNotFound, XGIError, frozen
-from ..utils import IDDict, update_uid_counter
+from ..stats import StatCache
+from ..utils import (
+    CSRMembers,
+    FingerprintIndex,
+    IDDict,
+    csr_incidence,
+    update_uid_counter,
+)
 from .views import EdgeView, NodeView
 
 __all__ = ["Hypergraph"]
@@ -121,6 +127,12 @@ class Hypergraph:
         self._node_attr = state["_node_attr"]
         self._edge = state["_edge"]
         self._edge_attr = state["_edge_attr"]
+        self._version = 0
+        self._stat_cache = StatCache()
+        self._incidence = None
+        self._edge_index = None
+        self._edge_index_version = None
+        self._id_ranks = None
         self._nodeview = NodeView(self)
         self._edgeview = EdgeView(self)
 
@@ -131,6 +143,12 @@ class Hypergraph:
         self._node_attr = self._node_attr_dict_factory()
         self._edge = self._edge_dict_factory()
         self._edge_attr = self._edge_attr_dict_factory()
+        self._version = 0
+        self._stat_cache = StatCache()
+        self._incidence = None
+        self._edge_index = None
+        self._edge_index_version = None
+        self._id_ranks = None
 
         self._nodeview = NodeView(self)
         """A :class:`~xgi.core.views.NodeView` of the hypergraph."""
@@ -146,6 +164,63 @@ class Hypergraph:
             to_hypergraph(incoming_data, create_using=self)
         self._net_attr.update(attr)  # must be after convert
 
+    def _edge_fingerprints(self):
+        """Index of the edges by their members.
+
+        The index is built on the first call, and then maintained by the methods that
+        add or remove edges or members.  It is rebuilt from scratch after any other
+        modification of the edges.
+
+        Returns
+        -------
+        FingerprintIndex
+            The edge IDs indexed by the frozensets of their members.
+
+        """
+        if self._edge_index_version != self._version:
+            self._edge_index = FingerprintIndex(
+                (idx, frozenset(members)) for idx, members in self._edge.items()
+            )
+            self._edge_index_version = self._version
+        return self._edge_index
+
+    def _modify_edges(self):
+        """Bump the version of the hypergraph, keeping the edge index if it is built.
+
+        Must be called before modifying the hypergraph, and the caller is responsible
+        for updating the returned index according to the changes of the edges.
+
+        Returns
+        -------
+        FingerprintIndex or None
+            The index of :meth:`_edge_fingerprints` if it is up to date, else None.
+
+        """
+        index = self._edge_index if self._edge_index_version == self._version else None
+        self._version += 1
+        if index is not None:
+            self._edge_index_version = self._version
+        return index
+
+    def _duplicate_of(self, index, members, dedupe):
+        """The ID of an edge of `index` with the given members, or None.
+
+        Raises
+        ------
+        XGIError
+            If there is such an edge and `dedupe` is "raise".
+
+        """
+        try:
+            ids = index.get(frozenset(members))
+        except TypeError as e:
+            raise XGIError("Invalid ebunch format") from e
+        if not ids:
+            return None
+        if dedupe == "raise":
+            raise XGIError(f"Edge {ids[0]} already has members {set(members)}")
+        return ids[0]
+
     def __str__(self):
         """Returns a short summary of the hypergraph.
 
@@ -376,6 +451,7 @@ class Hypergraph:
         If node is already in the hypergraph, its attributes are still updated.
 
         """
+        self._modify_edges()
         if node not in self._node:
             self._node[node] = set()
             self._node_attr[node] = self._node_attr_dict_factory()
@@ -401,6 +477,7 @@ class Hypergraph:
         add_node
         set_node_attributes
         """
+        self._modify_edges()
         for n in nodes_for_adding:
             try:
                 newnode = n not in self._node
@@ -442,6 +519,7 @@ class Hypergraph:
         remove_nodes_from
 
         """
+        index = self._modify_edges()
         edge_neighbors = self._node[n]
         del self._node[n]
         del self._node_attr[n]
@@ -453,12 +531,18 @@ class Hypergraph:
                 del self._edge_attr[e]
                 for node in node_neighbors.difference({n}):
                     self._node[node].remove(e)
+                if index is not None:
+                    index.discard(e)
         else:  # weak removal
             for edge in edge_neighbors:
                 self._edge[edge].remove(n)
                 if not self._edge[edge] and remove_empty:
                     del self._edge[edge]
                     del self._edge_attr[edge]
+                    if index is not None:
+                        index.discard(edge)
+                elif index is not None:
+                    index.move(edge, frozenset(self._edge[edge]))
 
     def remove_nodes_from(self, nodes, strong=False, remove_empty=True):
         """Remove multiple nodes.
@@ -525,6 +609,7 @@ class Hypergraph:
         values are silently ignored.
 
         """
+        self._modify_edges()
         # Set node attributes based on type of `values`
         if name is not None:  # `values` must not be a dict of dict
             if isinstance(values, dict):  # `values` is a dict
@@ -546,7 +631,7 @@ class Hypergraph:
             except (TypeError, ValueError, AttributeError):
                 raise XGIError("Must pass a dictionary of dictionaries")
 
-    def add_edge(self, members, idx=None, **attr):
+    def add_edge(self, members, idx=None, dedupe=False, **attr):
         """Add one edge with optional attributes.
 
         Parameters
@@ -555,13 +640,19 @@ class Hypergraph:
             An iterable of the ids of the nodes contained in the new edge.
         idx : hashable, optional
             Id of the new edge. If None (default), a unique numeric ID will be created.
+        dedupe : bool or str, optional
+            What to do if an edge with the same members already exists.  If False
+            (default), a multiedge is created.  If True or "merge", no edge is added and
+            the attributes of the existing edge are updated with `attr`.  If "raise",
+            an XGIError is raised.
         **attr : dict, optional
             Attributes of the new edge.
 
         Raises
         -----
         XGIError
-            If `members` is empty.
+            If `members` is empty, or if `dedupe` is "raise" and an edge with the same
+            members already exists.
 
         See Also
         --------
@@ -590,13 +681,34 @@ class Hypergraph:
         >>> H.edges[1]
         {'color': 'red', 'place': 'peru'}
 
+        With `dedupe`, the edges are checked against the existing ones in constant
+        time, and a duplicate only updates the attributes of the existing edge.
+
+        >>> H.add_edge([4, 1], dedupe=True, color='blue')
+        >>> H.edges
+        EdgeView((0, 'myedge', 1))
+        >>> H.edges[1]
+        {'color': 'blue', 'place': 'peru'}
+
         """
+        if dedupe not in {False, True, "merge", "raise"}:
+            raise XGIError(f"Invalid dedupe option {dedupe}")
+        if dedupe:
+            # build the index, which is then maintained with the edges
+            self._edge_fingerprints()
+        index = self._modify_edges()
         members = set(members)
 
         if idx in self._edge.keys():  # check that uid is not present yet
             warn(f"uid {idx} already exists, cannot add edge {members}")
             return
 
+        if dedupe:
+            dup = self._duplicate_of(index, members, dedupe)
+            if dup is not None:
+                self._edge_attr[dup].update(attr)
+                return
+
         uid = next(self._edge_uid) if idx is None else idx
 
         self._edge[uid] = set()
@@ -609,11 +721,13 @@ class Hypergraph:
 
         self._edge_attr[uid] = self._edge_attr_dict_factory()
         self._edge_attr[uid].update(attr)
+        if index is not None:
+            index.add(uid, frozenset(members))
 
         if idx:  # set self._edge_uid correctly
             update_uid_counter(self, idx)
 
-    def add_edges_from(self, ebunch_to_add, **attr):
+    def add_edges_from(self, ebunch_to_add, dedupe=False, **attr):
         r"""Add multiple edges with optional attributes.
 
         Parameters
@@ -638,10 +752,21 @@ class Hypergraph:
             the same length, i.e. you cannot mix different formats.  The iterables
             containing edge members cannot be strings.
 
+        dedupe : bool or str, optional
+            What to do with an edge whose members are those of an existing edge,
+            including the edges added before it in `ebunch_to_add`.  If False
+            (default), a multiedge is created.  If True or "merge", the edge is not
+            added and the attributes of the existing edge are updated.  If "raise",
+            an XGIError is raised.
         **attr : kwargs, optional
             Additional attributes to be assigned to all edges. Attribues specified via
             `ebunch_to_add` take precedence over `attr`.
 
+        Raises
+        ------
+        XGIError
+            If `dedupe` is "raise" and an edge has the members of an existing edge.
+
         See Also
         --------
         add_edge : Add a single edge.
@@ -650,8 +775,8 @@ class Hypergraph:
 
         Notes
         -----
-        Adding the same edge twice will create a multi-edge. Currently
-        cannot add empty edges; the method skips over them.
+        Adding the same edge twice will create a multi-edge, unless `dedupe` is set.
+        Currently cannot add empty edges; the method skips over them.
 
         Examples
         --------
@@ -711,23 +836,46 @@ class Hypergraph:
         >>> {e: H.edges[e] for e in H.edges}
         {'one': {'color': 'red'}, 'two': {'age': 30}, 'three': {'color': 'blue', 'age': 40}}
 
+        Duplicate edges can be dropped while they are added.
+
+        >>> H = xgi.Hypergraph()
+        >>> H.add_edges_from([[0, 1], [1, 2], [1, 0]], dedupe=True)
+        >>> H.edges.members(dtype=dict)
+        {0: {0, 1}, 1: {1, 2}}
+
         """
+        if dedupe not in {False, True, "merge", "raise"}:
+            raise XGIError(f"Invalid dedupe option {dedupe}")
+        if dedupe:
+            # build the index, which is then maintained with the edges
+            self._edge_fingerprints()
+        index = self._modify_edges()
+        # plain dict lookups, which do not go through the validation of IDDict
+        node_get = self._node.get
         # format 5 is the easiest one
         if isinstance(ebunch_to_add, dict):
             for idx, members in ebunch_to_add.items():
                 if idx in self._edge.keys():  # check that uid is not present yet
                     warn(f"uid {idx} already exists, cannot add edge {members}.")
                     continue
+                if dedupe:
+                    dup = self._duplicate_of(index, members, dedupe)
+                    if dup is not None:
+                        self._edge_attr[dup].update(attr)
+                        continue
                 try:
                     self._edge[idx] = set(members)
                 except TypeError as e:
                     raise XGIError("Invalid ebunch format") from e
                 for n in members:
-                    if n not in self._node:
-                        self._node[n] = set()
+                    memberships = node_get(n)
+                    if memberships is None:
+                        memberships = self._node[n] = set()
                         self._node_attr[n] = self._node_attr_dict_factory()
-                    self._node[n].add(idx)
+                    memberships.add(idx)
                 self._edge_attr[idx] = self._edge_attr_dict_factory()
+                if index is not None:
+                    index.add(idx, frozenset(self._edge[idx]))
 
                 update_uid_counter(self, idx)
 
@@ -766,32 +914,48 @@ class Hypergraph:
         # now we may iterate over the rest
         e = first_edge
         while True:
+            # automatic IDs are only drawn for the edges that are added
             if format1:
-                members, idx, eattr = e, next(self._edge_uid), {}
+                members, idx, eattr = e, None, {}
             elif format2:
                 members, idx, eattr = e[0], e[1], {}
             elif format3:
-                members, idx, eattr = e[0], next(self._edge_uid), e[1]
+                members, idx, eattr = e[0], None, e[1]
             elif format4:
                 members, idx, eattr = e[0], e[1], e[2]
 
+            dup = None
             if idx in self._edge.keys():  # check that uid is not present yet
                 warn(f"uid {idx} already exists, cannot add edge {members}.")
-            else:
+            elif dedupe:
+                dup = self._duplicate_of(index, members, dedupe)
+
+            if dup is None and idx is None:
+                idx = next(self._edge_uid)
+                if idx in self._edge.keys():  # the drawn uid may be taken too
+                    warn(f"uid {idx} already exists, cannot add edge {members}.")
+
+            if dup is not None:
+                self._edge_attr[dup].update(attr)
+                self._edge_attr[dup].update(eattr)
+            elif idx not in self._edge.keys():
                 try:
                     self._edge[idx] = set(members)
                 except TypeError as e:
                     raise XGIError("Invalid ebunch format") from e
 
                 for n in members:
-                    if n not in self._node:
-                        self._node[n] = set()
+                    memberships = node_get(n)
+                    if memberships is None:
+                        memberships = self._node[n] = set()
                         self._node_attr[n] = self._node_attr_dict_factory()
-                    self._node[n].add(idx)
+                    memberships.add(idx)
 
-                self._edge_attr[idx] = self._edge_attr_dict_factory()
-                self._edge_attr[idx].update(attr)
-                self._edge_attr[idx].update(eattr)
+                edge_attr = self._edge_attr[idx] = self._edge_attr_dict_factory()
+                edge_attr.update(attr)
+                edge_attr.update(eattr)
+                if index is not None:
+                    index.add(idx, frozenset(self._edge[idx]))
 
             try:
                 e = next(new_edges)
@@ -873,6 +1037,7 @@ class Hypergraph:
         silently ignored.
 
         """
+        self._modify_edges()
         if name is not None:
             # `values` does not contain attribute names
             try:
@@ -929,6 +1094,7 @@ class Hypergraph:
         [{2, 3, 4}, {1, 3}]
 
         """
+        index = self._modify_edges()
         # Assign edges to modify
         try:
             # Initialize temporary copies to modify
@@ -973,6 +1139,9 @@ class Hypergraph:
 
         self._edge[e_id1] = temp_members1
         self._edge[e_id2] = temp_members2
+        if index is not None:
+            index.move(e_id1, frozenset(temp_members1))
+            index.move(e_id2, frozenset(temp_members2))
 
     def random_edge_shuffle(self, e_id1=None, e_id2=None):
         """Randomly redistributes nodes between two hyperedges.
@@ -1014,6 +1183,7 @@ class Hypergraph:
         [{2, 4, 5}, {3, 4}, {1, 3}]
 
         """
+        index = self._modify_edges()
         if len(self._edge) < 2:
             raise ValueError("Hypergraph must have at least two edges.")
 
@@ -1053,6 +1223,9 @@ class Hypergraph:
         # update hypergraph
         self._edge[e_id1] = e1_new
         self._edge[e_id2] = e2_new
+        if index is not None:
+            index.move(e_id1, frozenset(e1_new))
+            index.move(e_id2, frozenset(e2_new))
 
     def add_node_to_edge(self, edge, node):
         """Add one node to an existing edge.
@@ -1084,6 +1257,7 @@ class Hypergraph:
         {'fruits': ['apple', 'banana', 'pear'], 'veggies': ['lettuce']}
 
         """
+        index = self._modify_edges()
         if edge not in self._edge:
             self._edge[edge] = set()
             self._edge_attr[edge] = {}
@@ -1092,6 +1266,8 @@ class Hypergraph:
             self._node_attr[node] = {}
         self._edge[edge].add(node)
         self._node[node].add(edge)
+        if index is not None:
+            index.move(edge, frozenset(self._edge[edge]))
 
     def remove_edge(self, idx):
         """Remove one edge.
@@ -1111,10 +1287,13 @@ class Hypergraph:
         remove_edges_from : Remove multiple edges.
 
         """
+        index = self._modify_edges()
         for node in self._edge[idx].copy():
             self._node[node].remove(idx)
         del self._edge[idx]
         del self._edge_attr[idx]
+        if index is not None:
+            index.discard(idx)
 
     def remove_edges_from(self, ebunch):
         """Remove multiple edges.
@@ -1134,11 +1313,14 @@ class Hypergraph:
         remove_edge : remove a single edge.
 
         """
+        index = self._modify_edges()
         for idx in ebunch:
             for node in self._edge[idx].copy():
                 self._node[node].remove(idx)
             del self._edge[idx]
             del self._edge_attr[idx]
+            if index is not None:
+                index.discard(idx)
 
     def remove_node_from_edge(self, edge, node, remove_empty=True):
         """Remove a node from an existing edge.
@@ -1169,6 +1351,7 @@ class Hypergraph:
         removed.
 
         """
+        index = self._modify_edges()
         if edge not in self._edge:
             raise XGIError(f"Edge {edge} not in the hypergraph")
         elif node not in self._node:
@@ -1183,6 +1366,10 @@ class Hypergraph:
         if not self._edge[edge] and remove_empty:
             del self._edge[edge]
             del self._edge_attr[edge]
+            if index is not None:
+                index.discard(edge)
+        elif index is not None:
+            index.move(edge, frozenset(self._edge[edge]))
 
     def update(self, *, edges=None, nodes=None):
         """Add nodes or edges to the hypergraph.
@@ -1217,6 +1404,7 @@ class Hypergraph:
             By default, True.
 
         """
+        self._version += 1
         self._node.clear()
         self._node_attr.clear()
         self._edge.clear()
@@ -1226,6 +1414,7 @@ class Hypergraph:
 
     def clear_edges(self):
         """Remove all edges from the graph without altering any nodes."""
+        self._version += 1
         for node in self.nodes:
             self._node[node] = set()
         self._edge.clear()
@@ -1343,49 +1532,45 @@ class Hypergraph:
         True
         """
         dups = []
-        hashes = defaultdict(list)
-        for idx, members in self._edge.items():
-            hashes[frozenset(members)].append(idx)
-
         new_edges = list()
-        for members, dup_ids in hashes.items():
-            if len(dup_ids) > 1:
-                dups.extend(dup_ids)
-
-                if rename == "first":
-                    new_id = sorted(dup_ids)[0]
-                elif rename == "tuple":
-                    new_id = tuple(sorted(dup_ids))
-                elif rename == "new":
-                    new_id = next(self._edge_uid)
-                else:
-                    raise XGIError("Invalid ID renaming scheme!")
-
-                if merge_rule == "first":
-                    idx = min(dup_ids)
-                    new_attrs = deepcopy(self._edge_attr[idx])
-                elif merge_rule == "union":
-                    attrs = {field for idx in dup_ids for field in self._edge_attr[idx]}
-                    new_attrs = {
-                        attr: {self._edge_attr[idx].get(attr) for idx in dup_ids}
-                        for attr in attrs
-                    }
-                elif merge_rule == "intersection":
-                    attrs = {field for idx in dup_ids for field in self._edge_attr[idx]}
-                    set_attrs = {
-                        attr: {self._edge_attr[idx].get(attr) for idx in dup_ids}
-                        for attr in attrs
-                    }
-                    new_attrs = {
-                        attr: (None if len(val) != 1 else next(iter(val)))
-                        for attr, val in set_attrs.items()
-                    }
-                else:
-                    raise XGIError("Invalid merge rule!")
-
-                if multiplicity is not None:
-                    new_attrs[multiplicity] = len(dup_ids)
-                new_edges.append((members, new_id, new_attrs))
+        for dup_ids in self._edge_fingerprints().groups():
+            members = self._edge[dup_ids[0]].copy()
+            dups.extend(dup_ids)
+
+            if rename == "first":
+                new_id = sorted(dup_ids)[0]
+            elif rename == "tuple":
+                new_id = tuple(sorted(dup_ids))
+            elif rename == "new":
+                new_id = next(self._edge_uid)
+            else:
+                raise XGIError("Invalid ID renaming scheme!")
+
+            if merge_rule == "first":
+                idx = min(dup_ids)
+                new_attrs = deepcopy(self._edge_attr[idx])
+            elif merge_rule == "union":
+                attrs = {field for idx in dup_ids for field in self._edge_attr[idx]}
+                new_attrs = {
+                    attr: {self._edge_attr[idx].get(attr) for idx in dup_ids}
+                    for attr in attrs
+                }
+            elif merge_rule == "intersection":
+                attrs = {field for idx in dup_ids for field in self._edge_attr[idx]}
+                set_attrs = {
+                    attr: {self._edge_attr[idx].get(attr) for idx in dup_ids}
+                    for attr in attrs
+                }
+                new_attrs = {
+                    attr: (None if len(val) != 1 else next(iter(val)))
+                    for attr, val in set_attrs.items()
+                }
+            else:
+                raise XGIError("Invalid merge rule!")
+
+            if multiplicity is not None:
+                new_attrs[multiplicity] = len(dup_ids)
+            new_edges.append((members, new_id, new_attrs))
         self.remove_edges_from(dups)
         self.add_edges_from(new_edges)
 
@@ -1420,6 +1605,116 @@ class Hypergraph:
 
         return cp
 
+    def compact(self):
+        """A frozen, array-backed copy of the hypergraph.
+
+        Node and edge IDs are interned to contiguous integer indices and the
+        memberships are held in paired CSR/CSC NumPy arrays (see
+        :class:`~xgi.utils.incidence.CSRIncidence`) instead of dicts of sets, which
+        lowers the memory cost per incidence by an order of magnitude.  Node, edge,
+        and hypergraph attributes are copied.
+
+        Returns
+        -------
+        Hypergraph
+            A frozen copy of the hypergraph.  Its views and stats work as usual, and
+            :func:`~xgi.linalg.hypergraph_matrix.incidence_matrix` wraps the stored
+            arrays without copying them.
+
+        See Also
+        --------
+        copy : Returns a mutable, dict-backed copy, also of a compact hypergraph.
+        is_compact
+
+        Examples
+        --------
+        >>> import xgi
+        >>> H = xgi.Hypergraph([[1, 2, 3], [3, 4]])
+        >>> C = H.compact()
+        >>> C.edges.members()
+        [{1, 2, 3}, {3, 4}]
+        >>> C.nodes.degree.asdict()
+        {1: 1, 2: 1, 3: 2, 4: 1}
+        >>> C.is_frozen
+        True
+
+        """
+        return self._from_incidence(
+            csr_incidence(self),
+            deepcopy(self._node_attr),
+            deepcopy(self._edge_attr),
+            deepcopy(self._net_attr),
+            copy(self._edge_uid),
+        )
+
+    @classmethod
+    def _from_incidence(
+        cls, incidence, node_attr, edge_attr, net_attr, edge_uid, compact=True
+    ):
+        """A hypergraph stored in, or built from, the given incidence arrays.
+
+        The arrays and the attribute dicts are used as is, without copying them.
+
+        Parameters
+        ----------
+        incidence : CSRIncidence
+            The memberships of the hypergraph.
+        node_attr, edge_attr : IDDict
+            The attributes of each node and edge, keyed by ID.
+        net_attr : dict
+            The hypergraph attributes.
+        edge_uid : itertools.count
+            The counter of automatic edge IDs.
+        compact : bool, optional
+            If True (default), the hypergraph is frozen and stored in the arrays, as
+            with :meth:`compact`.  If False, it is a regular, mutable hypergraph, whose
+            sets of members and memberships are built from the arrays at once.
+
+        Returns
+        -------
+        Hypergraph
+
+        """
+        H = cls()
+        if compact:
+            H._node = CSRMembers(incidence, "node")
+            H._edge = CSRMembers(incidence, "edge")
+        else:
+            H._node = _sets_from_csr(
+                incidence.node_ids,
+                incidence.node_ptr,
+                incidence.node_edges,
+                incidence.edge_ids,
+            )
+            H._edge = _sets_from_csr(
+                incidence.edge_ids,
+                incidence.edge_ptr,
+                incidence.edge_nodes,
+                incidence.node_ids,
+            )
+        H._node_attr = node_attr
+        H._edge_attr = edge_attr
+        H._net_attr = net_attr
+        H._edge_uid = edge_uid
+        H._nodeview = NodeView(H)
+        H._edgeview = EdgeView(H)
+        if compact:
+            H.freeze()
+
+        return H
+
+    @property
+    def is_compact(self):
+        """Whether the hypergraph is stored in arrays.
+
+        Returns
+        -------
+        bool
+            True if the hypergraph was created with :meth:`compact`.
+
+        """
+        return isinstance(self._edge, CSRMembers)
+
     def dual(self):
         """The dual of the hypergraph.
 
@@ -1554,3 +1849,12 @@ class Hypergraph:
             return self.frozen
         except AttributeError:
             return False
+
+
+def _sets_from_csr(ids, ptr, indices, other):
+    """The dict of the sets of bipartite neighbors of each ID, from CSR arrays."""
+    neighbors = [other[j] for j in indices.tolist()]
+    bounds = ptr.tolist()
+    return IDDict(
+        (idx, set(neighbors[bounds[i] : bounds[i + 1]])) for i, idx in enumerate(ids)
+    )
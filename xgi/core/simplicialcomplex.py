@@ -13,6 +13,7 @@ from itertools import combinations, count
 from warnings import warn
 
 from ..exception import XGIError, frozen
+from ..stats import StatCache
 from ..utils.utilities import powerset, update_uid_counter
 from .hypergraph import Hypergraph
 from .views import EdgeView, NodeView
@@ -85,6 +86,12 @@ class SimplicialComplex(Hypergraph):
         self._node_attr = self._node_attr_dict_factory()
         self._edge = self._edge_dict_factory()
         self._edge_attr = self._edge_attr_dict_factory()
+        self._version = 0
+        self._stat_cache = StatCache()
+        self._incidence = None
+        self._edge_index = None
+        self._edge_index_version = None
+        self._id_ranks = None
 
         self._nodeview = NodeView(self)
         self._edgeview = EdgeView(self)
@@ -95,6 +102,24 @@ class SimplicialComplex(Hypergraph):
             to_simplicial_complex(incoming_data, create_using=self)
         self._net_attr.update(attr)  # must be after convert
 
+    def _modify(self):
+        """Bump the version of the complex, keeping the simplex index up to date.
+
+        The simplices are indexed by their members with the index of
+        :meth:`~xgi.core.hypergraph.Hypergraph._edge_fingerprints`, which is also
+        maintained by the inherited methods that do not modify the simplices, such as
+        :meth:`add_node`.  Must be called before modifying the simplices, and the
+        caller is responsible for updating the returned index accordingly.
+
+        Returns
+        -------
+        FingerprintIndex
+            The simplex IDs indexed by the frozensets of their members.
+
+        """
+        self._edge_fingerprints()
+        return self._modify_edges()
+
     def __str__(self):
         """Returns a short summary of the simplicial complex.
 
@@ -184,12 +209,14 @@ class SimplicialComplex(Hypergraph):
         remove_nodes_from
 
         """
+        index = self._modify()
         edge_neighbors = self._node[n]
         del self._node[n]
         del self._node_attr[n]
 
         for e in edge_neighbors:
             node_neighbors = self._edge[e]
+            index.discard(e)
             del self._edge[e]
             del self._edge_attr[e]
             for node in node_neighbors.difference({n}):
@@ -221,6 +248,7 @@ class SimplicialComplex(Hypergraph):
     def _add_simplex(self, members, idx=None, **attr):
         """Helper function to add a simplex to a simplicial complex, without any
         check. Does not automatically update self._edge_uid"""
+        index = self._modify()
 
         self._edge[idx] = set()
         for node in members:
@@ -234,13 +262,17 @@ class SimplicialComplex(Hypergraph):
         self._edge[idx] = members
         self._edge_attr[idx] = self._edge_attr_dict_factory()
         self._edge_attr[idx].update(attr)
+        index.add(idx, frozenset(members))
 
     def _add_face(self, members):
         """Helper function to add a face to a simplicial complex, without any
         check, and without attributes. Automatically updates self._edge_uid"""
+        index = self._modify()
 
         idx = next(self._edge_uid)
-        self._edge[idx] = frozenset(members)
+        members = frozenset(members)
+        self._edge[idx] = members
+        index.add(idx, members)
 
         for n in members:
             if n not in self._node:
@@ -364,12 +396,26 @@ class SimplicialComplex(Hypergraph):
     def _supfaces(self, simplex):
         """Returns list of simplices that contain simplex"""
 
-        return [s for s in self._edge.values() if simplex < s]
+        return [self._edge[id_] for id_ in self._supfaces_id(simplex)]
 
     def _supfaces_id(self, simplex):
-        """Returns list of IDs of simplices that contain simplex"""
+        """Returns list of IDs of simplices that contain simplex
+
+        The simplices containing `simplex` are those to which all of its nodes
+        belong, so they are found by intersecting the memberships of its nodes
+        instead of scanning all the simplices.  The IDs are in the order of the
+        simplices.
 
-        return [id_ for id_, s in self._edge.items() if simplex < s]
+        """
+        if not simplex:
+            return [id_ for id_, s in self._edge.items() if s]
+        if any(n not in self._node for n in simplex):
+            return []
+
+        memberships = sorted((self._node[n] for n in simplex), key=len)
+        ids = set(memberships[0]).intersection(*memberships[1:])
+        ids = [id_ for id_ in ids if len(self._edge[id_]) > len(simplex)]
+        return self._edge_fingerprints().ordered(ids)
 
     def add_simplices_from(self, ebunch_to_add, max_order=None, **attr):
         r"""Add multiple edges with optional attributes.
@@ -473,6 +519,7 @@ class SimplicialComplex(Hypergraph):
         {'one': {'color': 'red'}, 'two': {'age': 30}, 'three': {'color': 'blue', 'age': 40}, 0: {}, 1: {}, 2: {}}
 
         """
+        index = self._modify()
 
         # format 5 is the easiest one
         if isinstance(ebunch_to_add, dict):
@@ -606,6 +653,7 @@ class SimplicialComplex(Hypergraph):
                 self._edge[idx] = frozenset(members)
             except TypeError as e:
                 raise XGIError("Invalid ebunch format") from e
+            index.add(idx, self._edge[idx])
 
             for n in members:
                 if n not in self._node:
@@ -718,9 +766,12 @@ class SimplicialComplex(Hypergraph):
             edge ID to remove
 
         """
+        index = self._modify()
 
-        for node in self.edges.members(idx):
+        members = self._edge[idx]
+        for node in members:
             self._node[node].remove(idx)
+        index.discard(idx)
         del self._edge[idx]
         del self._edge_attr[idx]
 
@@ -804,7 +855,7 @@ class SimplicialComplex(Hypergraph):
         False
 
         """
-        return frozenset(simplex) in self._edge.values()
+        return frozenset(simplex) in self._edge_fingerprints()
 
     def copy(self):
         """A deep copy of the simplicial complex.
@@ -6,12 +6,18 @@ Views are automatically updaed when the hypergraph changes.
 
 """
 
-from collections import defaultdict
+import operator
+from collections import Counter
 from collections.abc import Mapping, Set
 from functools import reduce
+from numbers import Real
+
+import numpy as np
 
 from ..exception import IDNotFound, XGIError
 from ..stats import IDStat, dispatch_many_stats, dispatch_stat
+from ..utils.fingerprint import FingerprintIndex, directed_fingerprint, fingerprint
+from ..utils.incidence import csr_incidence
 
 
 class _stat_property:
@@ -32,6 +38,70 @@ class _stat_property:
         return stat
 
 
+_comparisons = {
+    "eq": operator.eq,
+    "neq": operator.ne,
+    "lt": operator.lt,
+    "gt": operator.gt,
+    "leq": operator.le,
+    "geq": operator.ge,
+}
+
+
+def _compare(values, val, mode):
+    """Boolean mask of the values that compare to `val` according to `mode`.
+
+    Parameters
+    ----------
+    values : numpy.ndarray or list
+        The values to compare.  A numeric array is compared with array operations when
+        `val` is a number, other values are compared one by one.
+    val : Any
+        A single value or, in the case of 'between', a tuple of length 2.
+    mode : str or function
+        One of the comparison modes of :meth:`IDView.filterby`.
+
+    Returns
+    -------
+    numpy.ndarray
+        The mask, of the same length as `values`.
+
+    Raises
+    ------
+    ValueError
+        If the mode is not recognized.
+
+    """
+    if mode in _comparisons:
+        compare = _comparisons[mode]
+        numeric = isinstance(val, Real)
+    elif mode == "between":
+
+        def compare(v, val):
+            return val[0] <= v <= val[1]
+
+        numeric = all(isinstance(v, Real) for v in val)
+    elif callable(mode):
+
+        def compare(v, val):
+            return bool(mode(v, val))
+
+        numeric = False
+    else:
+        raise ValueError(
+            f"Unrecognized mode {mode}. mode must be one of "
+            "'eq', 'neq', 'lt', 'gt', 'leq', 'geq', or 'between'."
+        )
+
+    if numeric and isinstance(values, np.ndarray) and values.dtype.kind in "biuf":
+        if mode == "between":
+            return (val[0] <= values) & (values <= val[1])
+        return compare(values, val)
+    if isinstance(values, np.ndarray):
+        values = values.tolist()
+    return np.fromiter((compare(v, val) for v in values), dtype=bool, count=len(values))
+
+
 __all__ = [
     "NodeView",
     "EdgeView",
@@ -61,6 +131,7 @@ class IDView(Mapping, Set):
     """
 
     _id_kind = None
+    _fingerprint = staticmethod(fingerprint)
 
     __slots__ = (
         "_net",
@@ -122,6 +193,10 @@ class IDView(Mapping, Set):
     def multi(self, names):
         return dispatch_many_stats(self._id_kind, self._net, self, names)
 
+    def _fingerprints(self):
+        """The index of the IDs by fingerprint maintained by the network, if any."""
+        return None
+
     @property
     def ids(self):
         """The ids in this view.
@@ -256,35 +331,7 @@ class IDView(Mapping, Set):
         NodeView((3,))
 
         """
-        if not isinstance(stat, IDStat):
-            try:
-                stat = getattr(self, stat)
-            except AttributeError as e:
-                raise AttributeError(f'Statistic with name "{stat}" not found') from e
-
-        values = stat.asdict()
-        if mode == "eq":
-            bunch = [idx for idx in self if values[idx] == val]
-        elif mode == "neq":
-            bunch = [idx for idx in self if values[idx] != val]
-        elif mode == "lt":
-            bunch = [idx for idx in self if values[idx] < val]
-        elif mode == "gt":
-            bunch = [idx for idx in self if values[idx] > val]
-        elif mode == "leq":
-            bunch = [idx for idx in self if values[idx] <= val]
-        elif mode == "geq":
-            bunch = [idx for idx in self if values[idx] >= val]
-        elif mode == "between":
-            bunch = [node for node in self if val[0] <= values[node] <= val[1]]
-        elif callable(mode):
-            bunch = [idx for idx in self if mode(values[idx], val)]
-        else:
-            raise ValueError(
-                f"Unrecognized mode {mode}. mode must be one of "
-                "'eq', 'neq', 'lt', 'gt', 'leq', 'geq', or 'between'."
-            )
-        return type(self).from_view(self, bunch)
+        return self.query().filterby(stat, val, mode).view()
 
     def filterby_attr(self, attr, val, mode="eq", missing=None):
         """Filter the IDs in this view by an attribute.
@@ -315,51 +362,31 @@ class IDView(Mapping, Set):
         when the attribute is a string. For example, the string comparison
         `'10' < '9'` evaluates to `True`.
         """
-        attrs = dispatch_stat(self._id_kind, self._net, self, "attrs")
-        values = attrs(attr, missing).asdict()
+        return self.query().filterby_attr(attr, val, mode, missing).view()
 
-        if mode == "eq":
-            bunch = [
-                idx for idx in self if values[idx] is not None and values[idx] == val
-            ]
-        elif mode == "neq":
-            bunch = [
-                idx for idx in self if values[idx] is not None and values[idx] != val
-            ]
-        elif mode == "lt":
-            bunch = [
-                idx for idx in self if values[idx] is not None and values[idx] < val
-            ]
-        elif mode == "gt":
-            bunch = [
-                idx for idx in self if values[idx] is not None and values[idx] > val
-            ]
-        elif mode == "leq":
-            bunch = [
-                idx for idx in self if values[idx] is not None and values[idx] <= val
-            ]
-        elif mode == "geq":
-            bunch = [
-                idx for idx in self if values[idx] is not None and values[idx] >= val
-            ]
-        elif mode == "between":
-            bunch = [
-                idx
-                for idx in self
-                if values[idx] is not None and val[0] <= values[idx] <= val[1]
-            ]
-        elif callable(mode):
-            bunch = [
-                idx
-                for idx in self
-                if values[idx] is not None and mode(values[idx], val)
-            ]
-        else:
-            raise ValueError(
-                f"Unrecognized mode {mode}. mode must be one of "
-                "'eq', 'neq', 'lt', 'gt', 'leq', 'geq', or 'between'."
-            )
-        return type(self).from_view(self, bunch)
+    def query(self):
+        """Start a lazy query on the IDs in this view.
+
+        Returns
+        -------
+        IDQuery
+            A query without any filter, which selects all the IDs of this view.
+
+        See Also
+        --------
+        IDQuery
+
+        Examples
+        --------
+        >>> import xgi
+        >>> H = xgi.Hypergraph([[1, 2, 3], [2, 3], [3, 4], [1, 4, 5]])
+        >>> H.set_edge_attributes({0: 0.2, 1: 0.7, 2: 0.9, 3: 0.4}, name="weight")
+        >>> q = H.edges.query().filterby("order", 1).filterby_attr("weight", 0.5, "gt")
+        >>> q.view()
+        EdgeView((1, 2))
+
+        """
+        return IDQuery(self)
 
     def neighbors(self, idx, s=1):
         """Find the neighbors of an ID.
@@ -399,12 +426,75 @@ class IDView(Mapping, Set):
                 i for n in self._id_dict[idx] for i in self._bi_id_dict[n]
             }.difference({idx})
         else:
-            return {
-                i
-                for n in self._id_dict[idx]
-                for i in self._bi_id_dict[n]
-                if len(self._id_dict[idx].intersection(self._id_dict[i])) >= s
-            }.difference({idx})
+            # the number of times an ID is reached is its overlap with idx
+            overlaps = Counter(
+                i for n in self._id_dict[idx] for i in self._bi_id_dict[n]
+            )
+            return {i for i, c in overlaps.items() if c >= s}.difference({idx})
+
+    def s_neighbors(self, s=1, sparse=False):
+        """Find the neighbors of all the IDs at once.
+
+        Two IDs are s-neighbors when they share at least `s` bipartite IDs.  The
+        overlaps of all the pairs are counted with a single sparse matrix product,
+        which is much faster than calling :meth:`neighbors` for each ID.
+
+        Parameters
+        ----------
+        s : int, optional
+            The intersection size s for two edges or nodes to be considered neighbors.
+            By default, 1.
+        sparse : bool, optional
+            Whether to return the sparse s-adjacency matrix instead of sets of IDs.
+            By default, False.
+
+        Returns
+        -------
+        dict or tuple
+            If `sparse` is False, a dict mapping each ID of this view to the set of
+            its neighbors.  Otherwise, a tuple (A, ids) where `A` is a
+            `scipy.sparse.csr_array` whose rows are the IDs of this view and whose
+            columns are all the IDs of the network, listed in `ids`, with the size of
+            the overlaps as entries.
+
+        Raises
+        ------
+        XGIError
+            If the network is directed.
+
+        See Also
+        --------
+        neighbors
+        ~xgi.linalg.hypergraph_matrix.adjacency_matrix
+
+        Examples
+        --------
+        >>> import xgi
+        >>> H = xgi.Hypergraph([[1, 2, 3], [2, 3, 4], [4, 5]])
+        >>> H.nodes.s_neighbors(2)
+        {1: set(), 2: {3}, 3: {2}, 4: set(), 5: set()}
+        >>> H.edges.s_neighbors(2)
+        {0: {1}, 1: {0}, 2: set()}
+
+        """
+        if self._id_kind not in {"node", "edge"}:
+            raise XGIError("s-neighbors are not defined for directed hypergraphs")
+        inc = csr_incidence(self._net)
+        if self._id_kind == "node":
+            ids, index = inc.node_ids, inc.node_index
+        else:
+            ids, index = inc.edge_ids, inc.edge_index
+        A = inc.overlaps(self._id_kind, s)
+        if self._ids is not self._id_dict:
+            A = A[[index[i] for i in self]]
+
+        if sparse:
+            return A, ids
+        ptr, cols = A.indptr.tolist(), A.indices.tolist()
+        return {
+            idx: {ids[j] for j in cols[ptr[k] : ptr[k + 1]]}
+            for k, idx in enumerate(self)
+        }
 
     def duplicates(self):
         """Find IDs that have a duplicate.
@@ -428,6 +518,9 @@ class IDView(Mapping, Set):
         guaranteed to be consecutive. For IDs with the same bipartite neighbors,
         only the first ID added is not a duplicate.
 
+        The edges are looked up in the index of their members maintained by the
+        network, so that only the duplicates are visited after the first call.
+
         See Also
         --------
         IDView.lookup
@@ -452,17 +545,13 @@ class IDView(Mapping, Set):
         EdgeView((1,))
 
         """
-        dups = []
-        hashes = defaultdict(list)
-        for idx, members in self._id_dict.items():
-            hashes[frozenset(members)].append(idx)
-        for _, edges in hashes.items():
-            if len(edges) > 1:
-                try:
-                    dups.extend(sorted(edges)[1:])
-                except TypeError:
-                    dups.extend(edges[1:])
-        return self.__class__.from_view(self, bunch=dups)
+        index = self._fingerprints()
+        if index is None:
+            index = FingerprintIndex(
+                (idx, self._fingerprint(neighbors))
+                for idx, neighbors in self._id_dict.items()
+            )
+        return self.__class__.from_view(self, bunch=index.duplicates())
 
     def lookup(self, neighbors):
         """Find IDs with the specified bipartite neighbors.
@@ -470,7 +559,8 @@ class IDView(Mapping, Set):
         Parameters
         ----------
         neighbors : Iterable
-            An iterable of IDs.
+            An iterable of IDs.  For directed hypergraphs, a pair of iterables
+            (in, out), as returned by `dimembers` and `dimemberships`.
 
         Returns
         -------
@@ -478,6 +568,11 @@ class IDView(Mapping, Set):
             A view containing only those IDs whose bipartite neighbors match
             `neighbors`.
 
+        Notes
+        -----
+        The edges are found in constant time in the index of their members maintained
+        by the network, which is built on the first call.
+
         See Also
         --------
         IDView.duplicates
@@ -504,8 +599,16 @@ class IDView(Mapping, Set):
         NodeView(('a',))
 
         """
-        sought = set(neighbors)
-        found = [idx for idx, neighbors in self._id_dict.items() if neighbors == sought]
+        sought = self._fingerprint(neighbors)
+        index = self._fingerprints()
+        if index is None:
+            found = [
+                idx
+                for idx, neighbors in self._id_dict.items()
+                if self._fingerprint(neighbors) == sought
+            ]
+        else:
+            found = index.get(sought)
         return self.__class__.from_view(self, bunch=found)
 
     @classmethod
@@ -534,17 +637,41 @@ class IDView(Mapping, Set):
         newview._id_attr = view._id_attr
         newview._bi_id_dict = view._bi_id_dict
         newview._bi_id_attr = view._bi_id_attr
-        all_ids = set(view._id_dict)
         if bunch is None:
-            newview._ids = all_ids
+            newview._ids = dict.fromkeys(view._id_dict)
         else:
             bunch = set(bunch)
-            wrong = bunch - all_ids
-            if wrong:
-                raise IDNotFound(f"IDs {wrong} not in the hypergraph")
-            newview._ids = [i for i in view._id_dict if i in bunch]
+            rank = view._rank()
+            if not all(i in rank for i in bunch):
+                # the positions may be out of date if the network was modified in place
+                rank = view._rank(refresh=True)
+                wrong = {i for i in bunch if i not in rank}
+                if wrong:
+                    raise IDNotFound(f"IDs {wrong} not in the hypergraph")
+            ordered = sorted(bunch, key=rank.__getitem__)
+            newview._ids = dict.fromkeys(ordered)
         return newview
 
+    def _rank(self, refresh=False):
+        """The position of each ID of the network, for sorting a bunch of IDs.
+
+        The positions are computed once and reused until the network is modified, so
+        that the views of a few IDs can be created in time proportional to their
+        number.
+
+        """
+        net = self._net
+        cached = net._id_ranks
+        if refresh or cached is None or cached[0] != net._version:
+            cached = (net._version, {})
+            net._id_ranks = cached
+        ranks = cached[1]
+        rank = ranks.get(self._id_kind)
+        if rank is None:
+            rank = {idx: i for i, idx in enumerate(self._id_dict)}
+            ranks[self._id_kind] = rank
+        return rank
+
     def _from_iterable(self, it):
         """Construct an instance of the class from any iterable input.
 
@@ -555,6 +682,149 @@ class IDView(Mapping, Set):
         return self.from_view(self, it)
 
 
+class IDQuery:
+    """Lazy combination of filters on the IDs of a view.
+
+    The filters of :meth:`IDView.filterby` and :meth:`IDView.filterby_attr` can be
+    chained on a query without building the intermediate views.  They are evaluated
+    together as boolean masks over the IDs of the view when :meth:`mask` or
+    :meth:`view` is called.  The built-in stats that have an array representation, such
+    as the degree of the nodes or the order of the edges, are compared with array
+    operations.
+
+    Parameters
+    ----------
+    view : IDView
+        The view whose IDs are filtered.
+
+    See Also
+    --------
+    IDView.query
+
+    Notes
+    -----
+    Queries are immutable: each filter returns a new query, so that a query may be
+    extended in several ways.
+
+    Examples
+    --------
+    >>> import xgi
+    >>> H = xgi.Hypergraph([[1, 2, 3], [2, 3], [3, 4], [1, 4, 5]])
+    >>> q = H.nodes.query().filterby("degree", 2)
+    >>> q.view()
+    NodeView((1, 2, 4))
+    >>> q.mask()
+    array([ True,  True, False,  True, False])
+    >>> q.filterby_attr("color", "red").view()
+    NodeView(())
+
+    """
+
+    __slots__ = ("_view", "_filters")
+
+    def __init__(self, view, filters=()):
+        self._view = view
+        self._filters = tuple(filters)
+
+    def __repr__(self):
+        return (
+            f"{self.__class__.__name__}({self._view!r}, {len(self._filters)} filters)"
+        )
+
+    def filterby(self, stat, val, mode="eq"):
+        """Add a filter by a statistic.
+
+        Parameters are the same as in :meth:`IDView.filterby`.
+
+        Returns
+        -------
+        IDQuery
+            A new query with the additional filter.
+
+        """
+        view = self._view
+        if not isinstance(stat, IDStat):
+            try:
+                stat = getattr(view, stat)
+            except AttributeError as e:
+                raise AttributeError(f'Statistic with name "{stat}" not found') from e
+        elif stat.view is not view:
+            # evaluate the stat on the IDs of the query, in their order
+            stat = type(stat)(stat.net, view, stat.func, stat.args, stat.kwargs)
+        return IDQuery(self._view, self._filters + (("stat", stat, val, mode),))
+
+    def filterby_attr(self, attr, val, mode="eq", missing=None):
+        """Add a filter by an attribute.
+
+        Parameters are the same as in :meth:`IDView.filterby_attr`.
+
+        Returns
+        -------
+        IDQuery
+            A new query with the additional filter.
+
+        """
+        view = self._view
+        attrs = dispatch_stat(view._id_kind, view._net, view, "attrs")(attr, missing)
+        return IDQuery(view, self._filters + (("attr", attrs, val, mode),))
+
+    def mask(self):
+        """Evaluate the filters.
+
+        Returns
+        -------
+        numpy.ndarray
+            Boolean array which is True for the IDs of the view, in order, that pass
+            all the filters.
+
+        Raises
+        ------
+        ValueError
+            If the mode of a filter is not recognized.
+
+        """
+        mask = np.ones(len(self._view), dtype=bool)
+        for kind, stat, val, mode in self._filters:
+            if kind == "stat":
+                values = stat._array()
+                if values is None:
+                    values = stat.aslist()
+            else:
+                values = stat.aslist()
+                # IDs whose attribute is None are always ignored
+                mask &= np.fromiter(
+                    (v is not None for v in values), dtype=bool, count=len(values)
+                )
+
+            # only the IDs that passed the previous filters are compared
+            alive = np.flatnonzero(mask)
+            if isinstance(values, np.ndarray):
+                values = values[alive]
+            else:
+                values = [values[i] for i in alive.tolist()]
+                if values and all(isinstance(v, Real) for v in values):
+                    values = np.asarray(values)
+            mask[alive] = _compare(values, val, mode)
+        return mask
+
+    def view(self):
+        """The view of the IDs that pass all the filters.
+
+        Returns
+        -------
+        IDView
+            A view of the same type as the view of the query, with the selected IDs in
+            the same order.
+
+        """
+        view = self._view
+        if not self._filters:
+            return view
+        ids = list(view)
+        bunch = [ids[i] for i in np.flatnonzero(self.mask()).tolist()]
+        return type(view).from_view(view, bunch)
+
+
 class NodeView(IDView):
     """An IDView that keeps track of node ids.
 
@@ -703,6 +973,9 @@ class EdgeView(IDView):
         else:
             super().__init__(H, bunch)
 
+    def _fingerprints(self):
+        return self._net._edge_fingerprints()
+
     def members(self, e=None, dtype=list):
         """Get the node ids that are members of an edge.
 
@@ -830,19 +1103,15 @@ class EdgeView(IDView):
                 if reduce(lambda x, y: x & y, (nodes[n] for n in e)) == {i}:
                     max_edges.add(i)
         else:
-            # This data structure so that the algorithm can handle multi-edges
-            dups = defaultdict(list)
-            for idx, members in edges.items():
-                dups[frozenset(members)].append(idx)
-
+            # The index of the members handles multi-edges
+            index = self._fingerprints()
             for i, e in edges.items():
                 # If a multi-edge has already been added to the set of
                 # maximal edges, we don't need to check.
                 if i not in max_edges:
-                    if reduce(lambda x, y: x & y, (nodes[n] for n in e)) == set(
-                        dups[frozenset(e)]
-                    ):
-                        max_edges.update(dups[frozenset(e)])
+                    dups = set(index.get(frozenset(e)))
+                    if reduce(lambda x, y: x & y, (nodes[n] for n in e)) == dups:
+                        max_edges.update(dups)
 
         return self.from_view(self, bunch=max_edges)
 
@@ -874,6 +1143,7 @@ class DiNodeView(IDView):
     """
 
     _id_kind = "dinode"
+    _fingerprint = staticmethod(directed_fingerprint)
 
     attrs = _stat_property("attrs")
     degree = _stat_property("degree")
@@ -999,6 +1269,7 @@ class DiEdgeView(IDView):
     """
 
     _id_kind = "diedge"
+    _fingerprint = staticmethod(directed_fingerprint)
 
     attrs = _stat_property("attrs")
     order = _stat_property("order")
@@ -1014,6 +1285,9 @@ class DiEdgeView(IDView):
         else:
             super().__init__(H, bunch)
 
+    def _fingerprints(self):
+        return self._net._edge_fingerprints()
+
     def dimembers(self, e=None, dtype=list):
         """Get the node ids that are members of an edge.
 
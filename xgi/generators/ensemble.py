@@ -0,0 +1,154 @@
+"""Generate ensembles of independent random hypergraphs in parallel."""
+
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from functools import partial
+from itertools import islice
+
+import numpy as np
+
+from ..utils.utilities import _num_workers
+from .random import watts_strogatz_hypergraph
+from .simplicial_complexes import random_simplicial_complex
+
+__all__ = ["ensemble"]
+
+# generators that pass their seed to np.random.seed, which only takes 32-bit seeds
+_LEGACY_NUMPY_SEEDED = {random_simplicial_complex, watts_strogatz_hypergraph}
+
+# samples sent back from a worker at once, so that the first ones arrive early
+_MAX_CHUNKSIZE = 64
+
+
+def ensemble(
+    generator, num_samples, *args, seed=None, stat=None, n_jobs=None, **kwargs
+):
+    """Generate independent samples of a random hypergraph model.
+
+    Parameters
+    ----------
+    generator : callable
+        The generator of the model, such as
+        :func:`~xgi.generators.uniform.uniform_HSBM`.  It must accept a `seed`
+        keyword argument.
+    num_samples : int
+        The number of samples to generate.
+    *args, **kwargs
+        The arguments of `generator`.
+    seed : int or None (default)
+        The seed of the ensemble.  With the same seed, the same samples are generated
+        in the same order, whatever the number of processes.
+    stat : callable, optional
+        A function applied to each sample, such as
+        ``operator.attrgetter("num_edges")``, whose result is returned instead of the
+        sample.  Only the results are sent back from the worker processes, which is
+        cheaper than sending the hypergraphs.  By default, None.
+    n_jobs : int, optional
+        The number of processes used to generate the samples.  If None (default), the
+        samples are generated in the current process, and if -1, all the CPUs are
+        used.
+
+    Yields
+    ------
+    Hypergraph or object
+        The samples, or the results of `stat` on the samples, in order, as soon as
+        they are generated.
+
+    Raises
+    ------
+    XGIError
+        If `n_jobs` is not a positive integer, -1, or None.
+
+    Notes
+    -----
+    The seed of sample `i` is drawn from the `i`-th child spawned by
+    :class:`numpy.random.SeedSequence` from `seed`, so that the samples are
+    independent.  The generator receives it as a 128-bit integer, which keeps the
+    entropy of the child when passed to :func:`random.seed` or
+    :func:`numpy.random.default_rng`, so that two samples practically never share
+    their seed.  The generators of XGI that pass their seed to
+    :func:`numpy.random.seed`, which only accepts 32-bit seeds, receive 32 bits
+    instead, so that samples may share their seed in ensembles of more than about
+    ten thousand samples.  Other generators must not pass their seed to
+    :func:`numpy.random.seed`.
+
+    When `n_jobs` is set, `generator`, its arguments, and `stat` are sent to the
+    worker processes, so they must be picklable: lambdas and nested functions are
+    not, unlike module-level functions, :func:`functools.partial` objects and
+    :func:`operator.attrgetter` objects.
+
+    Examples
+    --------
+    >>> import xgi
+    >>> from operator import attrgetter
+    >>> samples = xgi.ensemble(xgi.random_hypergraph, 3, 10, [0.1, 0.01], seed=1)
+    >>> [H.num_nodes for H in samples]
+    [10, 10, 10]
+    >>> sizes = xgi.ensemble(
+    ...     xgi.random_hypergraph, 100, 10, [0.1], seed=1, stat=attrgetter("num_edges")
+    ... )
+    >>> # sizes = xgi.ensemble(..., n_jobs=-1) generates the same sizes in parallel
+    >>> len(list(sizes))
+    100
+
+    """
+    workers = _num_workers(n_jobs)
+    root = np.random.SeedSequence(seed)
+    words = 1 if _unwrap(generator) in _LEGACY_NUMPY_SEEDED else 4
+    # the children are spawned one at a time, so that long ensembles start at once
+    tasks = (
+        (generator, args, kwargs, _child_seed(root, words), stat)
+        for _ in range(num_samples)
+    )
+
+    if workers == 1:
+        for task in tasks:
+            yield _sample(task)
+        return
+
+    chunksize = min(max(1, -(-num_samples // (4 * workers))), _MAX_CHUNKSIZE)
+    chunks = iter(lambda: list(islice(tasks, chunksize)), [])
+    executor = ProcessPoolExecutor(max_workers=workers)
+    try:
+        # at most two chunks per worker are pending, so that the samples are not
+        # generated faster than they are consumed
+        pending = deque(
+            executor.submit(_sample_chunk, chunk)
+            for chunk in islice(chunks, 2 * workers)
+        )
+        while pending:
+            results = pending.popleft().result()
+            for chunk in islice(chunks, 1):
+                pending.append(executor.submit(_sample_chunk, chunk))
+            yield from results
+    finally:
+        # stop the pending samples if the caller stops iterating
+        executor.shutdown(cancel_futures=True)
+
+
+def _child_seed(root, words):
+    """Integer seed of `words` 32-bit words from the next child of a seed sequence."""
+    (child,) = root.spawn(1)
+    seed = 0
+    for word in child.generate_state(words).tolist():
+        seed = (seed << 32) | word
+    return seed
+
+
+def _unwrap(generator):
+    """The function called by a generator, through :func:`functools.partial`."""
+    while isinstance(generator, partial):
+        generator = generator.func
+    return generator
+
+
+def _sample_chunk(tasks):
+    """Generate a chunk of samples, in a worker."""
+    return [_sample(task) for task in tasks]
+
+
+def _sample(task):
+    """Generate one sample, in a worker."""
+    generator, args, kwargs, seed, stat = task
+    H = generator(*args, seed=seed, **kwargs)
+    return H if stat is None else stat(H)
@@ -3,13 +3,14 @@
 import random
 import warnings
 from collections import defaultdict
-from itertools import combinations
+from itertools import combinations, count
 from warnings import warn
 
 import numpy as np
 from scipy.special import comb
 
-from ..utils import geometric
+from ..core import Hypergraph
+from ..utils import CSRIncidence, IDDict, geometric
 from .classic import empty_hypergraph
 from .lattice import ring_lattice
 from .uniform import _index_to_edge_comb
@@ -212,8 +213,8 @@ def chung_lu_hypergraph(k1, k2, seed=None):
     k2 : dictionary
         Dictionary where the keys are edge ids
         and the values are edge sizes.
-    seed : integer or None (default)
-            The seed for the random number generator.
+    seed : integer, numpy.random.Generator, or None (default)
+        The seed for the random number generator.
 
     Returns
     -------
@@ -246,15 +247,12 @@ def chung_lu_hypergraph(k1, k2, seed=None):
     >>> H = xgi.chung_lu_hypergraph(k1, k2)
 
     """
-    if seed is not None:
-        random.seed(seed)
+    rng = np.random.default_rng(seed)
 
     # sort dictionary by degree in decreasing order
     node_labels = [n for n, _ in sorted(k1.items(), key=lambda d: d[1], reverse=True)]
     edge_labels = [m for m, _ in sorted(k2.items(), key=lambda d: d[1], reverse=True)]
 
-    m = len(k2)
-
     if sum(k1.values()) != sum(k2.values()):
         warnings.warn(
             "The sum of the degree sequence does not match the sum of the size sequence"
@@ -262,28 +260,18 @@ def chung_lu_hypergraph(k1, k2, seed=None):
 
     S = sum(k1.values())
 
-    H = empty_hypergraph()
-    H.add_nodes_from(node_labels)
-
-    for u in node_labels:
-        j = 0
-        v = edge_labels[j]  # start from beginning every time
-        p = min((k1[u] * k2[v]) / S, 1)
-
-        while j < m:
-            if p != 1:
-                j += geometric(p)
-            if j < m:
-                v = edge_labels[j]
-                q = min((k1[u] * k2[v]) / S, 1)
-                r = random.random()
-                if r < q / p:
-                    # no duplicates
-                    H.add_node_to_edge(v, u)
-                p = q
-                j += 1
+    if S == 0:
+        # no node has any incidence
+        rows = cols = np.array([], dtype=np.int64)
+        return _from_incidences(node_labels, edge_labels, rows, cols)
 
-    return H
+    rows, cols = _sample_incidences(
+        np.array([k1[u] for u in node_labels], dtype=float),
+        np.array([k2[v] for v in edge_labels], dtype=float),
+        1 / S,
+        rng,
+    )
+    return _from_incidences(node_labels, edge_labels, rows, cols)
 
 
 def dcsbm_hypergraph(k1, k2, g1, g2, omega, seed=None):
@@ -312,7 +300,7 @@ def dcsbm_hypergraph(k1, k2, g1, g2, omega, seed=None):
         The number of rows must match the number of node communities
         and the number of columns must match the number of edge
         communities.
-    seed : int or None (default)
+    seed : int, numpy.random.Generator, or None (default)
         Seed for the random number generator.
 
     Returns
@@ -351,8 +339,7 @@ def dcsbm_hypergraph(k1, k2, g1, g2, omega, seed=None):
     >>> # H = xgi.dcsbm_hypergraph(k1, k2, g1, g2, omega)
 
     """
-    if seed is not None:
-        random.seed(seed)
+    rng = np.random.default_rng(seed)
 
     # sort dictionary by degree in decreasing order
     node_labels = [n for n, _ in sorted(k1.items(), key=lambda d: d[1], reverse=True)]
@@ -373,17 +360,12 @@ def dcsbm_hypergraph(k1, k2, g1, g2, omega, seed=None):
 
     # get indices for each community
     community1_nodes = defaultdict(list)
-    for label in node_labels:
-        group = g1[label]
-        community1_nodes[group].append(label)
+    for i, label in enumerate(node_labels):
+        community1_nodes[g1[label]].append(i)
 
     community2_nodes = defaultdict(list)
-    for label in edge_labels:
-        group = g2[label]
-        community2_nodes[group].append(label)
-
-    H = empty_hypergraph()
-    H.add_nodes_from(node_labels)
+    for j, label in enumerate(edge_labels):
+        community2_nodes[g2[label]].append(j)
 
     kappa1 = defaultdict(lambda: 0)
     kappa2 = defaultdict(lambda: 0)
@@ -392,8 +374,13 @@ def dcsbm_hypergraph(k1, k2, g1, g2, omega, seed=None):
     for idx, g in g2.items():
         kappa2[g] += k2[idx]
 
-    for group1 in community1_nodes.keys():
-        for group2 in community2_nodes.keys():
+    degrees = np.array([k1[u] for u in node_labels], dtype=float)
+    sizes = np.array([k2[v] for v in edge_labels], dtype=float)
+
+    rows = []
+    cols = []
+    for group1, nodes in community1_nodes.items():
+        for group2, edges in community2_nodes.items():
             # for each constant probability patch
             try:
                 group_constant = omega[group1, group2] / (
@@ -402,24 +389,108 @@ def dcsbm_hypergraph(k1, k2, g1, g2, omega, seed=None):
             except ZeroDivisionError:
                 group_constant = 0
 
-            for u in community1_nodes[group1]:
-                j = 0
-                v = community2_nodes[group2][j]  # start from beginning every time
-                # max probability
-                p = min(k1[u] * k2[v] * group_constant, 1)
-                while j < len(community2_nodes[group2]):
-                    if p != 1:
-                        j += geometric(p)
-                    if j < len(community2_nodes[group2]):
-                        v = community2_nodes[group2][j]
-                        q = min((k1[u] * k2[v]) * group_constant, 1)
-                        r = random.random()
-                        if r < q / p:
-                            # no duplicates
-                            H.add_node_to_edge(v, u)
-                        p = q
-                        j += 1
-    return H
+            nodes = np.array(nodes)
+            edges = np.array(edges)
+            r, c = _sample_incidences(degrees[nodes], sizes[edges], group_constant, rng)
+            rows.append(nodes[r])
+            cols.append(edges[c])
+
+    return _from_incidences(
+        node_labels, edge_labels, np.concatenate(rows), np.concatenate(cols)
+    )
+
+
+def _sample_incidences(weights1, weights2, scale, rng):
+    """Sample each (node, edge) pair with probability proportional to their weights.
+
+    The pair (i, j) is an incidence with probability
+    ``min(weights1[i] * weights2[j] * scale, 1)``, independently of the other pairs.
+    Since `weights2` is sorted in decreasing order, the edges of each node can be
+    visited with geometric skips, drawn for all the nodes at once.
+
+    Parameters
+    ----------
+    weights1 : numpy.ndarray
+        The weights of the nodes.
+    weights2 : numpy.ndarray
+        The weights of the edges, in decreasing order.
+    scale : float
+        The factor of the products of the weights.
+    rng : numpy.random.Generator
+        The random number generator.
+
+    Returns
+    -------
+    numpy.ndarray, numpy.ndarray
+        The node and edge indices of the incidences.
+
+    """
+    rows = np.arange(len(weights1))
+    if len(weights2) == 0:
+        return rows[:0], rows[:0]
+    a = weights1 * scale
+    # an upper bound of the probabilities of the edges that are left
+    p = np.minimum(a * weights2[0], 1)
+    j = np.zeros(len(rows), dtype=np.int64)
+
+    keep = p > 0
+    rows, a, p, j = rows[keep], a[keep], p[keep], j[keep]
+    sampled_rows = []
+    sampled_cols = []
+    while len(rows):
+        # skip the edges before the next candidate
+        j += rng.geometric(p) - 1
+        keep = j < len(weights2)
+        rows, a, p, j = rows[keep], a[keep], p[keep], j[keep]
+
+        q = np.minimum(a * weights2[j], 1)
+        accept = rng.random(len(rows)) * p < q
+        sampled_rows.append(rows[accept])
+        sampled_cols.append(j[accept])
+
+        p = q
+        j += 1
+        keep = (j < len(weights2)) & (p > 0)
+        rows, a, p, j = rows[keep], a[keep], p[keep], j[keep]
+
+    if not sampled_rows:
+        return rows, j
+    return np.concatenate(sampled_rows), np.concatenate(sampled_cols)
+
+
+def _from_incidences(node_labels, edge_labels, rows, cols):
+    """A hypergraph built at once from the indices of its incidences.
+
+    Parameters
+    ----------
+    node_labels, edge_labels : list
+        The node and edge IDs.
+    rows, cols : numpy.ndarray
+        The node and edge indices of the incidences.
+
+    Returns
+    -------
+    Hypergraph
+        The hypergraph with all the nodes, and the edges with at least one member,
+        in the order of `edge_labels`.
+
+    """
+    order = np.argsort(cols, kind="stable")
+    edges, sizes = np.unique(cols[order], return_counts=True)
+    edge_ids = [edge_labels[e] for e in edges.tolist()]
+    edge_ptr = np.zeros(len(edges) + 1, dtype=np.int64)
+    np.cumsum(sizes, out=edge_ptr[1:])
+    incidence = CSRIncidence(node_labels, edge_ids, edge_ptr, rows[order])
+
+    int_ids = [e for e in edge_ids if isinstance(e, (int, np.integer))]
+    return Hypergraph._from_incidence(
+        incidence,
+        IDDict((n, IDDict()) for n in node_labels),
+        IDDict((e, IDDict()) for e in edge_ids),
+        {},
+        count(max(int_ids) + 1 if int_ids else 0),
+        compact=False,
+    )
 
 
 def watts_strogatz_hypergraph(n, d, k, l, p, seed=None):
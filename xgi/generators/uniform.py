@@ -21,7 +21,7 @@ __all__ = [
 ]
 
 
-def uniform_hypergraph_configuration_model(k, m, seed=None):
+def uniform_hypergraph_configuration_model(k, m, seed=None, num_samples=None):
     """
     A function to generate an m-uniform configuration model
 
@@ -32,13 +32,16 @@ def uniform_hypergraph_configuration_model(k, m, seed=None):
         and the values are node degrees.
     m : int
         specifies the hyperedge size
-    seed : integer or None (default)
+    seed : integer, numpy.random.Generator, or None (default)
         The seed for the random number generator
+    num_samples : int or None (default)
+        If given, the number of independent hypergraphs to generate at once.
 
     Returns
     -------
-    Hypergraph object
-        The generated hypergraph
+    Hypergraph object or list of Hypergraph objects
+        The generated hypergraph, or a list of `num_samples` hypergraphs if
+        `num_samples` is given.
 
     Warns
     -----
@@ -53,6 +56,11 @@ def uniform_hypergraph_configuration_model(k, m, seed=None):
     This algorithm normally creates multi-edges and loopy hyperedges.
     We remove the loopy hyperedges.
 
+    The stubs are matched by shuffling them and cutting the shuffled array into
+    hyperedges of size m, which takes linear time in the sum of the degrees.  When
+    `num_samples` is given, the stubs of all the samples are shuffled together in
+    one array.
+
     References
     ----------
     "The effect of heterogeneity on hypergraph contagion models"
@@ -70,40 +78,45 @@ def uniform_hypergraph_configuration_model(k, m, seed=None):
     >>> H = xgi.uniform_hypergraph_configuration_model(k, m)
 
     """
-    if seed is not None:
-        random.seed(seed)
+    rng = np.random.default_rng(seed)
+
+    ids = list(k)
+    degrees = np.array([int(k[idx]) for idx in ids], dtype=np.int64)
+    stubs = np.repeat(np.arange(len(ids)), degrees)
+    samples = 1 if num_samples is None else num_samples
 
     # Making sure we have the right number of stubs
-    remainder = sum(k.values()) % m
-    if remainder != 0:
+    remainder = len(stubs) % m
+    if remainder == 0:
+        stubs = np.tile(stubs, (samples, 1))
+    else:
         warnings.warn(
             "This degree sequence is not realizable. "
             "Increasing the degree of random nodes so that it is."
         )
-        random_ids = random.sample(list(k.keys()), int(round(m - remainder)))
-        for idx in random_ids:
-            k[idx] = k[idx] + 1
-
-    stubs = []
-    # Creating the list to index through
-    for idx in k:
-        stubs.extend([idx] * int(k[idx]))
+        extra = [
+            rng.choice(len(ids), m - remainder, replace=False) for _ in range(samples)
+        ]
+        stubs = np.hstack(
+            [np.tile(stubs, (samples, 1)), np.array(extra).reshape(samples, -1)]
+        )
 
-    H = empty_hypergraph()
-    H.add_nodes_from(k.keys())
+    # Matching the stubs and removing the loopy hyperedges
+    stubs = rng.permuted(stubs, axis=1)
+    node_ids = np.empty(len(ids), dtype=object)
+    node_ids[:] = ids
 
-    while len(stubs) != 0:
-        u = random.sample(range(len(stubs)), m)
-        edge = set()
-        for index in u:
-            edge.add(stubs[index])
-        if len(edge) == m:
-            H.add_edge(edge)
+    hypergraphs = []
+    for row in stubs:
+        edges = np.sort(row.reshape(-1, m), axis=1)
+        edges = edges[(edges[:, 1:] != edges[:, :-1]).all(axis=1)]
 
-        for index in sorted(u, reverse=True):
-            del stubs[index]
+        H = empty_hypergraph()
+        H.add_nodes_from(ids)
+        H.add_edges_from(node_ids[edges].tolist())
+        hypergraphs.append(H)
 
-    return H
+    return hypergraphs[0] if num_samples is None else hypergraphs
 
 
 def uniform_HSBM(n, m, p, sizes, seed=None):
@@ -45,6 +45,9 @@ array([[1, 0, 0],
 """
 
 import numpy as np
+from scipy.sparse import csr_array
+
+from ..exception import XGIError
 
 __all__ = [
     "boundary_matrix",
@@ -52,7 +55,104 @@ __all__ = [
 ]
 
 
-def boundary_matrix(S, order=1, orientations=None, index=False):
+def _sort_key(node):
+    """Key that sorts a mixed list of numbers and strings.
+
+    Node labels which are numbers are put before strings, thus giving a list
+    [sorted numbers, sorted strings].  Sorting the members of a simplex gives it a
+    reference orientation.
+
+    """
+    return (isinstance(node, str), node)
+
+
+def _boundary_matrices(S, orders, orientations=None):
+    """Sparse boundary matrices of several orders.
+
+    The simplices of all the requested orders are collected in a single pass over the
+    simplicial complex, and the faces of each simplex are located with a hash map from
+    their members to their row index.
+
+    Parameters
+    ----------
+    S : simplicial complex object
+        The simplicial complex of interest
+    orders : iterable of int
+        The orders of the boundary matrices to compute.
+    orientations : dict, optional
+        Dictionary mapping non-singleton simplices IDs to their boolean orientation.
+        By default, all orientations are 0.
+
+    Returns
+    -------
+    dict
+        Maps each order to a tuple `(B, rowdict, coldict)`, where `B` is a
+        scipy.sparse.csr_array and `rowdict` and `coldict` map indices to simplices IDs.
+
+    Raises
+    ------
+    XGIError
+        If a face of one of the simplices is not in the simplicial complex.
+
+    """
+    orders = set(orders)
+
+    # the (order - 1)-simplices and (order)-simplices are those with size order and
+    # order + 1 respectively, with the nodes standing for the simplices of size 1.
+    sizes = {k for order in orders for k in (order, order + 1) if k > 1}
+    simplices = {k: [] for k in sizes}
+    for idx, members in S._edge.items():
+        if len(members) in simplices:
+            simplices[len(members)].append(idx)
+    simplices[0] = []
+    simplices[1] = list(S._node)
+
+    if orientations is None:
+        orientations = {idx: 0 for k in sizes for idx in simplices[k]}
+
+    matrices = {}
+    for order in orders:
+        d_ids = simplices[order] if order >= 0 else []
+        u_ids = simplices[order + 1] if order >= -1 else []
+
+        if order == 1:
+            d_index = {frozenset([n]): i for i, n in enumerate(d_ids)}
+            d_orientation = np.zeros(len(d_ids), dtype=int)
+        else:
+            d_index = {frozenset(S._edge[idx]): i for i, idx in enumerate(d_ids)}
+            d_orientation = np.array([orientations[idx] for idx in d_ids], dtype=int)
+
+        rows, cols, parity = [], [], []
+        if order >= 1 and d_ids:
+            for col, idx in enumerate(u_ids):
+                members = sorted(S._edge[idx], key=_sort_key)
+                u_orientation = orientations[idx]
+                for i in range(len(members)):
+                    face = frozenset(members[:i] + members[i + 1 :])
+                    try:
+                        rows.append(d_index[face])
+                    except KeyError as e:
+                        raise XGIError(
+                            f"The face {set(face)} of simplex {idx} is not in the "
+                            "simplicial complex"
+                        ) from e
+                    cols.append(col)
+                    parity.append(u_orientation + i)
+
+        rows = np.array(rows, dtype=int)
+        parity = (np.array(parity, dtype=int) + d_orientation[rows]) % 2
+        B = csr_array(
+            (1.0 - 2 * parity, (rows, np.array(cols, dtype=int))),
+            shape=(len(d_ids), len(u_ids)),
+        )
+        rowdict = dict(enumerate(d_ids))
+        coldict = dict(enumerate(u_ids))
+        matrices[order] = (B, rowdict, coldict)
+
+    return matrices
+
+
+def boundary_matrix(S, order=1, orientations=None, index=False, sparse=False):
     """Generate the boundary matrices of an oriented simplicial complex.
 
     The rows correspond to the (order-1)-simplices and the columns to the
@@ -71,10 +171,12 @@ def boundary_matrix(S, order=1, orientations=None, index=False):
     index: bool, default: False
         Specifies whether to output dictionaries
         mapping the simplices IDs to indices
+    sparse: bool, default: False
+        Specifies whether the output matrix is a scipy sparse matrix or a numpy matrix
 
     Returns
     -------
-    B: numpy.ndarray
+    B: numpy.ndarray or scipy.sparse.csr_array
         The boundary matrix of the chosen order, has dimension
         (n_simplices of given order - 1, n_simplices of given order)
     rowdict: dict
@@ -90,75 +192,24 @@ def boundary_matrix(S, order=1, orientations=None, index=False):
     by Leo J. Grady and Jonathan R. Polimeni
     https://doi.org/10.1007/978-1-84996-290-2
 
-    """
-
-    # Extract the simplices involved
-    if order == 1:
-        simplices_d_ids = S.nodes
-    else:
-        simplices_d_ids = S.edges.filterby("order", order - 1)
+    Examples
+    --------
+    >>> import xgi
+    >>> S = xgi.SimplicialComplex([[1, 2, 3]])
+    >>> B = xgi.boundary_matrix(S, order=2, sparse=True)
+    >>> B.toarray()
+    array([[ 1.],
+           [ 1.],
+           [-1.]])
 
-    if order == 0:
-        simplices_u_ids = S.nodes
-    else:
-        simplices_u_ids = S.edges.filterby("order", order)
-    nd = len(simplices_d_ids)
-    nu = len(simplices_u_ids)
-
-    simplices_d_dict = dict(zip(simplices_d_ids, range(nd)))
-    simplices_u_dict = dict(zip(simplices_u_ids, range(nu)))
-
-    if index:
-        rowdict = {v: k for k, v in simplices_d_dict.items()}
-        coldict = {v: k for k, v in simplices_u_dict.items()}
-
-    if orientations is None:
-        orientations = {idd: 0 for idd in S.edges.filterby("order", 1, mode="geq")}
-
-    B = np.zeros((nd, nu))
-    if not (nu == 0 or nd == 0):
-        if order == 1:
-            for u_simplex_id in simplices_u_ids:
-                u_simplex = list(S.edges.members(u_simplex_id))
-                u_simplex.sort(
-                    key=lambda e: (isinstance(e, str), e)
-                )  # Sort the simplex's vertices to get a reference orientation
-                # The key is needed to sort a mixed list of numbers and strings:
-                #   it ensures that node labels which are numbers are put before
-                #   strings, thus giving a list [sorted numbers, sorted strings]
-                matrix_id = simplices_u_dict[u_simplex_id]
-                head_idx = u_simplex[1]
-                tail_idx = u_simplex[0]
-                B[simplices_d_dict[head_idx], matrix_id] = (-1) ** orientations[
-                    u_simplex_id
-                ]
-                B[simplices_d_dict[tail_idx], matrix_id] = -(
-                    (-1) ** orientations[u_simplex_id]
-                )
-        else:
-            for u_simplex_id in simplices_u_ids:
-                u_simplex = list(S.edges.members(u_simplex_id))
-                u_simplex.sort(
-                    key=lambda e: (isinstance(e, str), e)
-                )  # Sort the simplex's vertices to get a reference orientation
-                # The key is needed to sort a mixed list of numbers and strings:
-                #   it ensures that node labels which are numbers are put before
-                #   strings, thus giving a list [sorted numbers, sorted strings]
-                matrix_id = simplices_u_dict[u_simplex_id]
-                u_simplex_subfaces = S._subfaces(u_simplex, all=False)
-                subfaces_induced_orientation = [
-                    (orientations[u_simplex_id] + order - i) % 2
-                    for i in range(order + 1)
-                ]
-                for count, subf in enumerate(u_simplex_subfaces):
-                    subface_ID = list(S.edges)[S.edges.members().index(frozenset(subf))]
-                    B[simplices_d_dict[subface_ID], matrix_id] = (-1) ** (
-                        subfaces_induced_orientation[count] + orientations[subface_ID]
-                    )
+    """
+    B, rowdict, coldict = _boundary_matrices(S, [order], orientations)[order]
+    if not sparse:
+        B = B.toarray()
     return (B, rowdict, coldict) if index else B
 
 
-def hodge_laplacian(S, order=1, orientations=None, index=False):
+def hodge_laplacian(S, order=1, orientations=None, index=False, sparse=False):
     """
     A function to compute the Hodge Laplacians of an oriented
     simplicial complex.
@@ -176,26 +227,30 @@ def hodge_laplacian(S, order=1, orientations=None, index=False):
     index: bool, default: False
         Specifies whether to output dictionaries
         mapping the simplices IDs to indices
+    sparse: bool, default: False
+        Specifies whether the output matrix is a scipy sparse matrix or a numpy matrix
 
     Returns
     -------
-    L_o: numpy.ndarray
+    L_o: numpy.ndarray or scipy.sparse.csr_array
         The Hodge Laplacian matrix of the chosen order, has dimension
         (n_simplices of given order, n_simplices of given order)
     matdict: dict
         The dictionary mapping indices to
         (order)-simplices IDs, if index is True
 
-    """
-    if index:
-        B_o, __, matdict = boundary_matrix(S, order, orientations, True)
-    else:
-        B_o = boundary_matrix(S, order, orientations, False)
-    D_om1 = np.transpose(B_o)
+    Notes
+    -----
+    Both boundary matrices are built sparse, so that no dense matrix is allocated
+    when `sparse` is True.
 
-    B_op1 = boundary_matrix(S, order + 1, orientations, False)
-    D_o = np.transpose(B_op1)
+    """
+    matrices = _boundary_matrices(S, [order, order + 1], orientations)
+    B_o, __, matdict = matrices[order]
+    B_op1 = matrices[order + 1][0]
 
-    L_o = D_om1 @ B_o + B_op1 @ D_o
+    L_o = (B_o.T @ B_o + B_op1 @ B_op1.T).tocsr()
+    if not sparse:
+        L_o = L_o.toarray()
 
     return (L_o, matdict) if index else L_o
@@ -46,11 +46,13 @@ array([[1, 0, 0],
 
 from itertools import permutations
 from math import factorial
-from warnings import catch_warnings, warn
 
 import numpy as np
 from scipy.sparse import csr_array
 
+from ..exception import XGIError
+from ..utils import CSRMembers, csr_incidence
+
 __all__ = [
     "incidence_matrix",
     "adjacency_matrix",
@@ -61,8 +63,45 @@ __all__ = [
 ]
 
 
+def _unit_weight(node, edge, H):
+    return 1
+
+
+def _weight_array(weight, ids, attrs, kind):
+    """Weights of each node or edge as an array.
+
+    Parameters
+    ----------
+    weight : str or array-like
+        Name of the attribute storing the weights, in which case the missing values
+        default to 1, or the weights themselves, in the order of `ids`.
+    ids : list
+        The node or edge IDs.
+    attrs : dict
+        The node or edge attributes of the network.
+    kind : str
+        "node" or "edge", used in error messages.
+
+    Returns
+    -------
+    numpy.ndarray
+
+    Raises
+    ------
+    XGIError
+        If the weights do not have one entry per ID.
+
+    """
+    if isinstance(weight, str):
+        return np.array([attrs[idx].get(weight, 1) for idx in ids])
+    weight = np.asarray(weight)
+    if weight.shape != (len(ids),):
+        raise XGIError(f"There must be one {kind} weight per {kind}")
+    return weight
+
+
 def incidence_matrix(
-    H, order=None, sparse=True, index=False, weight=lambda node, edge, H: 1
+    H, order=None, sparse=True, index=False, weight=_unit_weight, node_weight=None
 ):
     """A function to generate a weighted incidence matrix from a Hypergraph object,
     where the rows correspond to nodes and the columns correspond to edges.
@@ -79,8 +118,17 @@ def incidence_matrix(
     index: bool, default: False
         Specifies whether to output dictionaries mapping the node and edge IDs to
         indices.
-    weight: lambda function, default=lambda function outputting 1
-        A function specifying the weight, given a node and edge
+    weight: str, array-like, or function, optional
+        The weight of each edge, given either as the name of an edge attribute (edges
+        without it have weight 1) or as an array with one entry per edge of `H`, in
+        the order of `H.edges`.  A function specifying the weight of each incidence,
+        given a node, an edge, and the hypergraph, is also accepted, in which case the
+        weights are cast to integers.  By default, all the weights are 1.
+    node_weight: str or array-like, optional
+        The weight of each node, given either as the name of a node attribute (nodes
+        without it have weight 1) or as an array with one entry per node of `H`, in
+        the order of `H.nodes`.  The entries of the matrix are the products of the
+        node and edge weights.  By default, None.
 
     Returns
     -------
@@ -91,46 +139,83 @@ def incidence_matrix(
     coldict: dict
         The dictionary mapping indices to edge IDs, if index is True
 
+    Raises
+    ------
+    XGIError
+        If `weight` or `node_weight` is an array of the wrong length.
+
+    Notes
+    -----
+    The matrix is built from the incidence arrays returned by
+    :func:`~xgi.utils.incidence.csr_incidence`, which are shared by all the functions
+    of this module and rebuilt only after the hypergraph is modified.
+
+    Examples
+    --------
+    >>> import xgi
+    >>> H = xgi.Hypergraph([[1, 2], [2, 3, 4]])
+    >>> H.set_edge_attributes({0: 0.5}, name="weight")
+    >>> xgi.incidence_matrix(H, sparse=False, weight="weight")
+    array([[0.5, 0. ],
+           [0.5, 1. ],
+           [0. , 1. ],
+           [0. , 1. ]])
+
     """
-    node_ids = H.nodes
-    edge_ids = H.edges
+    inc = csr_incidence(H)
+
+    sizes = inc.edge_sizes()
+    if order is None:
+        cols = None
+        num_edges = inc.num_edges
+    else:
+        cols = np.flatnonzero(sizes == order + 1)
+        num_edges = len(cols)
+    num_nodes = inc.num_nodes
 
-    if order is not None:
-        edge_ids = H.edges.filterby("order", order)
-    if not edge_ids or not node_ids:
+    if not num_edges or not num_nodes:
         if sparse:
             I = csr_array((0, 0), dtype=int)
         else:
             I = np.empty((0, 0), dtype=int)
         return (I, {}, {}) if index else I
 
-    num_edges = len(edge_ids)
-    num_nodes = len(node_ids)
-
-    node_dict = dict(zip(node_ids, range(num_nodes)))
-    edge_dict = dict(zip(edge_ids, range(num_edges)))
-
     if index:
-        rowdict = {v: k for k, v in node_dict.items()}
-        coldict = {v: k for k, v in edge_dict.items()}
-
-    # Compute the non-zero values, row and column indices for the given order
-    rows = []
-    cols = []
-    data = []
-    for edge in edge_ids:
-        members = H._edge[edge]
-        for node in members:
-            rows.append(node_dict[node])
-            cols.append(edge_dict[edge])
-            data.append(weight(node, edge, H))
-
-    # Create the incidence matrix as a CSR matrix
-    if sparse:
-        I = csr_array((data, (rows, cols)), shape=(num_nodes, num_edges), dtype=int)
+        rowdict = dict(enumerate(inc.node_ids))
+        if cols is None:
+            coldict = dict(enumerate(inc.edge_ids))
+        else:
+            coldict = {i: inc.edge_ids[j] for i, j in enumerate(cols.tolist())}
+
+    # the weights of the incidences, grouped by node
+    if weight is _unit_weight or weight is None:
+        data = np.ones(inc.nnz, dtype=int)
+    elif callable(weight):
+        node_ids, edge_ids = inc.node_ids, inc.edge_ids
+        pairs = zip(inc.node_of_incidence().tolist(), inc.node_edges.tolist())
+        data = np.fromiter(
+            (weight(node_ids[n], edge_ids[e], H) for n, e in pairs),
+            dtype=int,
+            count=inc.nnz,
+        )
     else:
-        I = np.zeros((num_nodes, num_edges), dtype=int)
-        I[rows, cols] = data
+        edge_weights = _weight_array(weight, inc.edge_ids, H._edge_attr, "edge")
+        data = edge_weights[inc.node_edges]
+    if node_weight is not None:
+        node_weights = _weight_array(node_weight, inc.node_ids, H._node_attr, "node")
+        data = data * np.repeat(node_weights, inc.node_degrees())
+
+    # compact hypergraphs share their (read-only) index arrays with the matrix
+    I = csr_array(
+        (data, inc.node_edges, inc.node_ptr),
+        shape=(num_nodes, inc.num_edges),
+        copy=not isinstance(H._edge, CSRMembers),
+    )
+    if cols is not None:
+        I = I[:, cols]
+
+    if not sparse:
+        I = I.toarray()
 
     return (I, rowdict, coldict) if index else I
 
@@ -164,42 +249,28 @@ def adjacency_matrix(H, order=None, sparse=True, s=1, weighted=False, index=Fals
     else:
         return A
 
-    Warns
+    Notes
     -----
-    warn
-        If there are isolated nodes and the matrix is sparse.
+    The overlaps of all the pairs of nodes are counted at once by
+    :meth:`~xgi.utils.incidence.CSRIncidence.overlaps`, which is shared with
+    :meth:`~xgi.core.views.IDView.s_neighbors`.
 
     """
-    I, rowdict, coldict = incidence_matrix(H, order=order, sparse=sparse, index=True)
+    inc = csr_incidence(H)
+    edges = None if order is None else np.flatnonzero(inc.edge_sizes() == order + 1)
+    num_edges = inc.num_edges if edges is None else len(edges)
 
-    if I.shape == (0, 0):
-        if not rowdict:
-            A = csr_array((0, 0)) if sparse else np.empty((0, 0))
-        if not coldict:
-            shape = (H.num_nodes, H.num_nodes)
-            A = csr_array(shape, dtype=int) if sparse else np.zeros(shape, dtype=int)
+    if not num_edges or not inc.num_nodes:
+        shape = (inc.num_nodes, inc.num_nodes)
+        A = csr_array(shape, dtype=int) if sparse else np.zeros(shape, dtype=int)
         return (A, {}) if index else A
 
-    A = I.dot(I.T)
-
-    if sparse:
-        with catch_warnings(record=True) as w:
-            A.setdiag(0)
-        if w:
-            warn(
-                "Forming the adjacency matrix can "
-                "be expensive when there are isolated nodes!"
-            )
-    else:
-        np.fill_diagonal(A, 0)
-
+    rowdict = dict(enumerate(inc.node_ids))
+    A = inc.overlaps("node", s, edges=edges)
     if not weighted:
-        A = (A >= s) * 1
-    else:
-        A = (A >= s) * A
-
-    if sparse:
-        A.eliminate_zeros()
+        A.data[:] = 1
+    if not sparse:
+        A = A.toarray()
 
     return (A, rowdict) if index else A
 
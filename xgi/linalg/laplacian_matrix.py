@@ -233,7 +233,7 @@ def normalized_hypergraph_laplacian(H, weighted=False, sparse=True, index=False)
     De = np.sum(incidence, axis=0)
 
     if weighted:
-        weights = [H.edges[edge_idx].get("weight", 1) for edge_idx in H.edges]
+        weights = [H._edge_attr[edge_idx].get("weight", 1) for edge_idx in H.edges]
     else:
         weights = [1] * H.num_edges
 
@@ -1,5 +1,6 @@
-from . import bigg_data, bipartite, edgelist, hif, incidence, json, xgi_data
+from . import bigg_data, binary, bipartite, edgelist, hif, incidence, json, xgi_data
 from .bigg_data import *
+from .binary import *
 from .bipartite import *
 from .edgelist import *
 from .hif import *
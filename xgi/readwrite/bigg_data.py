@@ -2,7 +2,7 @@
 
 from warnings import warn
 
-from ..utils import request_json_from_url, request_json_from_url_cached
+from ..utils import get_dataset_cache, request_json_from_url
 
 __all__ = ["load_bigg_data"]
 
@@ -28,7 +28,10 @@ def load_bigg_data(
         http://bigg.ucsd.edu/api/v2/models. If None, prints
         the list of available datasets.
     cache : bool, optional
-        Whether to cache the input data
+        Whether to cache the input data.  The data and the parsed dihypergraph
+        are stored in the on-disk cache returned by
+        :func:`~xgi.utils.datacache.get_dataset_cache`, and shared between
+        processes.
 
     Returns
     -------
@@ -53,7 +56,12 @@ def load_bigg_data(
     index_url = "http://bigg.ucsd.edu/api/v2/models"
     base_url = "http://bigg.ucsd.edu/static/models/"
 
-    index_data = request_json_from_url(index_url)
+    if cache:
+        dataset_cache = get_dataset_cache()
+        index_digest = dataset_cache.fetch(index_url)
+        index_data = dataset_cache.read_json(index_digest)
+    else:
+        index_data = request_json_from_url(index_url)
 
     # If no dataset is specified, print a list of the available datasets.
     if dataset is None:
@@ -64,12 +72,18 @@ def load_bigg_data(
         print(*ids, sep="\n")
         return
 
-    if cache:
-        model_data = request_json_from_url_cached(base_url + dataset + ".json")
-    else:
+    if not cache:
         model_data = request_json_from_url(base_url + dataset + ".json")
-
-    return _bigg_to_dihypergraph(index_data, model_data)
+        return _bigg_to_dihypergraph(index_data, model_data)
+
+    # the organism is read from the index, so the parsed dihypergraph depends on both
+    digest = dataset_cache.fetch(base_url + dataset + ".json")
+    DH = dataset_cache.load(digest, index_digest)
+    if DH is None:
+        model_data = dataset_cache.read_json(digest)
+        DH = _bigg_to_dihypergraph(index_data, model_data)
+        dataset_cache.store(digest, index_digest, DH)
+    return DH
 
 
 def _bigg_to_dihypergraph(d_index, d_model):
@@ -0,0 +1,231 @@
+"""Read from and write to a binary format.
+
+A hypergraph is stored as a directory of NumPy ``.npy`` files: the incidence arrays
+of :class:`~xgi.utils.incidence.CSRIncidence`, the tables of node and edge IDs, and
+one column per node or edge attribute.  A ``meta.json`` file describes the columns
+and holds the hypergraph attributes, as well as the attributes that cannot be stored
+in arrays.
+
+"""
+
+import json
+import os
+from itertools import count
+
+import numpy as np
+
+from ..core import DiHypergraph, Hypergraph
+from ..exception import XGIError
+from ..utils import CSRIncidence, IDDict, csr_incidence
+
+__all__ = ["write_binary", "read_binary"]
+
+_FORMAT = "xgi-binary"
+_VERSION = 1
+_ARRAYS = ["edge_ptr", "edge_nodes", "node_ptr", "node_edges"]
+_DTYPES = {"bool": bool, "int": np.int64, "float": np.float64, "str": str}
+
+
+def write_binary(H, path):
+    """Write a hypergraph to a directory of NumPy arrays.
+
+    Parameters
+    ----------
+    H : Hypergraph
+        The hypergraph of interest.
+    path : str
+        The directory to write to.  It is created if it does not exist.
+
+    Raises
+    ------
+    XGIError
+        If the node or edge IDs are not all integers or all strings, or if an
+        attribute cannot be stored.
+
+    See Also
+    --------
+    read_binary
+
+    Notes
+    -----
+    The attributes whose values are all booleans, all integers, all floats, or all
+    strings are stored as arrays, the other ones are stored in ``meta.json``.
+
+    Examples
+    --------
+    >>> import xgi
+    >>> H = xgi.Hypergraph([[1, 2, 3], [3, 4]])
+    >>> # xgi.write_binary(H, "hypergraph")
+
+    """
+    if isinstance(H, DiHypergraph) or not isinstance(H, Hypergraph):
+        raise XGIError("Only hypergraphs can be written to the binary format.")
+
+    os.makedirs(path, exist_ok=True)
+    incidence = csr_incidence(H)
+    for name in _ARRAYS:
+        np.save(os.path.join(path, f"{name}.npy"), getattr(incidence, name))
+
+    meta = {
+        "format": _FORMAT,
+        "version": _VERSION,
+        "network": H._net_attr,
+        "nodes": _write_ids(path, "node", incidence.node_ids, H._node_attr),
+        "edges": _write_ids(path, "edge", incidence.edge_ids, H._edge_attr),
+    }
+    try:
+        data = json.dumps(meta)
+    except TypeError as e:
+        raise XGIError("Failed to write the attributes to JSON.") from e
+    with open(os.path.join(path, "meta.json"), "w") as file:
+        file.write(data)
+
+
+def read_binary(path, mmap=False):
+    """Read a hypergraph written by :func:`write_binary`.
+
+    Parameters
+    ----------
+    path : str
+        The directory to read from.
+    mmap : bool, default: False
+        If True, the incidence arrays are memory-mapped from their files instead of
+        being loaded, so that the hypergraph is opened without copying them.
+
+    Returns
+    -------
+    Hypergraph
+        A frozen, array-backed hypergraph, as returned by
+        :meth:`~xgi.core.hypergraph.Hypergraph.compact`.  Use
+        :meth:`~xgi.core.hypergraph.Hypergraph.copy` to get a mutable copy.
+
+    Raises
+    ------
+    XGIError
+        If the directory is not in the binary format.
+
+    See Also
+    --------
+    write_binary
+
+    Examples
+    --------
+    >>> import xgi
+    >>> # H = xgi.read_binary("hypergraph", mmap=True)
+
+    """
+    try:
+        with open(os.path.join(path, "meta.json")) as file:
+            meta = json.load(file)
+    except FileNotFoundError as e:
+        raise XGIError(f"{path} is not a hypergraph in the binary format.") from e
+    if meta.get("format") != _FORMAT:
+        raise XGIError(f"{path} is not a hypergraph in the binary format.")
+    if meta["version"] > _VERSION:
+        raise XGIError(f"Unsupported version {meta['version']} of the binary format.")
+
+    mmap_mode = "r" if mmap else None
+    arrays = {
+        name: np.load(os.path.join(path, f"{name}.npy"), mmap_mode=mmap_mode)
+        for name in _ARRAYS
+    }
+    node_ids, node_attr = _read_ids(path, "node", meta["nodes"])
+    edge_ids, edge_attr = _read_ids(path, "edge", meta["edges"])
+    incidence = CSRIncidence(node_ids, edge_ids, **arrays)
+    incidence.setflags(write=False)
+
+    # automatic IDs start after the largest integer edge ID
+    int_ids = meta["edges"]["ids"] == "int"
+    edge_uid = count(max(edge_ids, default=-1) + 1 if int_ids else 0)
+    return Hypergraph._from_incidence(
+        incidence, node_attr, edge_attr, meta["network"], edge_uid
+    )
+
+
+def _write_ids(path, kind, ids, attrs):
+    """Write the IDs and the attributes of the nodes or edges.
+
+    Returns
+    -------
+    dict
+        The description of the arrays, for ``meta.json``.
+
+    """
+    ids_type = _column_type(ids) if ids else "int"
+    if ids_type not in {"int", "str"}:
+        raise XGIError(f"The {kind} IDs must be all integers or all strings.")
+    np.save(
+        os.path.join(path, f"{kind}_ids.npy"), np.array(ids, dtype=_DTYPES[ids_type])
+    )
+
+    names = list(dict.fromkeys(name for idx in ids for name in attrs[idx]))
+    columns = []
+    for i, name in enumerate(names):
+        present = [name in attrs[idx] for idx in ids]
+        values = [attrs[idx].get(name) for idx in ids]
+        col_type = _column_type([v for v, p in zip(values, present) if p])
+        column = {"name": name}
+        if col_type is None:
+            # stored in meta.json as (index, value) pairs
+            column["values"] = [
+                [j, v] for j, (v, p) in enumerate(zip(values, present)) if p
+            ]
+        else:
+            column["file"] = f"{kind}_attr_{i}"
+            column["missing"] = not all(present)
+            fill = {"bool": False, "int": 0, "float": 0.0, "str": ""}[col_type]
+            values = [v if p else fill for v, p in zip(values, present)]
+            np.save(
+                os.path.join(path, f"{column['file']}.npy"),
+                np.array(values, dtype=_DTYPES[col_type]),
+            )
+            if column["missing"]:
+                np.save(
+                    os.path.join(path, f"{column['file']}_mask.npy"), np.array(present)
+                )
+        columns.append(column)
+
+    return {"ids": ids_type, "attrs": columns}
+
+
+def _read_ids(path, kind, meta):
+    """Read the IDs and the attributes of the nodes or edges.
+
+    Returns
+    -------
+    list, IDDict
+        The IDs and the dict of attributes of each ID.
+
+    """
+    ids = np.load(os.path.join(path, f"{kind}_ids.npy")).tolist()
+    attrs = IDDict((idx, IDDict()) for idx in ids)
+    for column in meta["attrs"]:
+        name = column["name"]
+        if "file" not in column:
+            for j, val in column["values"]:
+                attrs[ids[j]][name] = val
+            continue
+
+        values = np.load(os.path.join(path, f"{column['file']}.npy")).tolist()
+        if column["missing"]:
+            present = np.load(os.path.join(path, f"{column['file']}_mask.npy"))
+            for j in np.flatnonzero(present).tolist():
+                attrs[ids[j]][name] = values[j]
+        else:
+            for idx, val in zip(ids, values):
+                attrs[idx][name] = val
+    return ids, attrs
+
+
+def _column_type(values):
+    """The type of column that can hold all the values, or None."""
+    types = {type(v) for v in values}
+    for name, col_types in [
+        ("bool", {bool, np.bool_}),
+        ("int", {int, np.int32, np.int64}),
+        ("float", {float, np.float32, np.float64}),
+        ("str", {str}),
+    ]:
+        if types and types <= col_types:
+            return name
+    return None
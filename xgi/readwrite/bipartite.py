@@ -1,10 +1,15 @@
 """Read from and write to bipartite formats."""
 
+from itertools import islice
+
+from ..convert.bipartite_edges import _add_bipartite_edges
 from ..exception import XGIError
 from ..generators import empty_hypergraph
+from .edgelist import _decode, _split_lines
 
 __all__ = [
     "read_bipartite_edgelist",
+    "iter_bipartite_edgelist",
     "write_bipartite_edgelist",
     "parse_bipartite_edgelist",
 ]
@@ -72,6 +77,9 @@ def read_bipartite_edgelist(
     edgetype=None,
     dual=False,
     encoding="utf-8",
+    max_edges=None,
+    batch_size=100000,
+    progress=None,
 ):
     """Read a file containing a bipartite edge list and
     convert it to a Hypergraph object.
@@ -95,6 +103,13 @@ def read_bipartite_edgelist(
         the node IDs are in the first column.
     encoding: string, default: "utf-8"
         Encoding of the file
+    max_edges: int, optional
+        The maximum number of edges to read, by default None (all of them).  The
+        lines of the other edges are skipped.
+    batch_size: int, default: 100000
+        The number of lines tokenized and added to the hypergraph at once.
+    progress: callable, optional
+        Function called with the number of lines read so far after each batch.
 
     Returns
     -------
@@ -104,6 +119,7 @@ def read_bipartite_edgelist(
     See Also
     --------
     write_bipartite_edgelist
+    iter_bipartite_edgelist
 
     Example
     -------
@@ -112,20 +128,90 @@ def read_bipartite_edgelist(
 
     """
     with open(path, "rb") as file:
-        lines = (
-            line if isinstance(line, str) else line.decode(encoding) for line in file
-        )
         return parse_bipartite_edgelist(
-            lines,
+            _decode(file, encoding),
             comments=comments,
             delimiter=delimiter,
             create_using=create_using,
             nodetype=nodetype,
             edgetype=edgetype,
             dual=dual,
+            max_edges=max_edges,
+            batch_size=batch_size,
+            progress=progress,
         )
 
 
+def iter_bipartite_edgelist(
+    path,
+    comments="#",
+    delimiter=None,
+    nodetype=None,
+    edgetype=None,
+    dual=False,
+    encoding="utf-8",
+    max_edges=None,
+    batch_size=100000,
+):
+    """Read a file containing a bipartite edge list in batches of incidences.
+
+    The file is read lazily, so that the incidences can be processed without
+    holding all of them in memory.
+
+    Parameters
+    ----------
+    path: string
+        The path of the file to read from
+    comments: string, default: "#"
+        The token that denotes comments in the file
+    delimiter: char, default: space (" ")
+        Specifies the delimiter between hyperedge members
+    nodetype: type
+        type that the node labels will be cast to
+    edgetype: type
+        type that the edge labels will be cast to
+    dual: bool, default: False
+        Specifies whether the node IDs are in the second column. If False,
+        the node IDs are in the first column.
+    encoding: string, default: "utf-8"
+        Encoding of the file
+    max_edges: int, optional
+        The maximum number of edges to read, by default None (all of them).  The
+        lines of the other edges are skipped.
+    batch_size: int, default: 100000
+        The number of lines read for each batch.
+
+    Yields
+    ------
+    list of tuples
+        The (node, edge) pairs of the next lines of the file.
+
+    See Also
+    --------
+    read_bipartite_edgelist
+
+    Example
+    -------
+    >>> import xgi
+    >>> # for pairs in xgi.iter_bipartite_edgelist("test.csv", delimiter=","):
+    >>> #     for node, edge in pairs:
+    >>> #         H.add_node_to_edge(edge, node)
+
+    """
+    with open(path, "rb") as file:
+        for _, pairs in _incidence_batches(
+            _decode(file, encoding),
+            comments,
+            delimiter,
+            nodetype,
+            edgetype,
+            dual,
+            max_edges,
+            batch_size,
+        ):
+            yield pairs
+
+
 def parse_bipartite_edgelist(
     lines,
     comments="#",
@@ -134,6 +220,9 @@ def parse_bipartite_edgelist(
     nodetype=None,
     edgetype=None,
     dual=False,
+    max_edges=None,
+    batch_size=100000,
+    progress=None,
 ):
     """
     A helper function to read a iterable of strings containing a bipartite edge list and
@@ -157,8 +246,16 @@ def parse_bipartite_edgelist(
         type that the node labels will be cast to
     edgetype: type
         type that the edge labels will be cast to
-    data: bool, default: False
-        Specifies whether there is a dictionary of data at the end of the line.
+    dual: bool, default: False
+        Specifies whether the node IDs are in the second column. If False,
+        the node IDs are in the first column.
+    max_edges: int, optional
+        The maximum number of edges to read, by default None (all of them).  The
+        lines of the other edges are skipped.
+    batch_size: int, default: 100000
+        The number of lines tokenized and added to the hypergraph at once.
+    progress: callable, optional
+        Function called with the number of lines read so far after each batch.
 
     Raises
     ------
@@ -172,47 +269,88 @@ def parse_bipartite_edgelist(
     Hypergraph
         The loaded hypergraph.
 
+    Notes
+    -----
+    The incidences of each batch are grouped by edge, so that the new edges are
+    added at once with all their members.
+
     """
     H = empty_hypergraph(create_using)
+    num_lines = 0
+    for size, pairs in _incidence_batches(
+        lines,
+        comments,
+        delimiter,
+        nodetype,
+        edgetype,
+        dual,
+        max_edges,
+        batch_size,
+    ):
+        _add_bipartite_edges(H, pairs)
+
+        num_lines += size
+        if progress is not None:
+            progress(num_lines)
+    return H
 
+
+def _incidence_batches(
+    lines, comments, delimiter, nodetype, edgetype, dual, max_edges, batch_size
+):
+    """The incidences of a bipartite edge list, in batches of `batch_size` lines.
+
+    Yields
+    ------
+    int, list of tuples
+        The number of lines of the batch and their (node, edge) pairs, without the
+        pairs of the edges beyond `max_edges`.
+
+    """
     node_index = 1 if dual else 0
     edge_index = 0 if dual else 1
 
-    for line in lines:
-        if comments is not None:
-            p = line.find(comments)
-            if p >= 0:
-                line = line[:p]
-            if not line:
-                continue
-        s = line.strip().split(delimiter)
-        if len(s) < 2:
+    lines = _split_lines(lines, comments, delimiter)
+    kept = set()
+    while True:
+        batch = list(islice(lines, batch_size))
+        if not batch:
+            return
+        if any(len(s) < 2 for s in batch):
             raise XGIError("Each line must contain at least two entries!")
-        # no data or data type specified
-
-        # convert node types
-        if nodetype is not None:
-            try:
-                node = nodetype(s[node_index])
-            except ValueError as e:
-                raise TypeError(
-                    "Failed to convert the node with "
-                    f"ID {s[node_index]} to type {nodetype}."
-                ) from e
-        else:
-            node = s[node_index]
-
-        # convert edge types
-        if edgetype is not None:
-            try:
-                edge = edgetype(s[edge_index])
-            except ValueError as e:
-                raise TypeError(
-                    "Failed to convert the edge with "
-                    f"ID {s[edge_index]} to type {edgetype}."
-                ) from e
-        else:
-            edge = s[edge_index]
-
-        H.add_node_to_edge(edge, node)
-    return H
+
+        nodes = _convert([s[node_index] for s in batch], nodetype, "node")
+        edges = _convert([s[edge_index] for s in batch], edgetype, "edge")
+        pairs = list(zip(nodes, edges))
+        if max_edges is not None:
+            for edge in edges:
+                if len(kept) == max_edges:
+                    break
+                kept.add(edge)
+            pairs = [(node, edge) for node, edge in pairs if edge in kept]
+        yield len(batch), pairs
+
+
+def _convert(ids, idtype, kind):
+    """Convert a list of node or edge IDs to `idtype`, if it is not None.
+
+    Raises
+    ------
+    TypeError
+        If an ID fails to be converted.
+
+    """
+    if idtype is None:
+        return ids
+    try:
+        return list(map(idtype, ids))
+    except ValueError:
+        pass
+    # find the culprit
+    for idx in ids:
+        try:
+            idtype(idx)
+        except ValueError as e:
+            raise TypeError(
+                f"Failed to convert the {kind} with ID {idx} to type {idtype}."
+            ) from e
@@ -1,9 +1,12 @@
 """Read from and write to edgelists."""
 
+from itertools import islice
+
 from ..generators import empty_hypergraph
 
 __all__ = [
     "read_edgelist",
+    "iter_edgelist",
     "write_edgelist",
     "parse_edgelist",
 ]
@@ -64,6 +67,9 @@ def read_edgelist(
     create_using=None,
     nodetype=None,
     encoding="utf-8",
+    max_edges=None,
+    batch_size=100000,
+    progress=None,
 ):
     """Read a file containing a hyperedge list and
     convert it to a Hypergraph object.
@@ -82,6 +88,12 @@ def read_edgelist(
         type that the node labels will be cast to
     encoding: string, default: "utf-8"
         Encoding of the file
+    max_edges: int, optional
+        The maximum number of edges to read, by default None (all of them).
+    batch_size: int, default: 100000
+        The number of lines tokenized and added to the hypergraph at once.
+    progress: callable, optional
+        Function called with the number of edges read so far after each batch.
 
     Returns
     -------
@@ -91,6 +103,7 @@ def read_edgelist(
     See Also
     --------
     read_weighted_edgelist
+    iter_edgelist
 
     Examples
     --------
@@ -99,20 +112,85 @@ def read_edgelist(
 
     """
     with open(path, "rb") as file:
-        lines = (
-            line if isinstance(line, str) else line.decode(encoding) for line in file
-        )
         return parse_edgelist(
-            lines,
+            _decode(file, encoding),
             comments=comments,
             delimiter=delimiter,
             create_using=create_using,
             nodetype=nodetype,
+            max_edges=max_edges,
+            batch_size=batch_size,
+            progress=progress,
+        )
+
+
+def iter_edgelist(
+    path,
+    comments="#",
+    delimiter=None,
+    nodetype=None,
+    encoding="utf-8",
+    max_edges=None,
+    batch_size=100000,
+):
+    """Read a file containing a hyperedge list in batches of edges.
+
+    The file is read lazily, so that the edges can be processed without holding
+    all of them in memory.
+
+    Parameters
+    ----------
+    path: string
+        The path of the file to read from
+    comments: string, default: "#"
+        The token that denotes comments in the file
+    delimiter: char, default: space (" ")
+        Specifies the delimiter between hyperedge members
+    nodetype: type
+        type that the node labels will be cast to
+    encoding: string, default: "utf-8"
+        Encoding of the file
+    max_edges: int, optional
+        The maximum number of edges to read, by default None (all of them).
+    batch_size: int, default: 100000
+        The maximum number of edges in each batch.
+
+    Yields
+    ------
+    list of lists
+        The members of the edges of the next lines of the file.
+
+    See Also
+    --------
+    read_edgelist
+
+    Examples
+    --------
+    >>> import xgi
+    >>> # for edges in xgi.iter_edgelist("test.csv", delimiter=","):
+    >>> #     H.add_edges_from(edges)
+
+    """
+    with open(path, "rb") as file:
+        yield from _edge_batches(
+            _decode(file, encoding),
+            comments,
+            delimiter,
+            nodetype,
+            max_edges,
+            batch_size,
         )
 
 
 def parse_edgelist(
-    lines, comments="#", delimiter=None, create_using=None, nodetype=None
+    lines,
+    comments="#",
+    delimiter=None,
+    create_using=None,
+    nodetype=None,
+    max_edges=None,
+    batch_size=100000,
+    progress=None,
 ):
     """
     A helper function to read a iterable of strings containing a hyperedge list and
@@ -130,14 +208,43 @@ def parse_edgelist(
         The hypergraph object to add the data to, by default None
     nodetype: type
         type that the node labels will be cast to
+    max_edges: int, optional
+        The maximum number of edges to read, by default None (all of them).
+    batch_size: int, default: 100000
+        The number of lines tokenized and added to the hypergraph at once.
+    progress: callable, optional
+        Function called with the number of edges read so far after each batch.
 
     Returns
     -------
     Hypergraph object
         The loaded hypergraph
 
+    Raises
+    ------
+    TypeError
+        If node types fail to be converted
+
     """
     H = empty_hypergraph(create_using)
+    num_edges = 0
+    for edges in _edge_batches(
+        lines, comments, delimiter, nodetype, max_edges, batch_size
+    ):
+        H.add_edges_from(edges)
+        num_edges += len(edges)
+        if progress is not None:
+            progress(num_edges)
+    return H
+
+
+def _decode(file, encoding):
+    """The lines of a binary file, decoded."""
+    return (line if isinstance(line, str) else line.decode(encoding) for line in file)
+
+
+def _split_lines(lines, comments, delimiter):
+    """The tokens of each line, skipping the comments and the blank lines."""
     for line in lines:
         if comments is not None:
             p = line.find(comments)
@@ -145,13 +252,23 @@ def parse_edgelist(
                 line = line[:p]
             if not line:
                 continue
-        edge = line.strip().split(delimiter)
+        tokens = line.strip().split(delimiter)
+        if tokens:
+            yield tokens
 
+
+def _edge_batches(lines, comments, delimiter, nodetype, max_edges, batch_size):
+    """The edges of an edgelist, in lists of at most `batch_size` edges."""
+    edges = _split_lines(lines, comments, delimiter)
+    if max_edges is not None:
+        edges = islice(edges, max_edges)
+    while True:
+        batch = list(islice(edges, batch_size))
+        if not batch:
+            return
         if nodetype is not None:
             try:
-                edge = [nodetype(node) for node in edge]
+                batch = [[nodetype(node) for node in edge] for edge in batch]
             except ValueError as e:
                 raise TypeError(f"Failed to convert nodes to type {nodetype}.") from e
-
-        H.add_edge(edge)
-    return H
+        yield batch
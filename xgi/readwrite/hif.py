@@ -5,12 +5,28 @@ HIF `project <https://github.com/pszufe/HIF_validators>`_.
 """
 
 import json
+import re
 from collections import defaultdict
+from itertools import islice
 from os.path import dirname, join
 
-from ..convert import from_hif_dict, to_hif_dict
+from ..convert.hif_dict import (
+    _add_hif_data,
+    _add_hif_edges,
+    _add_hif_incidences,
+    _add_hif_nodes,
+    _hif_network,
+    _hif_network_type,
+    _hif_records,
+    _replace_nan_with_none,
+)
 from ..exception import XGIError
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 __all__ = ["write_hif", "write_hif_collection", "read_hif", "read_hif_collection"]
 
 
@@ -26,13 +42,35 @@ def write_hif(H, path):
         The specified higher-order network
     path: string
         The path of the file to read from
-    """
-    data = to_hif_dict(H, convert_nans=True)
 
-    datastring = json.dumps(data, indent=2)
-
-    with open(path, "w") as output_file:
-        output_file.write(datastring)
+    Notes
+    -----
+    The records are written as they are generated, one per line, so that the
+    whole document is never held in memory.  They are serialized with `orjson
+    <https://github.com/ijl/orjson>`_ if it is installed.
+    """
+    with open(path, "wb") as file:
+        file.write(b'{\n"metadata": ')
+        file.write(_dumps(_replace_nan_with_none(H._net_attr)))
+        file.write(b',\n"network-type": ')
+        file.write(_dumps(_hif_network_type(H)))
+        for key, records in _hif_records(H, convert_nans=True):
+            first = next(records, None)
+            # the incidences are always listed
+            if first is None and key != "incidences":
+                continue
+            file.write(f',\n"{key}": ['.encode())
+            if first is not None:
+                file.write(b"\n")
+                file.write(_dumps(first))
+            while True:
+                batch = list(islice(records, 10000))
+                if not batch:
+                    break
+                file.write(b",\n")
+                file.write(b",\n".join(map(_dumps, batch)))
+            file.write(b"\n]")
+        file.write(b"\n}\n")
 
 
 def write_hif_collection(H, path, collection_name=""):
@@ -99,10 +137,34 @@ def read_hif(path, nodetype=None, edgetype=None):
     A Hypergraph, SimplicialComplex, or DiHypergraph object
         The loaded network
     """
+    data = {}
+    H = None
     with open(path) as file:
-        data = json.loads(file.read())
+        stream = _JSONStream(file)
+        for key in stream.keys():
+            # the incidences are added as they are read, if the type of network is
+            # known by then
+            if key == "incidences" and "network-type" in data:
+                H = _hif_network(data["network-type"])
+                _add_hif_incidences(H, stream.elements(), nodetype, edgetype)
+            elif key in {"nodes", "edges"}:
+                # the records are added after the incidences, to keep the order of
+                # the nodes and edges
+                records = stream.elements()
+                if H is None:
+                    data[key] = list(records)
+                elif key == "nodes":
+                    _add_hif_nodes(H, records, nodetype)
+                else:
+                    _add_hif_edges(H, data["network-type"], records, edgetype)
+            else:
+                data[key] = stream.value()
 
-    return from_hif_dict(data, nodetype=nodetype, edgetype=edgetype)
+    network_type = data.get("network-type", "undirected")
+    if H is None:
+        H = _hif_network(network_type)
+        _add_hif_incidences(H, data["incidences"], nodetype, edgetype)
+    return _add_hif_data(H, network_type, data, nodetype, edgetype)
 
 
 def read_hif_collection(path, nodetype=None, edgetype=None):
@@ -143,3 +205,152 @@ def read_hif_collection(path, nodetype=None, edgetype=None):
         return collection
     except KeyError:
         raise XGIError("Data collection is in the wrong format!")
+
+
+def _dumps(obj):
+    """Serialize an object to JSON, as bytes."""
+    if orjson is not None:
+        return orjson.dumps(
+            obj, option=orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY
+        )
+    return json.dumps(obj).encode()
+
+
+def _loads(string):
+    """Deserialize a JSON document."""
+    if orjson is not None:
+        return orjson.loads(string)
+    return json.loads(string)
+
+
+class _JSONStream:
+    """Incremental reader of a JSON document.
+
+    The document is read in chunks and decoded one value at a time, so that the
+    elements of a large array can be processed without loading the whole array.
+
+    Parameters
+    ----------
+    file : file object
+        The text file to read from.
+    chunk_size : int, optional
+        The number of characters read at once, by default 2**20.
+
+    """
+
+    _whitespace = re.compile(r"[ \t\n\r]*")
+    # the characters that can continue a number or a literal
+    _token = re.compile(r"[^,:\]}\s]*")
+
+    def __init__(self, file, chunk_size=2**20):
+        self.file = file
+        self.chunk_size = chunk_size
+        self.buffer = ""
+        self.pos = 0
+        self.eof = False
+        self.decoder = json.JSONDecoder()
+        self.batch = True
+
+    def _fill(self, size=None):
+        chunk = self.file.read(size or self.chunk_size)
+        self.buffer = self.buffer[self.pos :] + chunk
+        self.pos = 0
+        self.eof = not chunk
+        self.batch = True
+
+    def _peek(self):
+        """The next character that is not whitespace, or "" at the end."""
+        while True:
+            self.pos = self._whitespace.match(self.buffer, self.pos).end()
+            if self.pos < len(self.buffer):
+                return self.buffer[self.pos]
+            if self.eof:
+                return ""
+            self._fill()
+
+    def _expect(self, chars):
+        char = self._peek()
+        if char not in chars:
+            raise XGIError(f"Invalid JSON: expected {chars!r}, got {char!r}.")
+        self.pos += 1
+        return char
+
+    def value(self):
+        """Decode the next value.
+
+        A value that does not fit in the buffer is decoded again after each refill,
+        so the size of the refills doubles to keep the decoding time linear.
+
+        """
+        self._peek()
+        size = self.chunk_size
+        while True:
+            try:
+                value, end = self.decoder.raw_decode(self.buffer, self.pos)
+            except json.JSONDecodeError as e:
+                if self.eof:
+                    raise XGIError("Invalid JSON.") from e
+            else:
+                # a value that reaches the end of the buffer may be truncated
+                if self.eof or self._token.match(self.buffer, end).end() < len(
+                    self.buffer
+                ):
+                    self.pos = end
+                    return value
+            self._fill(size)
+            size = max(size, len(self.buffer))
+
+    def keys(self):
+        """Iterate over the keys of an object.
+
+        The value of each key must be consumed with :meth:`value` or
+        :meth:`elements` before getting the next key.
+
+        """
+        self._expect("{")
+        if self._peek() == "}":
+            self.pos += 1
+            return
+        while True:
+            key = self.value()
+            self._expect(":")
+            yield key
+            if self._expect(",}") == "}":
+                return
+
+    def elements(self):
+        """Iterate over the elements of an array, decoding them lazily."""
+        self._expect("[")
+        if self._peek() == "]":
+            self.pos += 1
+            return
+        while True:
+            if self.batch:
+                yield from self._decode_batch()
+            yield self.value()
+            if self._expect(",]") == "]":
+                return
+
+    def _decode_batch(self, tries=3):
+        """Decode at once the next elements of an array that are in the buffer.
+
+        The text up to one of the last commas of the buffer is decoded as an array.
+        It is valid JSON only if the comma separates two elements, since cutting
+        within an element leaves a string or a bracket open.  If no such comma is
+        found, the elements are decoded one at a time until the buffer is refilled.
+
+        """
+        end = len(self.buffer)
+        for _ in range(tries):
+            cut = self.buffer.rfind(",", self.pos, end)
+            if cut < 0:
+                break
+            try:
+                values = _loads("[" + self.buffer[self.pos : cut] + "]")
+            except ValueError:
+                end = cut
+                continue
+            self.pos = cut + 1
+            return values
+        self.batch = False
+        return []
@@ -5,7 +5,7 @@ from warnings import warn
 
 from ..convert import cut_to_order, from_hif_dict, from_hypergraph_dict
 from ..exception import XGIError
-from ..utils import request_json_from_url, request_json_from_url_cached
+from ..utils import get_dataset_cache, request_json_from_url
 
 __all__ = ["load_xgi_data", "download_xgi_data"]
 
@@ -28,7 +28,10 @@ def load_xgi_data(
         index.json file in the xgi-data repository. If None (default), prints
         the list of available datasets.
     cache : bool, optional
-        Whether to cache the input data, by default True.
+        Whether to cache the input data, by default True.  The data and the
+        parsed hypergraphs are stored in the on-disk cache returned by
+        :func:`~xgi.utils.datacache.get_dataset_cache`, and shared between
+        processes.
     read : bool, optional
         If read==True, search for a local copy of the data set. Use the local
         copy if it exists, otherwise use the xgi-data repository.
@@ -69,7 +72,10 @@ def load_xgi_data(
             )
 
     # If no dataset is specified, print a list of the available datasets.
-    index_data = request_json_from_url(index_url)
+    if cache:
+        index_data = get_dataset_cache().request_json(index_url)
+    else:
+        index_data = request_json_from_url(index_url)
     if dataset is None:
         print("Available datasets are the following:")
         print(*index_data, sep="\n")
@@ -143,7 +149,8 @@ def _request_from_xgi_data(
         index.json file in the xgi-data repository. If None, prints
         the list of available datasets.
     cache : bool, optional
-        Whether or not to cache the output
+        Whether or not to cache the input data and the output in the on-disk
+        dataset cache.
 
     Returns
     -------
@@ -160,16 +167,16 @@ def _request_from_xgi_data(
     load_xgi_data
     """
     if cache:
-        jsondata = request_json_from_url_cached(url)
+        dataset_cache = get_dataset_cache()
+        digest = dataset_cache.fetch(url)
+        key = repr((nodetype, edgetype, max_order))
+        H = dataset_cache.load(digest, key)
+        if H is not None:
+            return H
+        jsondata = dataset_cache.read_json(digest)
     else:
         jsondata = request_json_from_url(url)
 
-    if "incidences" in jsondata:
-        H = from_hif_dict(jsondata, nodetype=nodetype, edgetype=edgetype)
-        if max_order:
-            H = cut_to_order(H, order=max_order)
-        return H
-
     if "type" in jsondata and jsondata["type"] == "collection":
         collection = {}
         for name, data in jsondata["datasets"].items():
@@ -184,6 +191,15 @@ def _request_from_xgi_data(
             collection[name] = H
         return collection
 
-    return from_hypergraph_dict(
-        jsondata, nodetype=nodetype, edgetype=edgetype, max_order=max_order
-    )
+    if "incidences" in jsondata:
+        H = from_hif_dict(jsondata, nodetype=nodetype, edgetype=edgetype)
+        if max_order:
+            H = cut_to_order(H, order=max_order)
+    else:
+        H = from_hypergraph_dict(
+            jsondata, nodetype=nodetype, edgetype=edgetype, max_order=max_order
+        )
+
+    if cache:
+        dataset_cache.store(digest, key, H)
+    return H
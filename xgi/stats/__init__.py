@@ -38,18 +38,28 @@ get the same treatment:
 >>> H.nodes.filterby_attr('color', 'red')
 NodeView((1, 4))
 
+The values of the built-in statistics are memoized by the network, so that computing
+several summaries such as `H.nodes.degree.mean()` and `H.nodes.degree.std()` only
+evaluates the degree once.  The memoized values are discarded whenever the network is
+modified.  Statistics that read attributes, such as the weighted degree, are never
+memoized, because attributes can be modified in place.
+
 Many other features are available, including edge-statistics, and user-defined
 statistics.  For more details, see the `tutorial
 <https://xgi.readthedocs.io/en/stable/api/tutorials/focus_6.html>`_.
 
 """
 
+import inspect
+from collections import OrderedDict
+from functools import lru_cache
+
 import numpy as np
 import pandas as pd
 from scipy.stats import moment as spmoment
 
 from ..exception import IDNotFound
-from ..utils import hist
+from ..utils import csr_incidence, hist
 from . import diedgestats, dinodestats, edgestats, nodestats
 
 __all__ = [
@@ -62,6 +72,88 @@ __all__ = [
 ]
 
 
+_cached_modules = {m.__name__ for m in (nodestats, edgestats, dinodestats, diedgestats)}
+"""Stats defined in these modules are memoized by :class:`StatCache`."""
+
+_uncached_stats = {"attrs"}
+"""Stats that are never memoized because attributes can be modified in place."""
+
+_attribute_params = {"weight"}
+"""Arguments naming an attribute read by a stat, which is then never memoized."""
+
+
+@lru_cache(maxsize=None)
+def _attribute_positions(func):
+    """Positions and names of the arguments of `func` in `_attribute_params`.
+
+    The positions are counted after the `net` and `bunch` arguments.
+
+    """
+    names = list(inspect.signature(func).parameters)[2:]
+    return tuple((i, name) for i, name in enumerate(names) if name in _attribute_params)
+
+
+class StatCache:
+    """Least-recently-used cache of the values of the stats of a network.
+
+    Every network owns one of these, and a mutation counter, `_version`, that is
+    incremented by each method that modifies the network.  Values are stored along with
+    the version at which they were computed, and the whole cache is emptied when it is
+    accessed with a newer version.
+
+    Parameters
+    ----------
+    maxsize : int, optional
+        The maximum number of stat values to keep, by default 128.  When full, the
+        least recently used value is evicted.
+
+    Notes
+    -----
+    Only the built-in stats are memoized.  Stats registered with decorators such as
+    :func:`nodestat_func` may depend on arbitrary state and are always recomputed.
+
+    """
+
+    def __init__(self, maxsize=128):
+        self.maxsize = maxsize
+        self.version = 0
+        self._data = OrderedDict()
+
+    def __len__(self):
+        return len(self._data)
+
+    def __contains__(self, key):
+        return key in self._data
+
+    def get(self, key, version):
+        """The value stored under `key`, or None if it is missing or stale."""
+        if version != self.version:
+            self.clear()
+            self.version = version
+            return None
+        try:
+            self._data.move_to_end(key)
+        except KeyError:
+            return None
+        return self._data[key]
+
+    def put(self, key, version, value):
+        """Store `value` under `key`, evicting the least recently used entry."""
+        if version != self.version:
+            self.clear()
+            self.version = version
+        if self.maxsize <= 0:
+            return
+        self._data[key] = value
+        self._data.move_to_end(key)
+        while len(self._data) > self.maxsize:
+            self._data.popitem(last=False)
+
+    def clear(self):
+        """Remove all the stored values."""
+        self._data.clear()
+
+
 class IDStat:
     """Mapping between nodes or edges and a quantity or property."""
 
@@ -131,9 +223,81 @@ class IDStat:
     def items(self):
         return self._val.items()
 
+    def _cache_key(self):
+        """Key under which the value of this stat is memoized, or None."""
+        func = self.func
+        if (
+            func.__module__ not in _cached_modules
+            or func.__name__ in _uncached_stats
+            or getattr(self.net, "_stat_cache", None) is None
+        ):
+            return None
+        for i, name in _attribute_positions(func):
+            arg = self.args[i] if i < len(self.args) else self.kwargs.get(name)
+            if arg is not None:
+                return None
+        view = self.view
+        ids = None if view._ids is view._id_dict else frozenset(view._ids)
+        key = (
+            view._id_kind,
+            func.__name__,
+            self.args,
+            tuple(sorted(self.kwargs.items())),
+            ids,
+        )
+        try:
+            hash(key)
+        except TypeError:
+            return None
+        return key
+
     @property
     def _val(self):
-        return self.func(self.net, self.view.ids, *self.args, **self.kwargs)
+        key = self._cache_key()
+        if key is None:
+            return self.func(self.net, self.view.ids, *self.args, **self.kwargs)
+
+        cache, version = self.net._stat_cache, self.net._version
+        val = cache.get(key, version)
+        if val is None:
+            val = self.func(self.net, self.view.ids, *self.args, **self.kwargs)
+            cache.put(key, version, val)
+        return val
+
+    def _array(self):
+        """Values of this stat as an array in the order of the view, or None.
+
+        Only available for the built-in stats that define a vectorized `asarray`
+        companion, which computes the values of all the nodes or edges of the network at
+        once.  The result is memoized like `_val` and then restricted to the view.
+
+        """
+        func = getattr(self.func, "asarray", None)
+        if func is None or getattr(self.net, "_stat_cache", None) is None:
+            return None
+
+        key = self._cache_key()
+        if key is None:
+            arr = func(self.net, *self.args, **self.kwargs)
+        else:
+            kind, name, args, kwargs, _ = key
+            full_key = (kind, name, args, kwargs, "asarray")
+            cache, version = self.net._stat_cache, self.net._version
+            arr = cache.get(full_key, version)
+            if arr is None:
+                arr = func(self.net, *self.args, **self.kwargs)
+                arr.setflags(write=False)
+                cache.put(full_key, version, arr)
+
+        view = self.view
+        if view._ids is not view._id_dict:
+            incidence = csr_incidence(self.net)
+            if view._id_kind == "node":
+                index = incidence.node_index
+            else:
+                index = incidence.edge_index
+            arr = arr[np.fromiter((index[i] for i in view), dtype=np.intp)]
+        return arr
 
     def asdict(self):
         """Output the stat as a dict.
@@ -144,16 +308,25 @@ class IDStat:
         type conversion is not necessary.
 
         """
+        arr = self._array()
+        if arr is not None:
+            return dict(zip(self.view, arr.tolist()))
         val = self._val
         return {idx: val[idx] for idx in self.view}
 
     def aslist(self):
         """Output the stat as a list."""
+        arr = self._array()
+        if arr is not None:
+            return arr.tolist()
         val = self._val
         return [val[idx] for idx in self.view]
 
     def asnumpy(self):
         """Output the stat as a numpy array."""
+        arr = self._array()
+        if arr is not None:
+            return arr.copy()
         return np.array(self.aslist())
 
     def aspandas(self):
@@ -164,6 +337,9 @@ class IDStat:
         The `name` attribute of the returned series is set using the `name` property.
 
         """
+        arr = self._array()
+        if arr is not None:
+            return pd.Series(arr.copy(), index=list(self.view), name=self.name)
         return pd.Series(self._val, name=self.name)
 
     def ashist(self, bins=10, bin_edges=False, density=False, log_binning=False):
@@ -22,6 +22,8 @@ import numpy as np
 
 import xgi
 
+from ..utils import csr_incidence
+
 __all__ = [
     "attrs",
     "order",
@@ -181,6 +183,24 @@ def size(net, bunch, degree=None):
         }
 
 
+def _size_array(net, degree=None):
+    """Vectorized :func:`size` of all the edges, in the order of `net.edges`."""
+    inc = csr_incidence(net)
+    if degree is None:
+        return inc.edge_sizes().astype(int)
+    matches = inc.node_degrees()[inc.edge_nodes] == degree
+    return np.bincount(inc.edge_of_incidence()[matches], minlength=inc.num_edges)
+
+
+def _order_array(net, degree=None):
+    """Vectorized :func:`order` of all the edges, in the order of `net.edges`."""
+    return _size_array(net, degree) - 1
+
+
+size.asarray = _size_array
+order.asarray = _order_array
+
+
 def node_edge_centrality(
     net,
     bunch,
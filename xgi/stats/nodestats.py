@@ -22,6 +22,8 @@ import numpy as np
 
 import xgi
 
+from ..utils import csr_incidence
+
 __all__ = [
     "attrs",
     "degree",
@@ -162,6 +164,32 @@ def degree(net, bunch, order=None, weight=None):
         }
 
 
+def _degree_array(net, order=None, weight=None):
+    """Vectorized :func:`degree` of all the nodes, in the order of `net.nodes`."""
+    inc = csr_incidence(net)
+    if order is None and weight is None:
+        return inc.node_degrees().astype(int)
+
+    if order is None:
+        keep = np.ones(inc.num_edges, dtype=bool)
+    else:
+        keep = inc.edge_sizes() == order + 1
+    if weight is None:
+        return np.bincount(
+            inc.node_of_incidence()[keep[inc.node_edges]], minlength=inc.num_nodes
+        )
+
+    w = np.array([net._edge_attr[e].get(weight, 1) for e in inc.edge_ids])
+    w = np.where(keep, w, 0)
+    deg = np.bincount(
+        inc.node_of_incidence(), weights=w[inc.node_edges], minlength=inc.num_nodes
+    )
+    return deg.astype(w.dtype) if w.dtype.kind in "iub" else deg
+
+
+degree.asarray = _degree_array
+
+
 def average_neighbor_degree(net, bunch):
     """Average neighbor degree.
 
@@ -192,6 +220,27 @@ def average_neighbor_degree(net, bunch):
     return result
 
 
+def _average_neighbor_degree_array(net):
+    """Vectorized :func:`average_neighbor_degree` of all the nodes."""
+    inc = csr_incidence(net)
+    deg = inc.node_degrees().astype(int)
+    has_edges = deg > 0
+
+    I = inc.tocsr()
+    A = I @ I.T
+    A.data[:] = 1
+
+    # remove each node from its own neighborhood
+    counts = np.diff(A.indptr) - has_edges
+    total = A @ deg - deg * has_edges
+    return np.divide(
+        total, counts, out=np.zeros(inc.num_nodes), where=counts > 0, casting="unsafe"
+    )
+
+
+average_neighbor_degree.asarray = _average_neighbor_degree_array
+
+
 def clustering_coefficient(net, bunch):
     """Local clustering coefficient.
 
@@ -485,7 +534,7 @@ def node_edge_centrality(
     return {n: c[n] for n in c if n in bunch}
 
 
-def katz_centrality(net, bunch, cutoff=100):
+def katz_centrality(net, bunch, cutoff=100, tol=1e-12, method="series"):
     r"""Compute the Katz centrality of a hypergraph.
 
     Parameters
@@ -497,6 +546,11 @@ def katz_centrality(net, bunch, cutoff=100):
     cutoff : int
         Power at which to stop the series :math:`A + \alpha A^2 + \alpha^2 A^3 + \dots`
         Default value is 100.
+    tol : float, optional
+        Relative tolerance at which the iterations stop. By default, 1e-12.
+    method : {"series", "solve"}, optional
+        Whether to sum the series or to solve the equivalent linear system, see
+        :func:`~xgi.algorithms.centrality.katz_centrality`. By default, "series".
 
     Returns
     -------
@@ -541,7 +595,7 @@ def katz_centrality(net, bunch, cutoff=100):
     See https://en.wikipedia.org/wiki/Katz_centrality#Alpha_centrality (visited
     May 20 2023) for a clear definition of Katz centrality.
     """
-    c = xgi.katz_centrality(net, cutoff=cutoff)
+    c = xgi.katz_centrality(net, cutoff=cutoff, tol=tol, method=method)
     return {n: c[n] for n in c if n in bunch}
 
 
@@ -1,4 +1,7 @@
-from . import tensor, trie, utilities
+from . import datacache, fingerprint, incidence, tensor, trie, utilities
+from .datacache import *
+from .fingerprint import *
+from .incidence import *
 from .tensor import *
 from .trie import *
 from .utilities import *
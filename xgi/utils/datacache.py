@@ -0,0 +1,367 @@
+"""Persistent on-disk cache of downloaded datasets.
+
+Downloads are stored by the SHA-256 hash of their content, and the networks parsed
+from them are stored next to them, so that a dataset is downloaded and parsed once
+per machine instead of once per process.  The cache directory is laid out as follows:
+
+* ``urls/<hash of the URL>.json``: the ETag and the content hash of the last response
+  for a URL,
+* ``data/<hash of the content>.json``: the downloaded content,
+* ``parsed/<hash of the content>-<hash of the key>.pickle``: the objects parsed from
+  the content, one per parsing key.
+
+Every file is written atomically, so that several processes can share the cache.
+
+"""
+
+import hashlib
+import json
+import os
+import pickle
+import shutil
+import tempfile
+
+import requests
+
+from ..exception import XGIError
+
+__all__ = ["DatasetCache", "get_dataset_cache", "set_dataset_cache"]
+
+_SUBDIRS = ["urls", "data", "parsed"]
+_default_cache = None
+
+
+class DatasetCache:
+    """Content-addressed on-disk cache of downloaded datasets.
+
+    Parameters
+    ----------
+    directory : str, optional
+        The cache directory.  By default, the ``XGI_CACHE_DIR`` environment variable,
+        or ``~/.cache/xgi`` if it is not set.
+    max_size : int or None, default: 2**30
+        The maximum total size of the cache, in bytes.  When it is exceeded, the
+        least recently used files are removed, except the one just added, which is
+        kept until the next addition even if it is larger than `max_size`.  If None,
+        the size is not limited.
+
+    Notes
+    -----
+    Before a cached download is used, it is validated with the server: the request
+    sends the stored ETag, and the cached copy is kept if the server answers that it
+    has not changed.  Servers that do not send ETags are downloaded again, but the
+    parsed networks are reused if the content hash has not changed.  If the server
+    cannot be reached, the last cached copy is used.
+
+    Parsed networks are stored with :mod:`pickle`, so only use cache directories that
+    you trust.
+
+    Examples
+    --------
+    >>> import xgi
+    >>> cache = xgi.DatasetCache("xgi-cache", max_size=2**28)
+    >>> # data = cache.request_json("https://example.com/data.json")
+
+    """
+
+    def __init__(self, directory=None, max_size=2**30):
+        if directory is None:
+            directory = os.environ.get("XGI_CACHE_DIR") or os.path.join(
+                os.path.expanduser("~"), ".cache", "xgi"
+            )
+        self.directory = directory
+        self.max_size = max_size
+
+    def fetch(self, url):
+        """Download a file into the cache, unless the cached copy is still valid.
+
+        Parameters
+        ----------
+        url : str
+            The URL of the file.
+
+        Returns
+        -------
+        str
+            The SHA-256 hash of the content, which identifies it in the cache.
+
+        Raises
+        ------
+        XGIError
+            If the connection fails with no cached copy, or if there is a bad HTTP
+            request.
+
+        """
+        meta_path = self._path("urls", _sha256(url.encode()), ".json")
+        meta = self._read_meta(meta_path)
+        data_path = meta and self._path("data", meta["sha256"], ".json")
+        cached = meta is not None and os.path.exists(data_path)
+
+        headers = {}
+        if cached and meta.get("etag"):
+            headers["If-None-Match"] = meta["etag"]
+        try:
+            r = requests.get(url, headers=headers)
+        except requests.ConnectionError:
+            if cached:
+                _touch(data_path)
+                return meta["sha256"]
+            raise XGIError("Connection Error!")
+
+        if cached and r.status_code == 304:
+            _touch(data_path)
+            return meta["sha256"]
+        if not r.ok:
+            raise XGIError(f"Error: HTTP response {r.status_code}")
+
+        content = r.content
+        digest = _sha256(content)
+        data_path = self._path("data", digest, ".json")
+        if os.path.exists(data_path):
+            _touch(data_path)
+        else:
+            self._write(data_path, content)
+        meta = {"url": url, "etag": r.headers.get("ETag"), "sha256": digest}
+        self._write(meta_path, json.dumps(meta).encode())
+        self._evict(keep=data_path)
+        return digest
+
+    def read_json(self, digest):
+        """Read cached content as JSON.
+
+        Parameters
+        ----------
+        digest : str
+            The hash of the content, as returned by :meth:`fetch`.
+
+        Returns
+        -------
+        dict
+            The JSON content.
+
+        Raises
+        ------
+        XGIError
+            If the content is not in the cache or does not match its hash.
+
+        """
+        path = self._path("data", digest, ".json")
+        try:
+            with open(path, "rb") as file:
+                content = file.read()
+        except FileNotFoundError as e:
+            raise XGIError(f"No cached content with hash {digest}.") from e
+        if _sha256(content) != digest:
+            _remove(path)
+            raise XGIError(f"The cached content with hash {digest} is corrupted.")
+        _touch(path)
+        return json.loads(content)
+
+    def request_json(self, url):
+        """HTTP request a JSON file through the cache.
+
+        Parameters
+        ----------
+        url : str
+            The URL where the JSON file is located.
+
+        Returns
+        -------
+        dict
+            A dictionary of the JSON requested.
+
+        Raises
+        ------
+        XGIError
+            If the connection fails with no cached copy, or if there is a bad HTTP
+            request.
+
+        """
+        return self.read_json(self.fetch(url))
+
+    def load(self, digest, key=""):
+        """Load an object parsed from cached content.
+
+        Parameters
+        ----------
+        digest : str
+            The hash of the content, as returned by :meth:`fetch`.
+        key : str, optional
+            The key of the object, which distinguishes different ways of parsing the
+            same content.
+
+        Returns
+        -------
+        object or None
+            The object, or None if it is not in the cache.
+
+        """
+        path = self._parsed_path(digest, key)
+        try:
+            with open(path, "rb") as file:
+                obj = pickle.load(file)
+        except FileNotFoundError:
+            return None
+        except (pickle.UnpicklingError, EOFError, AttributeError, ImportError):
+            # written by an incompatible version
+            _remove(path)
+            return None
+        _touch(path)
+        return obj
+
+    def store(self, digest, key, obj):
+        """Store an object parsed from cached content.
+
+        Parameters
+        ----------
+        digest : str
+            The hash of the content, as returned by :meth:`fetch`.
+        key : str
+            The key of the object, which distinguishes different ways of parsing the
+            same content.
+        obj : object
+            The object, which must be picklable.
+
+        """
+        data = pickle.dumps(obj, protocol=pickle.HIGHEST_PROTOCOL)
+        path = self._parsed_path(digest, key)
+        self._write(path, data)
+        self._evict(keep=path)
+
+    def size(self):
+        """The total size of the cached files, in bytes."""
+        return sum(size for _, _, size in self._files())
+
+    def clear(self):
+        """Remove all the cached files."""
+        for name in _SUBDIRS:
+            shutil.rmtree(os.path.join(self.directory, name), ignore_errors=True)
+
+    def _path(self, subdir, name, ext):
+        return os.path.join(self.directory, subdir, name + ext)
+
+    def _parsed_path(self, digest, key):
+        return self._path("parsed", f"{digest}-{_sha256(key.encode())[:16]}", ".pickle")
+
+    def _read_meta(self, path):
+        try:
+            with open(path) as file:
+                return json.load(file)
+        except (FileNotFoundError, ValueError):
+            return None
+
+    def _write(self, path, data):
+        """Write a file atomically."""
+        directory = os.path.dirname(path)
+        os.makedirs(directory, exist_ok=True)
+        fd, tmp = tempfile.mkstemp(dir=directory, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "wb") as file:
+                file.write(data)
+            os.replace(tmp, path)
+        except BaseException:
+            _remove(tmp)
+            raise
+
+    def _files(self):
+        """The cached files as (modification time, path, size) triples."""
+        for subdir in ["data", "parsed"]:
+            try:
+                entries = list(os.scandir(os.path.join(self.directory, subdir)))
+            except FileNotFoundError:
+                continue
+            for entry in entries:
+                if entry.name.endswith(".tmp"):
+                    continue
+                try:
+                    stat = entry.stat()
+                except FileNotFoundError:
+                    continue
+                yield stat.st_mtime, entry.path, stat.st_size
+
+    def _evict(self, keep=None):
+        """Remove the least recently used files until the cache fits its size.
+
+        The file `keep`, which has just been written, is never removed, so that it
+        can be read even if it is larger than the cache.
+
+        """
+        if self.max_size is None:
+            return
+        files = sorted(self._files())
+        total = sum(size for _, _, size in files)
+        for _, path, size in files:
+            if total <= self.max_size:
+                break
+            if path == keep:
+                continue
+            _remove(path)
+            total -= size
+
+
+def get_dataset_cache():
+    """The dataset cache used by the data loaders.
+
+    Returns
+    -------
+    DatasetCache
+        The cache set by :func:`set_dataset_cache`, or a cache in the default
+        directory.
+
+    See Also
+    --------
+    set_dataset_cache
+
+    """
+    global _default_cache
+    if _default_cache is None:
+        _default_cache = DatasetCache()
+    return _default_cache
+
+
+def set_dataset_cache(directory=None, max_size=2**30):
+    """Configure the dataset cache used by the data loaders.
+
+    Parameters
+    ----------
+    directory : str, optional
+        The cache directory.  By default, the ``XGI_CACHE_DIR`` environment variable,
+        or ``~/.cache/xgi`` if it is not set.
+    max_size : int or None, default: 2**30
+        The maximum total size of the cache, in bytes.  If None, the size is not
+        limited.
+
+    Returns
+    -------
+    DatasetCache
+        The new cache.
+
+    See Also
+    --------
+    get_dataset_cache
+    xgi.readwrite.xgi_data.load_xgi_data
+    xgi.readwrite.bigg_data.load_bigg_data
+
+    """
+    global _default_cache
+    _default_cache = DatasetCache(directory, max_size)
+    return _default_cache
+
+
+def _sha256(data):
+    return hashlib.sha256(data).hexdigest()
+
+
+def _touch(path):
+    """Mark a file as recently used."""
+    try:
+        os.utime(path)
+    except FileNotFoundError:
+        pass
+
+
+def _remove(path):
+    try:
+        os.remove(path)
+    except FileNotFoundError:
+        pass
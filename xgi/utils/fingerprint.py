@@ -0,0 +1,147 @@
+"""Index of the nodes or edges of a network by their bipartite neighbors.
+
+The fingerprint of an edge is the frozenset of its members, so that edges with the
+same fingerprint are duplicates of each other.  In a directed hypergraph, it is the
+pair of frozensets (tail, head).  The same applies to nodes and their memberships.
+
+"""
+
+__all__ = ["FingerprintIndex"]
+
+
+def fingerprint(neighbors):
+    """The fingerprint of an ID with the given bipartite neighbors.
+
+    Parameters
+    ----------
+    neighbors : Iterable
+        The members of an edge or the memberships of a node.
+
+    Returns
+    -------
+    frozenset
+
+    """
+    return frozenset(neighbors)
+
+
+def directed_fingerprint(neighbors):
+    """The fingerprint of an ID with the given directed bipartite neighbors.
+
+    Parameters
+    ----------
+    neighbors : dict or tuple
+        Either a dict with keys "in" and "out", as stored by
+        :class:`~xgi.core.dihypergraph.DiHypergraph`, or a pair of iterables
+        (in, out).
+
+    Returns
+    -------
+    tuple of frozensets
+
+    """
+    if isinstance(neighbors, dict):
+        neighbors = neighbors["in"], neighbors["out"]
+    tail, head = neighbors
+    return frozenset(tail), frozenset(head)
+
+
+class FingerprintIndex:
+    """Index of IDs by fingerprint, with constant time updates.
+
+    The index keeps track of the fingerprints shared by several IDs, so that the
+    duplicates can be listed in time proportional to their number.
+
+    Parameters
+    ----------
+    items : iterable of tuples, optional
+        Initial (ID, fingerprint) pairs.
+
+    Notes
+    -----
+    The IDs are numbered in the order in which they are added, and :meth:`move`
+    keeps the number of an ID, so that the order of the IDs of the index follows
+    the order of the network as long as the IDs are added in the same order.
+
+    """
+
+    __slots__ = ("_ids", "_fingerprints", "_dups", "_count")
+
+    def __init__(self, items=()):
+        self._ids = {}
+        self._fingerprints = {}
+        self._dups = set()
+        self._count = 0
+        for idx, key in items:
+            self.add(idx, key)
+
+    def __len__(self):
+        """The number of distinct fingerprints."""
+        return len(self._ids)
+
+    def __contains__(self, key):
+        return key in self._ids
+
+    def add(self, idx, key, seq=None):
+        """Add an ID with fingerprint `key`."""
+        if seq is None:
+            seq = self._count
+            self._count += 1
+        ids = self._ids.setdefault(key, {})
+        ids[idx] = seq
+        self._fingerprints[idx] = key
+        if len(ids) == 2:
+            self._dups.add(key)
+
+    def discard(self, idx):
+        """Remove an ID, if present, and return its number."""
+        key = self._fingerprints.pop(idx, None)
+        if key is None:
+            return None
+        ids = self._ids[key]
+        seq = ids.pop(idx)
+        if len(ids) == 1:
+            self._dups.discard(key)
+        elif not ids:
+            del self._ids[key]
+        return seq
+
+    def move(self, idx, key):
+        """Change the fingerprint of an ID, keeping its position in the index."""
+        self.add(idx, key, seq=self.discard(idx))
+
+    def _number(self, idx):
+        return self._ids[self._fingerprints[idx]][idx]
+
+    def get(self, key):
+        """The IDs with fingerprint `key`, in order."""
+        ids = self._ids.get(key, {})
+        return sorted(ids, key=ids.__getitem__)
+
+    def groups(self):
+        """The lists of IDs sharing a fingerprint.
+
+        Returns
+        -------
+        list of lists
+            Each list has at least two IDs, in order, and the lists are sorted by their
+            first ID.
+
+        """
+        groups = [self.get(key) for key in self._dups]
+        groups.sort(key=lambda ids: self._number(ids[0]))
+        return groups
+
+    def ordered(self, ids):
+        """The given IDs of the index, in order."""
+        return sorted(ids, key=self._number)
+
+    def duplicates(self):
+        """The IDs that share their fingerprint with a smaller (or earlier) ID."""
+        dups = []
+        for ids in self.groups():
+            try:
+                dups.extend(sorted(ids)[1:])
+            except TypeError:
+                dups.extend(ids[1:])
+        return dups
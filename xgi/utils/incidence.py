@@ -0,0 +1,506 @@
+"""Array-backed incidence storage.
+
+The incidences of a hypergraph are stored as two pairs of compressed arrays: a CSR
+structure mapping each edge to the indices of its member nodes and its transpose (CSC)
+mapping each node to the indices of the edges it belongs to.  Node and edge IDs are
+interned to contiguous integer indices following the order in which they appear in the
+hypergraph.
+
+For internal use only.  See :meth:`~xgi.core.hypergraph.Hypergraph.compact` and
+:func:`csr_incidence`.
+
+"""
+
+from collections.abc import Mapping
+
+import numpy as np
+from scipy.sparse import csr_array
+
+from ..exception import IDNotFound, XGIError, frozen
+
+__all__ = ["CSRIncidence", "CSRMembers", "csr_incidence"]
+
+
+def _index_dtype(*sizes):
+    """Smallest integer type able to index arrays of the given sizes."""
+    return np.int32 if max(sizes, default=0) < np.iinfo(np.int32).max else np.int64
+
+
+class CSRIncidence:
+    """Paired CSR/CSC arrays holding the incidences of a hypergraph.
+
+    Parameters
+    ----------
+    node_ids : list
+        The node IDs. The position of each ID is its index.
+    edge_ids : list
+        The edge IDs. The position of each ID is its index.
+    edge_ptr : numpy.ndarray
+        Array of length `len(edge_ids) + 1`.  The members of the edge with index `i`
+        are `edge_nodes[edge_ptr[i]:edge_ptr[i + 1]]`.
+    edge_nodes : numpy.ndarray
+        Node indices of each incidence, grouped by edge.
+    node_ptr : numpy.ndarray, optional
+        Array of length `len(node_ids) + 1`.  The memberships of the node with index
+        `i` are `node_edges[node_ptr[i]:node_ptr[i + 1]]`.  If None (default), it is
+        computed by transposing `edge_ptr` and `edge_nodes`.
+    node_edges : numpy.ndarray, optional
+        Edge indices of each incidence, grouped by node.  Must be specified together
+        with `node_ptr`.
+
+    Notes
+    -----
+    All the index arrays share a single integer type, which is int32 whenever the
+    number of nodes, edges and incidences allows it.  This makes it possible to wrap
+    them in `scipy.sparse` arrays without copying.
+
+    """
+
+    __slots__ = (
+        "node_ids",
+        "edge_ids",
+        "node_index",
+        "edge_index",
+        "edge_ptr",
+        "edge_nodes",
+        "node_ptr",
+        "node_edges",
+    )
+
+    def __init__(
+        self, node_ids, edge_ids, edge_ptr, edge_nodes, node_ptr=None, node_edges=None
+    ):
+        self.node_ids = list(node_ids)
+        self.edge_ids = list(edge_ids)
+        self.node_index = dict(zip(self.node_ids, range(len(self.node_ids))))
+        self.edge_index = dict(zip(self.edge_ids, range(len(self.edge_ids))))
+
+        dtype = _index_dtype(len(self.node_ids), len(self.edge_ids), len(edge_nodes))
+        self.edge_ptr = np.asarray(edge_ptr, dtype=dtype)
+        self.edge_nodes = np.asarray(edge_nodes, dtype=dtype)
+
+        if node_ptr is None or node_edges is None:
+            rows = self.edge_of_incidence()
+            order = np.argsort(self.edge_nodes, kind="stable")
+            counts = np.bincount(self.edge_nodes, minlength=len(self.node_ids))
+            node_ptr = np.zeros(len(self.node_ids) + 1, dtype=dtype)
+            np.cumsum(counts, out=node_ptr[1:])
+            node_edges = rows[order]
+        self.node_ptr = np.asarray(node_ptr, dtype=dtype)
+        self.node_edges = np.asarray(node_edges, dtype=dtype)
+
+    @classmethod
+    def from_network(cls, H):
+        """Intern the nodes and edges of a network and build its incidence arrays.
+
+        Parameters
+        ----------
+        H : Hypergraph or SimplicialComplex
+            The network of interest.
+
+        Returns
+        -------
+        CSRIncidence
+
+        """
+        node_ids = list(H._node)
+        edge_ids = list(H._edge)
+        node_index = dict(zip(node_ids, range(len(node_ids))))
+
+        sizes = np.fromiter(map(len, H._edge.values()), dtype=np.int64)
+        nnz = int(sizes.sum())
+        dtype = _index_dtype(len(node_ids), len(edge_ids), nnz)
+
+        edge_nodes = np.fromiter(
+            (node_index[n] for members in H._edge.values() for n in members),
+            dtype=dtype,
+            count=nnz,
+        )
+        edge_ptr = np.zeros(len(edge_ids) + 1, dtype=dtype)
+        np.cumsum(sizes, out=edge_ptr[1:])
+
+        # sort the members of each edge so that the layout is canonical
+        rows = np.repeat(np.arange(len(edge_ids), dtype=dtype), sizes)
+        edge_nodes = edge_nodes[np.lexsort((edge_nodes, rows))]
+
+        return cls(node_ids, edge_ids, edge_ptr, edge_nodes)
+
+    @property
+    def num_nodes(self):
+        """The number of nodes."""
+        return len(self.node_ids)
+
+    @property
+    def num_edges(self):
+        """The number of edges."""
+        return len(self.edge_ids)
+
+    @property
+    def nnz(self):
+        """The number of incidences."""
+        return len(self.edge_nodes)
+
+    def edge_sizes(self):
+        """The number of members of each edge, in index order."""
+        return np.diff(self.edge_ptr)
+
+    def node_degrees(self):
+        """The number of memberships of each node, in index order."""
+        return np.diff(self.node_ptr)
+
+    def edge_of_incidence(self):
+        """The edge index of each entry of `edge_nodes`."""
+        return np.repeat(
+            np.arange(self.num_edges, dtype=self.edge_ptr.dtype), self.edge_sizes()
+        )
+
+    def node_of_incidence(self):
+        """The node index of each entry of `node_edges`."""
+        return np.repeat(
+            np.arange(self.num_nodes, dtype=self.node_ptr.dtype), self.node_degrees()
+        )
+
+    def induced_edges(self, nodes):
+        """The edges whose members all belong to a set of nodes.
+
+        Only the memberships of the given nodes are read, so that the cost does not
+        depend on the size of the whole network.
+
+        Parameters
+        ----------
+        nodes : numpy.ndarray of int
+            Distinct indices of the nodes.
+
+        Returns
+        -------
+        numpy.ndarray
+            The sorted indices of the edges.
+
+        """
+        # an edge is induced if all its members list it among their memberships
+        edges, counts = np.unique(
+            _gather(self.node_ptr, self.node_edges, nodes), return_counts=True
+        )
+        return edges[counts == self.edge_ptr[edges + 1] - self.edge_ptr[edges]]
+
+    def incident_nodes(self, edges):
+        """The nodes that belong to at least one of a set of edges.
+
+        Parameters
+        ----------
+        edges : numpy.ndarray of int
+            Indices of the edges.
+
+        Returns
+        -------
+        numpy.ndarray
+            The sorted indices of the nodes.
+
+        """
+        return np.unique(_gather(self.edge_ptr, self.edge_nodes, edges))
+
+    def bfs(self, sources, cutoff=None):
+        """Level-synchronous breadth-first search from a set of nodes.
+
+        Each level expands the whole frontier at once, first to the edges of the
+        frontier nodes and then to the members of those edges.  Every edge is expanded
+        at most once, so a full search costs O(nnz).
+
+        Parameters
+        ----------
+        sources : int or array-like of int
+            Indices of the nodes from which to start the search.
+        cutoff : int, optional
+            Depth at which to stop the search.  If None (default), the search continues
+            until all the reachable nodes are found.
+
+        Returns
+        -------
+        numpy.ndarray
+            The distance of each node to the closest source, -1 if it is not reachable
+            within `cutoff` steps.
+
+        """
+        return _bfs(
+            self.node_ptr,
+            self.node_edges,
+            self.edge_ptr,
+            self.edge_nodes,
+            sources,
+            cutoff,
+        )
+
+    def tocsr(self, dtype=int):
+        """The incidence matrix with nodes as rows and edges as columns.
+
+        The index arrays of the returned matrix are shared with this object, only
+        the array of ones is allocated.
+
+        Parameters
+        ----------
+        dtype : data-type, optional
+            The type of the entries, by default int.
+
+        Returns
+        -------
+        scipy.sparse.csr_array
+
+        """
+        data = np.ones(self.nnz, dtype=dtype)
+        return csr_array(
+            (data, self.node_edges, self.node_ptr),
+            shape=(self.num_nodes, self.num_edges),
+            copy=False,
+        )
+
+    def overlaps(self, kind="node", s=1, edges=None):
+        """The number of shared neighbors of all the pairs of nodes or edges.
+
+        The counts are the entries of the product of the incidence matrix with its
+        transpose, which is computed once for all the pairs.  The nodes (or edges)
+        with fewer than `s` incidences are left out of the product, since they cannot
+        overlap with anything in `s` IDs.
+
+        Parameters
+        ----------
+        kind : {"node", "edge"}, optional
+            Whether to count the edges shared by two nodes (default) or the nodes
+            shared by two edges.
+        s : int, optional
+            Only the pairs sharing at least `s` neighbors are kept.  By default, 1.
+        edges : array-like of int, optional
+            Indices of the edges to take into account.  If None (default), all the
+            edges are used.  When `kind` is "edge", the matrix is still indexed by
+            all the edges, the other ones having no overlaps.
+
+        Returns
+        -------
+        scipy.sparse.csr_array
+            The symmetric matrix whose entry (i, j) is the number of neighbors shared
+            by i and j, if it is at least `s`.  The diagonal is zero and there are no
+            explicit zeros.
+
+        """
+        I = self.tocsr()
+        if edges is not None:
+            mask = np.zeros(self.num_edges, dtype=bool)
+            mask[np.asarray(edges, dtype=np.int64)] = True
+            I = csr_array(
+                (mask[self.node_edges].astype(int), self.node_edges, self.node_ptr),
+                shape=I.shape,
+                copy=True,
+            )
+            I.eliminate_zeros()
+        if kind == "edge":
+            I = I.T.tocsr()
+        elif kind != "node":
+            raise ValueError(f"Unrecognized kind {kind}, must be 'node' or 'edge'.")
+
+        n = I.shape[0]
+        keep = np.flatnonzero(np.diff(I.indptr) >= max(s, 1))
+        M = I[keep]
+        A = (M @ M.T).tocsr()
+
+        # drop the diagonal and the pairs with fewer than s overlaps
+        rows = np.repeat(np.arange(A.shape[0]), np.diff(A.indptr))
+        valid = (A.indices != rows) & (A.data >= s)
+        rows, cols = keep[rows[valid]], keep[A.indices[valid]]
+        return csr_array((A.data[valid], (rows, cols)), shape=(n, n))
+
+    def setflags(self, write):
+        """Set the writeable flag of all the index arrays."""
+        for arr in (self.edge_ptr, self.edge_nodes, self.node_ptr, self.node_edges):
+            arr.setflags(write=write)
+
+
+def _gather(ptr, indices, rows):
+    """Concatenation of `indices[ptr[i]:ptr[i + 1]]` for each `i` in `rows`."""
+    starts = ptr[rows]
+    lengths = ptr[rows + 1] - starts
+    offsets = np.repeat(starts - np.cumsum(lengths) + lengths, lengths)
+    return indices[offsets + np.arange(len(offsets))]
+
+
+def _bfs(node_ptr, node_edges, edge_ptr, edge_nodes, sources, cutoff=None):
+    """Implementation of :meth:`CSRIncidence.bfs` on the bare index arrays."""
+    dist = np.full(len(node_ptr) - 1, -1, dtype=np.int64)
+    frontier = np.unique(np.asarray(sources, dtype=np.int64))
+    dist[frontier] = 0
+    expanded = np.zeros(len(edge_ptr) - 1, dtype=bool)
+
+    level = 0
+    while frontier.size and (cutoff is None or level < cutoff):
+        level += 1
+        edges = _gather(node_ptr, node_edges, frontier)
+        edges = np.unique(edges[~expanded[edges]])
+        expanded[edges] = True
+
+        nodes = _gather(edge_ptr, edge_nodes, edges)
+        frontier = np.unique(nodes[dist[nodes] < 0])
+        dist[frontier] = level
+    return dist
+
+
+class CSRMembers(Mapping):
+    """Read-only mapping from IDs to the set of their bipartite neighbors.
+
+    Exposes one side of a :class:`CSRIncidence` with the same interface as the
+    dicts of sets that networks use to store their nodes and edges.
+
+    Parameters
+    ----------
+    incidence : CSRIncidence
+        The underlying incidence arrays.
+    kind : {"node", "edge"}
+        Whether the keys of the mapping are node IDs or edge IDs.
+
+    """
+
+    __slots__ = ("incidence", "kind", "_ids", "_index", "_ptr", "_indices", "_other")
+
+    def __init__(self, incidence, kind):
+        self.incidence = incidence
+        self.kind = kind
+        if kind == "node":
+            self._ids = incidence.node_ids
+            self._index = incidence.node_index
+            self._ptr = incidence.node_ptr
+            self._indices = incidence.node_edges
+            self._other = incidence.edge_ids
+        elif kind == "edge":
+            self._ids = incidence.edge_ids
+            self._index = incidence.edge_index
+            self._ptr = incidence.edge_ptr
+            self._indices = incidence.edge_nodes
+            self._other = incidence.node_ids
+        else:
+            raise ValueError(f"Unrecognized kind {kind}")
+
+    def __getstate__(self):
+        return {"incidence": self.incidence, "kind": self.kind}
+
+    def __setstate__(self, state):
+        self.__init__(state["incidence"], state["kind"])
+
+    def __getitem__(self, idx):
+        try:
+            i = self._index[idx]
+        except KeyError as e:
+            raise IDNotFound(f"ID {idx} not found") from e
+        other = self._other
+        members = self._indices[self._ptr[i] : self._ptr[i + 1]].tolist()
+        return {other[j] for j in members}
+
+    def __contains__(self, idx):
+        return idx in self._index
+
+    def __iter__(self):
+        return iter(self._ids)
+
+    def __len__(self):
+        return len(self._ids)
+
+    def __repr__(self):
+        return f"{self.__class__.__name__}({self.kind}, {len(self)} ids)"
+
+    __setitem__ = frozen
+    __delitem__ = frozen
+
+
+class _SubsetView(Mapping):
+    """Read-only restriction of a mapping of a network to a subset of IDs.
+
+    Parameters
+    ----------
+    mapping : Mapping
+        The memberships or attributes of the network, keyed by ID.
+    ids : dict
+        The IDs to keep, as keys, in order.
+    net : Hypergraph
+        The network of `mapping`.  The view raises an error once it is modified.
+    other : dict, optional
+        If given, the values of `mapping` are sets of bipartite neighbors, which are
+        restricted to the keys of `other`.
+
+    """
+
+    __slots__ = ("_mapping", "_ids", "_net", "_version", "_other")
+
+    def __init__(self, mapping, ids, net, other=None):
+        self._mapping = mapping
+        self._ids = ids
+        self._net = net
+        self._version = net._version
+        self._other = other
+
+    def _check(self):
+        if self._net._version != self._version:
+            raise XGIError(
+                "The network was modified after the view was created. "
+                "Create a new view."
+            )
+
+    def __getitem__(self, idx):
+        self._check()
+        if idx not in self._ids:
+            raise IDNotFound(f"ID {idx} not found")
+        value = self._mapping[idx]
+        if self._other is None:
+            return value
+        other = self._other
+        return {i for i in value if i in other}
+
+    def __contains__(self, idx):
+        self._check()
+        return idx in self._ids
+
+    def __iter__(self):
+        self._check()
+        return iter(self._ids)
+
+    def __len__(self):
+        self._check()
+        return len(self._ids)
+
+    def __repr__(self):
+        return f"{self.__class__.__name__}({len(self._ids)} ids)"
+
+    __setitem__ = frozen
+    __delitem__ = frozen
+
+
+def csr_incidence(net):
+    """The incidence arrays of a network, memoized until the network is modified.
+
+    Parameters
+    ----------
+    net : Hypergraph or SimplicialComplex
+        The network of interest.
+
+    Returns
+    -------
+    CSRIncidence
+        The incidence arrays, which must not be modified.  The node and edge indices
+        follow the order of `net.nodes` and `net.edges`.
+
+    Notes
+    -----
+    Compact networks return their own storage, and the arrays of the views of
+    :func:`~xgi.core.globalviews.subhypergraph` are built on each call.  Otherwise, the
+    arrays are built once and reused until the mutation counter of the network changes.
+
+    """
+    if isinstance(net._edge, CSRMembers):
+        return net._edge.incidence
+    if isinstance(net._edge, _SubsetView):
+        # not memoized, since the version of a view does not follow its network
+        return CSRIncidence.from_network(net)
+
+    cached = getattr(net, "_incidence", None)
+    if cached is not None and cached[0] == net._version:
+        return cached[1]
+
+    incidence = CSRIncidence.from_network(net)
+    incidence.setflags(write=False)
+    net._incidence = (net._version, incidence)
+    return incidence
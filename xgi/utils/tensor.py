@@ -85,6 +85,8 @@ def ttsv1(node_dict, edge_dict, r, a):
     """Computes the tensor times same vector in all modes but 1.
 
     This method uses generating functions as described in the corresponding reference.
+    The edges are grouped by size and the contributions of all the (node, edge) pairs
+    of a group are evaluated at once with array operations.
 
     Parameters
     ----------
@@ -114,38 +116,21 @@ def ttsv1(node_dict, edge_dict, r, a):
     Sinan Aksoy, Ilya Amburg, Stephen Young,
     https://doi.org/10.1137/23M1584472
     """
-    n = len(node_dict)
-    s = np.zeros(n)
-    r_minus_1_factorial = math.factorial(r - 1)
-    for node, edges in node_dict.items():
-        c = 0
-        for e in edges:
-            l = len(edge_dict[e])
-            alpha = banerjee_coeff(l, r)
-            edge_without_node = [v for v in edge_dict[e] if v != node]
-            if l == r:
-                gen_fun_coef = np.prod(a[edge_without_node])
-            elif 2 ** (l - 1) < r * (l - 1):
-                gen_fun_coef = _get_gen_coef_subset_expansion(
-                    a[edge_without_node], a[node], r - 1
-                )
-            else:
-                gen_fun_coef = _get_gen_coef_fft_fast_array(
-                    edge_without_node, a, node, l, r
-                )
-            c += r_minus_1_factorial * l * gen_fun_coef / alpha
-        s[node] = c
-    return s
+    return _ttsv1(_edges_by_size(*_members_arrays(edge_dict)), len(node_dict), r, a)
 
 
 def ttsv2(pair_dict, edge_dict, r, a, n):
     """Computes the tensor times same vector in all modes but 2.
 
+    The edges are grouped by size and the contributions of all the (pair, edge)
+    triples of a group are evaluated at once with array operations.
+
     Parameters
     ----------
     pair_dict : dict
         A dictionary with node pairs as keys and hyperedges they appear in
-        as values.
+        as values.  The pairs are determined by `edge_dict`, so this argument
+        is not used and is only kept for compatibility.
     edge_dict : dict
         A dictionary with edges as keys and nodes which are members as
         values.
@@ -172,164 +157,146 @@ def ttsv2(pair_dict, edge_dict, r, a, n):
     Sinan Aksoy, Ilya Amburg, Stephen Young,
     https://doi.org/10.1137/23M1584472
     """
-    from scipy.signal import convolve
-    from scipy.sparse import coo_array
-
-    s = {}
-    r_minus_2_factorial = math.factorial(r - 2)
-    for (v1, v2), edges in pair_dict.items():
-        c = 0
-        for e in edges:
-            l = len(edge_dict[e])
-            alpha = banerjee_coeff(l, r)
-            edge_without_node = [v for v in edge_dict[e] if v != v1 and v != v2]
-            if v1 != v2:
-                if 2 ** (l - 2) < (r - 2) * (l - 2):
-                    gen_fun_coef = _get_gen_coef_subset_expansion(
-                        a[edge_without_node], a[v1] + a[v2], r - 2
-                    )
-                else:
-                    coefs = [1]
-                    for i in range(1, r - 1):
-                        coefs.append(coefs[-1] * (a[v1] + a[v2]) / i)
-                    coefs = np.array(coefs)
-                    for u in edge_dict[e]:
-                        if u != v1 and u != v2:
-                            _coefs = [1]
-                            for i in range(1, r - l + 2):
-                                _coefs.append(_coefs[-1] * a[u] / i)
-                            _coefs = np.array(_coefs)
-                            _coefs[0] = 0
-                            coefs = convolve(coefs, _coefs)[0 : r - 1]
-                    gen_fun_coef = coefs[-1]
-            else:
-                if 2 ** (l - 1) < (r - 2) * (l - 1):
-                    gen_fun_coef = _get_gen_coef_subset_expansion(
-                        a[edge_without_node], a[v1], r - 2
-                    )
-                else:
-                    coefs = [1]
-                    for i in range(1, r - 1):
-                        coefs.append(coefs[-1] * (a[v1]) / i)
-                    coefs = np.array(coefs)
-                    for u in edge_dict[e]:
-                        if u != v1 and u != v2:
-                            _coefs = [1]
-                            for i in range(1, r - l + 1):
-                                _coefs.append(_coefs[-1] * a[v1] / i)
-                            _coefs = np.array(_coefs)
-                            _coefs[0] = 0
-                            coefs = convolve(coefs, _coefs)[0 : r - 1]
-                    gen_fun_coef = coefs[-1]
-            c += r_minus_2_factorial * l * gen_fun_coef / alpha
-        s[(v1, v2)] = c
-        if v1 == v2:
-            s[(v1, v2)] /= 2
-    first = np.zeros(len(s))
-    second = np.zeros(len(s))
-    value = np.zeros(len(s))
-    for i, k in enumerate(s.keys()):
-        first[i] = k[0]
-        second[i] = k[1]
-        value[i] = s[k]
-    Y = coo_array((value, (first, second)), (n, n))
-    return Y + Y.T
+    return _ttsv2(_edges_by_size(*_members_arrays(edge_dict)), n, r, a)
 
 
 ## Helper functions for the tensor methods.
 
 
-def _get_gen_coef_subset_expansion(edge_values, node_value, r):
-    """Computes the generating funciton coefficient of order r using subset expansion.
+def _members_arrays(edge_dict):
+    """Flatten the members of the edges to the arrays (ptr, nodes) of a CSR layout."""
+    sizes = np.fromiter(map(len, edge_dict.values()), dtype=np.int64)
+    ptr = np.zeros(len(sizes) + 1, dtype=np.int64)
+    np.cumsum(sizes, out=ptr[1:])
+    nodes = np.fromiter(
+        (n for edge in edge_dict.values() for n in edge), dtype=np.int64, count=ptr[-1]
+    )
+    return ptr, nodes
+
+
+def _edges_by_size(edge_ptr, edge_nodes):
+    """Group the members of the edges by edge size.
 
     Parameters
     ----------
-    edge_values : NumPy array
-        Array of values from the `a` vector corresponding to
-        nodes in the hyperedge.
-    node_value : float
-        The value in a corresponding to the node being processed.
-    r : int
-        Desired order to get coefficient for.
+    edge_ptr, edge_nodes : NumPy arrays
+        The members of edge i are `edge_nodes[edge_ptr[i] : edge_ptr[i + 1]]`, as
+        integer node indices.
 
     Returns
     -------
-    float
-        Generating function coefficient of order r.
+    dict
+        The keys are the (non-zero) edge sizes l and the values are arrays of
+        shape (number of edges of size l, l) with the members of these edges.
+    """
+    sizes = np.diff(edge_ptr)
+    groups = {}
+    for l in np.unique(sizes[sizes > 0]).tolist():
+        starts = edge_ptr[:-1][sizes == l]
+        groups[l] = edge_nodes[starts[:, None] + np.arange(l)]
+    return groups
 
-    See Also
-    --------
-    _get_gen_coef_fft_fast_array
 
-    References
-    ----------
-    Scalable Tensor Methods for Nonuniform Hypergraphs,
-    Sinan Aksoy, Ilya Amburg, Stephen Young,
-    https://doi.org/10.1137/23M1584472
-    """
-    k = len(edge_values)
-    subset_vector = [0]
-    subset_lengths = [0]
-    for i in range(k):
-        for t in range(len(subset_vector)):
-            subset_vector.append(subset_vector[t] + edge_values[i])
-            subset_lengths.append(subset_lengths[t] + 1)
-    for i in range(len(subset_lengths)):
-        subset_lengths[i] = (-1) ** (k - subset_lengths[i])
-    total = sum(
-        [
-            (node_value + subset_vector[i]) ** r * subset_lengths[i]
-            for i in range(len(subset_lengths))
-        ]
-    )
-    return total / math.factorial(r)
+def _exp_coefs(x, deg):
+    """Taylor coefficients of exp(x t) up to degree `deg`, along a new last axis."""
+    coefs = np.empty(np.shape(x) + (deg + 1,))
+    coefs[..., 0] = 1
+    for k in range(1, deg + 1):
+        coefs[..., k] = coefs[..., k - 1] * x / k
+    return coefs
 
 
-def _get_gen_coef_fft_fast_array(edge_without_node, a, node, l, r):
-    """Computes the generating funciton coefficient of order r using the Fast Fourier Transform.
+def _polymul(p, q):
+    """Product of the power series p and q, truncated to their (common) length."""
+    deg = p.shape[-1] - 1
+    out = np.zeros(np.broadcast_shapes(p.shape, q.shape))
+    for j in range(deg + 1):
+        out[..., j:] += p[..., j : j + 1] * q[..., : deg + 1 - j]
+    return out
 
-    Parameters
-    ----------
-    edge_without_node : list
-        Array of node indices corresponding to
-        all nodes in the hyperedge but the one being processed.
-    a : NumPy array
-        The vector to multiply the tensor by.
-    node : int
-        The index of the node being processed.
-    l : int
-        Number of nodes in the hyperedge.
-    r : int
-        Desired order to get coefficient for.
 
-    Returns
-    -------
-    float
-        Generating function coefficient of order r.
+def _prefix_suffix(F):
+    """Products of the series F[:, :i] and F[:, i + 1 :] for every position i.
 
-    See Also
-    --------
-    _get_gen_coef_subset_expansion
+    `F` has shape (edges, positions, degree + 1) and the products are over the
+    positions, so that `prefix[:, i] * suffix[:, i]` leaves position i out.
+    """
+    m, l, _ = F.shape
+    prefix = np.empty_like(F)
+    suffix = np.empty_like(F)
+    prefix[:, 0] = suffix[:, l - 1] = 0
+    prefix[:, 0, 0] = suffix[:, l - 1, 0] = 1
+    for i in range(1, l):
+        prefix[:, i] = _polymul(prefix[:, i - 1], F[:, i - 1])
+        suffix[:, l - 1 - i] = _polymul(suffix[:, l - i], F[:, l - i])
+    return prefix, suffix
+
+
+def _ttsv1(groups, n, r, a):
+    """Tensor times same vector in all modes but 1, for edges grouped by size.
+
+    The contribution of an edge e of size l to node v is proportional to the
+    coefficient of order r - 1 of the generating function
+    exp(a_v t) prod_{u in e, u != v} (exp(a_u t) - 1), which is evaluated for all
+    the (node, edge) pairs of a group at once.
+    """
+    deg = r - 1
+    scale = math.factorial(deg)
+    s = np.zeros(n)
+    for l, members in groups.items():
+        X = _exp_coefs(a[members], deg)
+        F = X.copy()
+        F[..., 0] = 0
+        prefix, suffix = _prefix_suffix(F)
+        # only the coefficient of order deg of the product with exp(a_v t) is needed
+        G = np.einsum("mik,mik->mi", _polymul(prefix, suffix), X[..., ::-1])
+        coef = scale * l / banerjee_coeff(l, r)
+        s += np.bincount(members.ravel(), weights=coef * G.ravel(), minlength=n)
+    return s
 
-    References
-    ----------
-    Scalable Tensor Methods for Nonuniform Hypergraphs,
-    Sinan Aksoy, Ilya Amburg, Stephen Young,
-    https://doi.org/10.1137/23M1584472
+
+def _ttsv2(groups, n, r, a):
+    """Tensor times same vector in all modes but 2, for edges grouped by size.
+
+    The contribution of an edge e of size l to the pair (v, w) is proportional to
+    the coefficient of order r - 2 of exp((a_v + a_w) t) prod (exp(a_u t) - 1),
+    where the product is over the other members u of e, and
+    exp(a_v t) prod_{u in e, u != v} (exp(a_u t) - 1) when v = w.
     """
-    from scipy.signal import convolve
-
-    coefs = [1]
-    for i in range(1, r):
-        coefs.append(coefs[-1] * a[node] / i)
-    coefs = np.array(coefs)
-    for u in edge_without_node:
-        _coefs = [1]
-        for i in range(1, r - l + 2):
-            _coefs.append(_coefs[-1] * a[u] / i)
-        _coefs = np.array(_coefs)
-        _coefs[0] = 0
-        coefs = convolve(coefs, _coefs)[0:r]
-    gen_fun_coef = coefs[-1]
-
-    return gen_fun_coef
+    from scipy.sparse import coo_array
+
+    deg = r - 2
+    scale = math.factorial(deg)
+    rows, cols, values = [], [], []
+    for l, members in groups.items():
+        coef = scale * l / banerjee_coeff(l, r)
+        A = a[members]
+        X = _exp_coefs(A, deg)
+        F = X.copy()
+        F[..., 0] = 0
+        prefix, suffix = _prefix_suffix(F)
+
+        # the diagonal vanishes unless the other l - 1 members fit in deg slots
+        if l - 1 <= deg:
+            G = np.einsum("mik,mik->mi", _polymul(prefix, suffix), X[..., ::-1])
+            rows.append(members.ravel())
+            cols.append(members.ravel())
+            values.append(coef * G.ravel())
+
+        for j in range(l - 1):
+            # product of the series of the positions before j and between j and k
+            inner = prefix[:, j]
+            for k in range(j + 1, l):
+                others = _polymul(inner, suffix[:, k])
+                pair = _exp_coefs(A[:, j] + A[:, k], deg)
+                G = coef * np.einsum("mk,mk->m", others, pair[:, ::-1])
+                rows += [members[:, j], members[:, k]]
+                cols += [members[:, k], members[:, j]]
+                values += [G, G]
+                inner = _polymul(inner, F[:, k])
+    if not values:
+        return coo_array((n, n)).tocsr()
+    Y = coo_array(
+        (np.concatenate(values), (np.concatenate(rows), np.concatenate(cols))), (n, n)
+    )
+    return Y.tocsr()
@@ -1,5 +1,6 @@
 """General utilities."""
 
+import os
 import random
 from collections import defaultdict
 from copy import deepcopy
@@ -600,3 +601,14 @@ def crest_r():
         (0.6468274, 0.80289262, 0.56592265),
     ]
     return LinearSegmentedColormap.from_list("crest_r", palette)
+
+
+def _num_workers(n_jobs):
+    """Number of processes corresponding to the `n_jobs` argument."""
+    if n_jobs is None:
+        return 1
+    if n_jobs == -1:
+        return os.cpu_count() or 1
+    if n_jobs < 1:
+        raise XGIError("n_jobs must be a positive integer, -1, or None")
+    return n_jobs